@@ -11,6 +11,7 @@ https://docs.djangoproject.com/en/5.2/ref/settings/
 """
 
 import os
+import sys
 from pathlib import Path
 from dotenv import load_dotenv
 
@@ -125,6 +126,10 @@ USE_I18N = True
 
 USE_TZ = True
 
+# [I18N] Last-resort locale for tenant site content when neither the requested
+# locale, its base language nor the project's primary locale has a page.
+SITES_FALLBACK_LOCALE = 'en'
+
 
 # Static files (CSS, JavaScript, Images)
 # https://docs.djangoproject.com/en/5.2/howto/static-files/
@@ -253,3 +258,133 @@ SIMPLE_JWT = {
 
 # OpenAI Configuration
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY", "")
+
+# [AI-PROVIDER] Shared AI client (sites/ai.py). The provider is a dotted
+# path; "sites.ai.FakeProvider" answers locally for tests and benchmarks.
+# TIMEOUT is per attempt; 429/5xx responses are retried MAX_RETRIES times
+# with exponential backoff from BACKOFF seconds (capped at MAX_BACKOFF).
+# At most MAX_CONCURRENCY calls run at once per process; others wait up to
+# QUEUE_TIMEOUT seconds for a slot.
+SITES_AI_PROVIDER = os.getenv("SITES_AI_PROVIDER", "sites.ai.OpenAIProvider")
+SITES_AI_PROVIDER_OPTIONS = {}
+SITES_AI_TIMEOUT = float(os.getenv("SITES_AI_TIMEOUT", 30))
+SITES_AI_MAX_RETRIES = int(os.getenv("SITES_AI_MAX_RETRIES", 3))
+SITES_AI_BACKOFF = float(os.getenv("SITES_AI_BACKOFF", 0.5))
+SITES_AI_MAX_BACKOFF = float(os.getenv("SITES_AI_MAX_BACKOFF", 8))
+SITES_AI_MAX_CONCURRENCY = int(os.getenv("SITES_AI_MAX_CONCURRENCY", 4))
+SITES_AI_QUEUE_TIMEOUT = float(os.getenv("SITES_AI_QUEUE_TIMEOUT", 10))
+
+# [CACHE] Cache backend and public site payload caching
+# The default cache must be shared by all processes: it holds the
+# single-flight rebuild locks, the public payloads and the route table
+# tokens. Without REDIS_URL it is a database table (created by migration
+# 0050 or `python manage.py createcachetable`). A per-process cache
+# (LocMemCache) would allow one rebuild per process instead of one per
+# project and would miss invalidations made by other processes.
+REDIS_URL = os.getenv("REDIS_URL", "")
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.redis.RedisCache",
+        "LOCATION": REDIS_URL,
+    } if REDIS_URL else {
+        "BACKEND": "django.core.cache.backends.db.DatabaseCache",
+        "LOCATION": "jcw_cache",
+    },
+    # [AI-SUGGEST] Section AI suggestion answers, shared like the default
+    # cache (their coalescing locks live in the default cache). Entries
+    # expire TIMEOUT seconds after their last use. Past MAX_ENTRIES the
+    # database table evicts the least recently used ones
+    # (sites.cache_backends.LRUDatabaseCache); with Redis, eviction is the
+    # server's job: set `maxmemory-policy allkeys-lru`.
+    "ai": {
+        "BACKEND": "django.core.cache.backends.redis.RedisCache",
+        "LOCATION": REDIS_URL,
+        "KEY_PREFIX": "ai",
+        "TIMEOUT": int(os.getenv("SITES_AI_SUGGEST_CACHE_TIMEOUT", 60 * 60)),
+    } if REDIS_URL else {
+        "BACKEND": "sites.cache_backends.LRUDatabaseCache",
+        "LOCATION": "jcw_ai_cache",
+        "TIMEOUT": int(os.getenv("SITES_AI_SUGGEST_CACHE_TIMEOUT", 60 * 60)),
+        "OPTIONS": {"MAX_ENTRIES": int(os.getenv("SITES_AI_SUGGEST_CACHE_MAX_ENTRIES", 1000))},
+    },
+}
+
+# [AI-SUGGEST] Cache alias and TTL for section AI suggestions. Identical
+# requests wait up to LOCK_WAIT seconds for a call already in flight, which
+# is also the time budget of that call (retries included).
+SITES_AI_SUGGEST_CACHE = "ai"
+SITES_AI_SUGGEST_LOCK_CACHE = "default"
+SITES_AI_SUGGEST_CACHE_TIMEOUT = CACHES["ai"]["TIMEOUT"]
+SITES_AI_SUGGEST_LOCK_WAIT = float(os.getenv("SITES_AI_SUGGEST_LOCK_WAIT", 30))
+
+# Hard TTL: seconds a serialized public site payload may stay in the cache.
+# Entries are also marked stale as soon as the project's content changes.
+PUBLIC_SITE_CACHE_TIMEOUT = int(os.getenv("PUBLIC_SITE_CACHE_TIMEOUT", 60 * 60))
+
+# Soft TTL: after this many seconds an entry is rebuilt by one worker while
+# the others keep serving the stale copy (stale-while-revalidate).
+PUBLIC_SITE_CACHE_SOFT_TIMEOUT = int(os.getenv("PUBLIC_SITE_CACHE_SOFT_TIMEOUT", 5 * 60))
+
+# Single-flight rebuild lock: how long a rebuild may hold the lock, and how
+# long requests without any cached copy wait for it before building locally.
+PUBLIC_SITE_CACHE_LOCK_TIMEOUT = int(os.getenv("PUBLIC_SITE_CACHE_LOCK_TIMEOUT", 30))
+PUBLIC_SITE_CACHE_LOCK_WAIT = float(os.getenv("PUBLIC_SITE_CACHE_LOCK_WAIT", 2))
+
+# [ROUTES] Seconds a compiled in-memory route table may be served before it is
+# recompiled, even without an invalidation signal (covers per-process caches).
+SITES_ROUTE_TABLE_MAX_AGE = int(os.getenv("SITES_ROUTE_TABLE_MAX_AGE", 5 * 60))
+# Seconds between checks of the shared invalidation token; changes made by
+# other processes reach this one's route tables within this interval.
+SITES_ROUTE_TABLE_CHECK_INTERVAL = float(os.getenv("SITES_ROUTE_TABLE_CHECK_INTERVAL", 2))
+
+# [JOBS] Background job worker (python manage.py run_jobs). Concurrency is the
+# number of worker threads. A running job's lock is refreshed every
+# HEARTBEAT_INTERVAL seconds (keep it well below STALE_TIMEOUT); jobs without
+# a heartbeat for the stale timeout (crashed worker) are put back in the
+# queue by a sweep every worker runs each STALE_SWEEP_INTERVAL seconds.
+SITES_JOB_WORKER_CONCURRENCY = int(os.getenv("SITES_JOB_WORKER_CONCURRENCY", 2))
+SITES_JOB_POLL_INTERVAL = float(os.getenv("SITES_JOB_POLL_INTERVAL", 2))
+SITES_JOB_STALE_TIMEOUT = int(os.getenv("SITES_JOB_STALE_TIMEOUT", 30 * 60))
+SITES_JOB_STALE_SWEEP_INTERVAL = float(os.getenv("SITES_JOB_STALE_SWEEP_INTERVAL", 60))
+SITES_JOB_HEARTBEAT_INTERVAL = float(os.getenv("SITES_JOB_HEARTBEAT_INTERVAL", 60))
+SITES_JOB_RETRY_DELAY = int(os.getenv("SITES_JOB_RETRY_DELAY", 30))
+
+# [PURGE] Deleted projects are hidden at once and purged by a background job
+# in transactions of at most this many rows. Unreferenced screenshot files
+# older than the grace period (seconds) are removed by purge_deleted_projects.
+SITES_PURGE_CHUNK_SIZE = int(os.getenv("SITES_PURGE_CHUNK_SIZE", 500))
+SITES_ORPHAN_MEDIA_GRACE = int(os.getenv("SITES_ORPHAN_MEDIA_GRACE", 24 * 60 * 60))
+
+# [AI-DRAFTS] Screenshot drafts are analyzed by the job worker. An attempt
+# running longer than the timeout (seconds) counts as stuck and is retried
+# until the attempts are used up. Clients poll the draft detail endpoint;
+# the optional event stream holds a worker thread while open, so it closes
+# after EVENTS_TIMEOUT seconds (keep it short unless served by ASGI).
+SITES_DRAFT_PROCESSING_TIMEOUT = int(os.getenv("SITES_DRAFT_PROCESSING_TIMEOUT", 180))
+SITES_DRAFT_MAX_ATTEMPTS = int(os.getenv("SITES_DRAFT_MAX_ATTEMPTS", 2))
+SITES_DRAFT_EVENTS_TIMEOUT = int(os.getenv("SITES_DRAFT_EVENTS_TIMEOUT", 5))
+
+# [IMAGES] Screenshots are normalized before the vision call: scaled to at
+# most MAX_DIMENSION pixels wide, cut into overlapping tiles of at most that
+# height (tall full-page captures) and re-encoded without metadata.
+SITES_DRAFT_IMAGE_MAX_DIMENSION = int(os.getenv("SITES_DRAFT_IMAGE_MAX_DIMENSION", 1568))
+SITES_DRAFT_IMAGE_FORMAT = os.getenv("SITES_DRAFT_IMAGE_FORMAT", "JPEG")
+SITES_DRAFT_IMAGE_QUALITY = int(os.getenv("SITES_DRAFT_IMAGE_QUALITY", 80))
+SITES_DRAFT_IMAGE_MAX_TILES = int(os.getenv("SITES_DRAFT_IMAGE_MAX_TILES", 6))
+SITES_DRAFT_IMAGE_TILE_OVERLAP = int(os.getenv("SITES_DRAFT_IMAGE_TILE_OVERLAP", 128))
+
+# [AI-CACHE] Seconds a screenshot analysis is reused for re-uploads of the
+# same image (same locale and prompt version). 0 disables the cache.
+SITES_DRAFT_ANALYSIS_CACHE_TTL = int(os.getenv("SITES_DRAFT_ANALYSIS_CACHE_TTL", 30 * 24 * 60 * 60))
+
+# Tests (python manage.py test) build their database straight from the
+# models: the sites/main_site migrations lag behind the models (e.g.
+# SiteProject.hero_slider_template has no migration).
+if len(sys.argv) > 1 and sys.argv[1] == "test":
+    MIGRATION_MODULES = {
+        label: None
+        for label in (
+            "admin", "auth", "contenttypes", "sessions",
+            "sites", "main_site", "tenant_dashboards", "user_dashboard", "admin_panel",
+        )
+    }
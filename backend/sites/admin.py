@@ -1,6 +1,5 @@
 from django.contrib import admin
 from django.contrib import messages
-from django.db import transaction
 from django.shortcuts import render, get_object_or_404, redirect
 from django.urls import path, reverse
 from django.utils.html import format_html
@@ -25,6 +24,8 @@ from .models import (
     HomepageSlide,
     TestimonialCarousel,
     TestimonialSlide,
+    BackgroundJob,
+    ScreenshotAnalysis,
 )
 
 
@@ -106,33 +107,28 @@ class SiteTemplateAdmin(admin.ModelAdmin):
     fields = (
         "key", "name", "description", "type", "category", 
         "is_active", "status", "version", "preview_image", "preview_image_url",  # [TEMPLAB]
-        "is_default_for_tenants"
+        "is_default_for_tenants",
+        "skeleton_spec",  # [SKELETON]
     )
     
     actions = ['generate_skeleton']
     
     @admin.action(description='Generate default skeleton for selected templates')
     def generate_skeleton(self, request, queryset):
-        """Generate default page/section/field skeleton for selected templates."""
-        from .utils import ensure_template_skeleton
+        """Queue default page/section/field skeleton generation for selected templates."""
+        from .jobs import enqueue_job
         
         count = 0
         for template in queryset:
-            try:
-                master_project = ensure_template_skeleton(template)
-                count += 1
-                messages.success(
-                    request, 
-                    f'Generated skeleton for {template.name} → {master_project.name}'
-                )
-            except Exception as e:
-                messages.error(
-                    request,
-                    f'Failed to generate skeleton for {template.name}: {str(e)}'
-                )
+            enqueue_job('generate_skeleton', {'site_template_id': template.id}, user=request.user)
+            count += 1
         
         if count:
-            messages.success(request, f'Successfully generated {count} template skeletons.')
+            messages.success(
+                request,
+                f'Queued skeleton generation for {count} templates. '
+                f'Progress is listed under Background jobs.'
+            )
 
 
 @admin.register(Template)
@@ -286,45 +282,53 @@ class SiteProjectAdmin(admin.ModelAdmin):
     
     @admin.action(description='Promote to Master Template')
     def promote_to_master(self, request, queryset):
-        """Promote selected projects to master template status."""
-        from django.contrib.auth.models import User
+        """Queue promotion of selected projects to master template status."""
+        from .jobs import enqueue_job
         
-        # Get or create system user for master templates
-        system_user, created = User.objects.get_or_create(
-            username='system_template_builder',
-            defaults={
-                'email': 'system@justcodeworks.com',
-                'first_name': 'System',
-                'last_name': 'Template Builder',
-                'is_active': False,
-            }
-        )
-        
-        count = 0
-        for project in queryset:
-            if not project.is_master_template:
-                project.is_master_template = True
-                project.owner = system_user  # Assign to system user
-                project.is_active = False  # Hide from normal lists
-                project.save()
-                count += 1
-                messages.success(request, f'Promoted {project.name} to master template')
+        project_ids = [
+            str(project_id)
+            for project_id in queryset.filter(is_master_template=False).values_list('id', flat=True)
+        ]
+        if not project_ids:
+            messages.info(request, 'Selected projects are already master templates')
+            return
         
-        if count:
-            messages.success(request, f'Promoted {count} projects to master templates')
+        enqueue_job('promote_to_master', {'project_ids': project_ids}, user=request.user)
+        messages.success(
+            request,
+            f'Queued promotion of {len(project_ids)} projects to master templates. '
+            f'Progress is listed under Background jobs.'
+        )
     
     @admin.action(description='Clone selected projects')
     def clone_project(self, request, queryset):
-        """Clone selected projects (redirects to individual clone pages for input)."""
-        if queryset.count() == 1:
-            project = queryset.first()
-            # For now, just redirect to change view - in future could add custom clone form
-            messages.info(
-                request, 
-                f'To clone "{project.name}", use the Clone API endpoint or implement custom clone form'
-            )
-        else:
+        """Queue a clone of the selected project (name "<name> (Copy)", same owner)."""
+        from .jobs import enqueue_job
+        
+        if queryset.count() != 1:
             messages.warning(request, 'Please select only one project to clone')
+            return
+        
+        project = queryset.first()
+        enqueue_job('clone_project', {'source_project_id': str(project.id)}, user=request.user)
+        messages.success(
+            request,
+            f'Queued clone of "{project.name}". Progress is listed under Background jobs.'
+        )
+    
+    # [PURGE] Deleting only hides the project; a background job purges it
+    def get_deleted_objects(self, objs, request):
+        """Skip collecting the whole cascade for the confirmation page."""
+        return [str(obj) for obj in objs], {SiteProject._meta.verbose_name_plural: len(objs)}, set(), []
+    
+    def delete_model(self, request, obj):
+        from .purge import delete_project
+        delete_project(obj, user=request.user)
+    
+    def delete_queryset(self, request, queryset):
+        from .purge import delete_project
+        for project in queryset:
+            delete_project(project, user=request.user)
     
     def get_urls(self):
         """Add custom URLs for content tree editing."""
@@ -424,69 +428,38 @@ class PageAdmin(admin.ModelAdmin):
     @admin.action(description='Duplicate selected pages to Portuguese (PT)')
     def duplicate_to_portuguese(self, request, queryset):
         """
-        Admin action to duplicate selected English pages to Portuguese,
-        including all sections and fields.
+        Admin action to duplicate selected pages to Portuguese, including
+        all sections, fields and hero slides (bulk copy per project and
+        source locale, see utils.duplicate_project_locale).
         """
+        from .utils import duplicate_project_locale
+        
         duplicated_count = 0
         skipped_count = 0
         error_count = 0
         
-        for page in queryset:
+        groups = {}
+        for page in queryset.select_related('project'):
+            # Pages already in Portuguese are skipped
+            if page.locale == LocaleChoices.PT:
+                skipped_count += 1
+                continue
+            groups.setdefault((page.project, page.locale), []).append(page.id)
+        
+        for (project, locale), page_ids in groups.items():
             try:
-                with transaction.atomic():
-                    # Check if page is already in Portuguese
-                    if page.locale == LocaleChoices.PT:
-                        skipped_count += 1
-                        continue
-                    
-                    # Check if Portuguese version already exists
-                    pt_exists = Page.objects.filter(
-                        project=page.project,
-                        slug=page.slug,
-                        locale=LocaleChoices.PT
-                    ).exists()
-                    
-                    if pt_exists:
-                        skipped_count += 1
-                        continue
-                    
-                    # Create Portuguese copy of the page
-                    pt_page = Page.objects.create(
-                        project=page.project,
-                        locale=LocaleChoices.PT,
-                        title=page.title,
-                        slug=page.slug,
-                        path=page.path,
-                        order=page.order,
-                        is_published=page.is_published
-                    )
-                    
-                    # Duplicate all sections
-                    for section in page.sections.all():
-                        pt_section = Section.objects.create(
-                            page=pt_page,
-                            identifier=section.identifier,
-                            internal_name=section.internal_name,
-                            order=section.order
-                        )
-                        
-                        # Duplicate all fields in this section
-                        for field in section.fields.all():
-                            Field.objects.create(
-                                section=pt_section,
-                                key=field.key,
-                                label=field.label,
-                                value=field.value
-                            )
-                    
-                    duplicated_count += 1
-                    
+                counts = duplicate_project_locale(
+                    project, locale, LocaleChoices.PT, page_ids=page_ids, navigation=False
+                )
             except Exception as e:
-                error_count += 1
+                error_count += len(page_ids)
                 messages.error(
                     request,
-                    f'Error duplicating page "{page.title}": {str(e)}'
+                    f'Error duplicating pages of "{project.name}" ({locale}): {str(e)}'
                 )
+                continue
+            duplicated_count += counts['pages_created']
+            skipped_count += counts['pages_skipped']
         
         # Provide feedback to the user
         if duplicated_count > 0:
@@ -656,54 +629,38 @@ class NavigationItemAdmin(admin.ModelAdmin):
     @admin.action(description='Duplicate selected navigation items to Portuguese (PT)')
     def duplicate_to_portuguese(self, request, queryset):
         """
-        Admin action to duplicate selected English navigation items to Portuguese.
+        Admin action to duplicate selected navigation items to Portuguese,
+        keeping their nesting (bulk copy per project and source locale, see
+        utils.duplicate_project_locale).
         """
+        from .utils import duplicate_project_locale
+        
         duplicated_count = 0
         skipped_count = 0
         error_count = 0
         
-        for nav_item in queryset:
+        groups = {}
+        for nav_item in queryset.select_related('project'):
+            # Items already in Portuguese are skipped
+            if nav_item.locale == LocaleChoices.PT:
+                skipped_count += 1
+                continue
+            groups.setdefault((nav_item.project, nav_item.locale), []).append(nav_item.id)
+        
+        for (project, locale), item_ids in groups.items():
             try:
-                with transaction.atomic():
-                    # Check if nav item is already in Portuguese
-                    if nav_item.locale == LocaleChoices.PT:
-                        skipped_count += 1
-                        continue
-                    
-                    # Check if Portuguese version already exists
-                    pt_exists = NavigationItem.objects.filter(
-                        project=nav_item.project,
-                        location=nav_item.location,
-                        locale=LocaleChoices.PT,
-                        label=nav_item.label
-                    ).exists()
-                    
-                    if pt_exists:
-                        skipped_count += 1
-                        continue
-                    
-                    # Create Portuguese copy of the navigation item
-                    NavigationItem.objects.create(
-                        project=nav_item.project,
-                        parent=nav_item.parent,
-                        location=nav_item.location,
-                        locale=LocaleChoices.PT,
-                        column=nav_item.column,
-                        label=nav_item.label,
-                        page=nav_item.page,
-                        url=nav_item.url,
-                        is_external=nav_item.is_external,
-                        order=nav_item.order
-                    )
-                    
-                    duplicated_count += 1
-                    
+                counts = duplicate_project_locale(
+                    project, locale, LocaleChoices.PT, page_ids=[], navigation_item_ids=item_ids
+                )
             except Exception as e:
-                error_count += 1
+                error_count += len(item_ids)
                 messages.error(
                     request,
-                    f'Error duplicating navigation item "{nav_item.label}": {str(e)}'
+                    f'Error duplicating navigation of "{project.name}" ({locale}): {str(e)}'
                 )
+                continue
+            duplicated_count += counts['navigation_items_created']
+            skipped_count += counts['navigation_items_skipped']
         
         # Provide feedback to the user
         if duplicated_count > 0:
@@ -1039,3 +996,34 @@ class TestimonialSlideAdmin(admin.ModelAdmin):
 # Replace the default admin site
 admin.site.__class__ = CustomAdminSite
 
+
+# [JOBS] Background jobs (read-only; run by `python manage.py run_jobs`)
+@admin.register(BackgroundJob)
+class BackgroundJobAdmin(admin.ModelAdmin):
+    list_display = ("kind", "status", "progress_display", "attempts", "created_by", "created_at", "finished_at")
+    list_filter = ("status", "kind")
+    search_fields = ("id", "kind", "progress_message")
+    ordering = ("-created_at",)
+    readonly_fields = [field.name for field in BackgroundJob._meta.fields]
+
+    def progress_display(self, obj):
+        if not obj.progress_total:
+            return obj.progress_message or "-"
+        return f"{obj.progress_current}/{obj.progress_total} {obj.progress_message}".strip()
+    progress_display.short_description = "Progress"
+
+    def has_add_permission(self, request):
+        return False
+
+
+# [AI-CACHE] Cached screenshot analyses (deleting an entry forces a new AI call)
+@admin.register(ScreenshotAnalysis)
+class ScreenshotAnalysisAdmin(admin.ModelAdmin):
+    list_display = ("content_hash", "locale", "prompt_version", "hits", "last_used_at", "created_at")
+    list_filter = ("locale", "prompt_version")
+    search_fields = ("content_hash", "image_hash")
+    ordering = ("-created_at",)
+    readonly_fields = [field.name for field in ScreenshotAnalysis._meta.fields]
+
+    def has_add_permission(self, request):
+        return False
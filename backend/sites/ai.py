@@ -0,0 +1,287 @@
+# [AI-PROVIDER] Shared AI model client
+
+"""
+Every AI model call goes through this module instead of building its own
+``OpenAI(...)`` client per request:
+
+    content = complete_json(messages, model="gpt-4o-mini")
+
+The provider is created once per process from ``SITES_AI_PROVIDER`` (a
+dotted path, with ``SITES_AI_PROVIDER_OPTIONS`` as keyword arguments) and
+keeps one pooled HTTP client, so connections are reused between calls.
+
+``complete_json`` adds what the call sites used to lack:
+
+- a per-attempt timeout (``SITES_AI_TIMEOUT``) and an optional overall
+  ``budget`` covering retries and the wait for a slot
+- exponential backoff with jitter on 429, 408/409 and 5xx responses and on
+  connection errors (``SITES_AI_MAX_RETRIES``, ``SITES_AI_BACKOFF``),
+  honouring ``Retry-After``
+- a semaphore capping in-flight calls per process
+  (``SITES_AI_MAX_CONCURRENCY``); callers wait up to
+  ``SITES_AI_QUEUE_TIMEOUT`` seconds for a slot, then get ``AIBusyError``
+
+``FakeProvider`` answers locally and is meant for tests and benchmarks:
+``SITES_AI_PROVIDER = "sites.ai.FakeProvider"`` or ``set_provider(...)``.
+"""
+
+import logging
+import random
+import threading
+import time
+from typing import Callable, List, Optional
+
+from django.conf import settings
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+from django.utils.module_loading import import_string
+
+
+logger = logging.getLogger(__name__)
+
+RETRYABLE_STATUS_CODES = (408, 409, 429)
+
+
+class AIError(Exception):
+    """Base class for AI call failures."""
+
+
+class AIConfigurationError(AIError):
+    """No usable provider is configured (e.g. missing API key)."""
+
+
+class AIBusyError(AIError):
+    """All call slots of this process stayed busy for too long."""
+
+
+class AIProviderError(AIError):
+    """The provider failed; ``retryable`` tells whether a retry may help."""
+
+    def __init__(self, message: str, *, status_code: Optional[int] = None,
+                 retryable: Optional[bool] = None, retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.status_code = status_code
+        if retryable is None:
+            retryable = status_code is None or status_code in RETRYABLE_STATUS_CODES or status_code >= 500
+        self.retryable = retryable
+        self.retry_after = retry_after
+
+
+def get_ai_timeout() -> float:
+    return getattr(settings, "SITES_AI_TIMEOUT", 30)
+
+
+def get_ai_max_retries() -> int:
+    return max(0, getattr(settings, "SITES_AI_MAX_RETRIES", 3))
+
+
+def get_ai_backoff() -> float:
+    return getattr(settings, "SITES_AI_BACKOFF", 0.5)
+
+
+def get_ai_max_backoff() -> float:
+    return getattr(settings, "SITES_AI_MAX_BACKOFF", 8)
+
+
+def get_ai_max_concurrency() -> int:
+    return max(1, getattr(settings, "SITES_AI_MAX_CONCURRENCY", 4))
+
+
+def get_ai_queue_timeout() -> float:
+    return getattr(settings, "SITES_AI_QUEUE_TIMEOUT", 10)
+
+
+class AIProvider:
+    """
+    Backend interface: one attempt of a JSON chat completion. Raise
+    AIProviderError on failure; retries and limits are handled by
+    ``complete_json``.
+    """
+
+    def is_configured(self) -> bool:
+        return True
+
+    def complete_json(self, *, model: str, messages: List[dict], timeout: float) -> str:
+        raise NotImplementedError
+
+
+class OpenAIProvider(AIProvider):
+    """OpenAI chat completions over one pooled HTTP client."""
+
+    def __init__(self, api_key: Optional[str] = None, max_connections: Optional[int] = None):
+        self.api_key = settings.OPENAI_API_KEY if api_key is None else api_key
+        self.max_connections = max_connections or get_ai_max_concurrency()
+        self._client = None
+        self._lock = threading.Lock()
+
+    def is_configured(self) -> bool:
+        return bool(self.api_key)
+
+    def _get_client(self):
+        if self._client is None:
+            with self._lock:
+                if self._client is None:
+                    import httpx
+                    import openai
+
+                    limits = httpx.Limits(
+                        max_connections=self.max_connections,
+                        max_keepalive_connections=self.max_connections,
+                    )
+                    # Retries are done by complete_json, which knows the budget
+                    self._client = openai.OpenAI(
+                        api_key=self.api_key,
+                        max_retries=0,
+                        http_client=openai.DefaultHttpxClient(limits=limits),
+                    )
+        return self._client
+
+    def complete_json(self, *, model: str, messages: List[dict], timeout: float) -> str:
+        if not self.is_configured():
+            raise AIConfigurationError("OPENAI_API_KEY is not set.")
+        import openai
+
+        client = self._get_client()
+        try:
+            response = client.with_options(timeout=timeout).chat.completions.create(
+                model=model,
+                messages=messages,
+                response_format={"type": "json_object"},
+            )
+        except openai.APIStatusError as exc:
+            raise AIProviderError(
+                str(exc), status_code=exc.status_code, retry_after=_retry_after(exc.response)
+            ) from exc
+        except (openai.APITimeoutError, openai.APIConnectionError) as exc:
+            raise AIProviderError(str(exc), retryable=True) from exc
+        return response.choices[0].message.content
+
+
+def _retry_after(response) -> Optional[float]:
+    try:
+        return float(response.headers.get("retry-after"))
+    except (AttributeError, TypeError, ValueError):
+        return None
+
+
+class FakeProvider(AIProvider):
+    """
+    Local provider for tests and benchmarks. Answers with
+    ``responder(model, messages)`` or the fixed ``response`` after
+    ``latency`` seconds; ``failures`` is a list of status codes raised by
+    the first calls. Every call is recorded in ``calls``.
+    """
+
+    def __init__(self, response: str = "{}", responder: Optional[Callable[[str, List[dict]], str]] = None,
+                 latency: float = 0.0, failures: Optional[List[int]] = None):
+        self.response = response
+        self.responder = responder
+        self.latency = latency
+        self.failures = list(failures or [])
+        self.calls: List[dict] = []
+        self._lock = threading.Lock()
+
+    def complete_json(self, *, model: str, messages: List[dict], timeout: float) -> str:
+        with self._lock:
+            self.calls.append({"model": model, "messages": messages, "timeout": timeout})
+            failure = self.failures.pop(0) if self.failures else None
+        if self.latency:
+            time.sleep(min(self.latency, timeout))
+        if failure is not None:
+            raise AIProviderError(f"Fake provider error {failure}", status_code=failure)
+        if self.responder is not None:
+            return self.responder(model, messages)
+        return self.response
+
+
+_provider: Optional[AIProvider] = None
+_semaphore: Optional[threading.BoundedSemaphore] = None
+_state_lock = threading.Lock()
+
+
+def get_provider() -> AIProvider:
+    """The process-wide provider, created on first use."""
+    global _provider
+    if _provider is None:
+        with _state_lock:
+            if _provider is None:
+                path = getattr(settings, "SITES_AI_PROVIDER", "sites.ai.OpenAIProvider")
+                options = getattr(settings, "SITES_AI_PROVIDER_OPTIONS", {}) or {}
+                _provider = import_string(path)(**options)
+    return _provider
+
+
+def set_provider(provider: Optional[AIProvider]) -> None:
+    """Replace the provider (tests, benchmarks). None rebuilds it from settings."""
+    global _provider, _semaphore
+    with _state_lock:
+        _provider = provider
+        _semaphore = None
+
+
+def _get_semaphore() -> threading.BoundedSemaphore:
+    global _semaphore
+    if _semaphore is None:
+        with _state_lock:
+            if _semaphore is None:
+                _semaphore = threading.BoundedSemaphore(get_ai_max_concurrency())
+    return _semaphore
+
+
+@receiver(setting_changed)
+def _reset_on_setting_change(setting, **kwargs):
+    if setting.startswith("SITES_AI_") or setting == "OPENAI_API_KEY":
+        set_provider(None)
+
+
+def is_ai_configured() -> bool:
+    return get_provider().is_configured()
+
+
+def _backoff_delay(attempt: int, error: AIProviderError) -> float:
+    delay = min(get_ai_max_backoff(), get_ai_backoff() * (2 ** attempt))
+    # Jitter spreads out the retries of calls that failed together
+    delay = delay / 2 + random.uniform(0, delay / 2)
+    if error.retry_after is not None:
+        delay = max(delay, min(error.retry_after, get_ai_max_backoff()))
+    return delay
+
+
+def complete_json(messages: List[dict], *, model: str, timeout: Optional[float] = None,
+                  budget: Optional[float] = None) -> str:
+    """
+    Run a JSON chat completion and return the raw message content.
+    ``timeout`` limits each attempt, ``budget`` the whole call including
+    retries. Raises AIConfigurationError, AIBusyError or AIProviderError.
+    """
+    provider = get_provider()
+    if not provider.is_configured():
+        raise AIConfigurationError("The AI provider is not configured.")
+    timeout = timeout or get_ai_timeout()
+    deadline = time.monotonic() + budget if budget else None
+
+    def remaining(default: float) -> float:
+        return default if deadline is None else min(default, deadline - time.monotonic())
+
+    semaphore = _get_semaphore()
+    if not semaphore.acquire(timeout=max(0, remaining(get_ai_queue_timeout()))):
+        raise AIBusyError("Too many AI requests in progress; try again shortly.")
+    try:
+        retries = get_ai_max_retries()
+        attempt = 0
+        while True:
+            attempt_timeout = remaining(timeout)
+            if attempt_timeout <= 0:
+                raise AIProviderError("AI call budget exhausted.", retryable=False)
+            try:
+                return provider.complete_json(model=model, messages=messages, timeout=attempt_timeout)
+            except AIProviderError as exc:
+                delay = _backoff_delay(attempt, exc)
+                out_of_time = deadline is not None and deadline - time.monotonic() < delay + 1
+                if not exc.retryable or attempt >= retries or out_of_time:
+                    raise
+                logger.warning("AI call failed (%s), retrying in %.1fs", exc, delay)
+                time.sleep(delay)
+                attempt += 1
+    finally:
+        semaphore.release()
@@ -29,10 +29,14 @@ from .views import (
     TenantShowcaseView,
     tenant_showcase_html_view,
     SiteProjectPublicView,
+    SiteBootstrapView,
+    SiteRouteResolveView,
     PageSeoUpdateView,
+    PageBatchSaveView,
     SectionContentUpdateView,
     generate_template_skeleton,
     clone_project,
+    BackgroundJobDetailView,
     switch_current_project,
     login_view,
     register_view,
@@ -55,6 +59,8 @@ from .views import (
     SectionDraftUploadView,
     SectionDraftProcessView,
     SectionDraftCreateSectionView,
+    SectionDraftDetailView,
+    SectionDraftEventsView,
     SectionAISuggestView,
 )
 from django.views.decorators.csrf import ensure_csrf_cookie
@@ -79,6 +85,7 @@ urlpatterns = [
     path("pages/my/", PageListForUserView.as_view(), name="page-list-for-user"),
     # [SEO] Page SEO update endpoint
     path("pages/<int:pk>/seo/", PageSeoUpdateView.as_view(), name="page-seo-update"),
+    path("pages/<int:pk>/batch/", PageBatchSaveView.as_view(), name="page-batch-save"),
     # [CONTENT] Section content update endpoint
     path("sections/<int:pk>/content/", SectionContentUpdateView.as_view(), name="section-content-update"),
     path("dashboard/template/", TenantDashboardTemplateView.as_view(), name="tenant-dashboard-template"),
@@ -131,6 +138,9 @@ urlpatterns = [
     path("admin/templates/<int:site_template_id>/generate-skeleton/", generate_template_skeleton, name="admin-generate-skeleton"),
     path("admin/projects/<uuid:project_id>/clone/", clone_project, name="admin-clone-project"),
     
+    # [JOBS] Background job status
+    path("jobs/<uuid:pk>/", BackgroundJobDetailView.as_view(), name="background-job-detail"),
+    
     # Project Management APIs
     path("admin/projects/switch/", switch_current_project, name="switch-current-project"),
     
@@ -154,9 +164,15 @@ urlpatterns = [
     path("sections/upload-screenshot/", SectionDraftUploadView.as_view(), name="section-upload-screenshot"),
     path("sections/<uuid:draft_id>/process/", SectionDraftProcessView.as_view(), name="section-draft-process"),
     path("sections/drafts/<uuid:draft_id>/create-section/", SectionDraftCreateSectionView.as_view(), name="section-draft-create-section"),
+    path("sections/drafts/<uuid:draft_id>/", SectionDraftDetailView.as_view(), name="section-draft-detail"),
+    path("sections/drafts/<uuid:draft_id>/events/", SectionDraftEventsView.as_view(), name="section-draft-events"),
     
     # [RMOD] Public API for tenant sites
     path("sites/<slug>/public/", SiteProjectPublicView.as_view(), name="site-public-api"),
+    # [BOOTSTRAP] Project, theme, navigation and page content in one call
+    path("sites/<slug>/bootstrap/", SiteBootstrapView.as_view(), name="site-bootstrap-api"),
+    # [ROUTES] Path -> page / locale / redirect resolution
+    path("sites/<slug>/resolve/", SiteRouteResolveView.as_view(), name="site-route-resolve"),
     
     # [GARAGE-FORM] Quote request submission endpoint
     path("sites/<slug:site_slug>/quote-requests/", QuoteRequestCreateView.as_view(), name="quote-request-create"),
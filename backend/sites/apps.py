@@ -5,3 +5,7 @@ class TenantSitesConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'sites'
     verbose_name = 'Tenant Sites'
+
+    def ready(self):
+        # [CACHE] register content change signals
+        from . import signals  # noqa: F401
@@ -0,0 +1,150 @@
+# [BOOTSTRAP] Single-request site bootstrap payload
+
+"""
+Everything a tenant page render needs in one response: project info and
+theme, nested navigation, the resolved page tree (with hero slides) and the
+project's active homepage sliders and testimonial carousels.
+
+Built with a fixed number of queries regardless of site size (11 at most).
+"""
+
+from django.db.models import Prefetch
+
+from .locales import annotate_locale_rank
+from .models import (
+    HeroSlide,
+    HomepageSlide,
+    HomepageSlider,
+    Page,
+    SiteProject,
+    TestimonialCarousel,
+    TestimonialSlide,
+)
+from .navigation import build_navigation_tree
+from .public_tree import build_public_pages
+from .serializers import HomepageSliderSerializer, TestimonialCarouselSerializer
+
+
+PROJECT_THEME_FIELDS = (
+    "default_theme",
+    "allow_theme_toggle",
+    "primary_color",
+    "secondary_color",
+    "accent_color",
+    "background_color",
+    "text_color",
+    "is_dark_theme",
+    "hero_particles_enabled",
+    "hero_particles_density",
+    "hero_particles_speed",
+    "hero_particles_size",
+    "header_background_mode",
+)
+
+HERO_SLIDE_VALUES = (
+    "id",
+    "order",
+    "is_active",
+    "eyebrow",
+    "title",
+    "subtitle",
+    "body",
+    "primary_button_label",
+    "primary_button_url",
+    "secondary_button_label",
+    "secondary_button_url",
+    "image_url",
+    "animation_mode",
+)
+
+
+def _resolve_page_id(project_id, path, locale):
+    qs = Page.objects.filter(project_id=project_id, path=path)
+    if locale:
+        qs = annotate_locale_rank(qs, locale).order_by("locale_rank", "order", "id")
+    return qs.values_list("id", flat=True).first()
+
+
+def _build_page(page_id):
+    pages = build_public_pages(Page.objects.filter(id=page_id))
+    if not pages:
+        return None
+    page = pages[0]
+    page["hero_slides"] = list(
+        HeroSlide.objects.filter(page_id=page_id, is_active=True)
+        .order_by("order", "id")
+        .values(*HERO_SLIDE_VALUES)
+    )
+    return page
+
+
+def build_site_bootstrap(project_id, path="/", locale=None, serializer_context=None, page_id=None):
+    """
+    Return the bootstrap payload for an active project, or None if it does
+    not exist. ``page`` is None when no page matches ``path`` in any locale
+    of the fallback chain; navigation and theme are still included so the
+    frontend can render its own not-found page.
+
+    ``page_id`` is an already resolved page (e.g. from the route table) and
+    skips the ``path`` lookup; pass ``path=None`` for a payload without page.
+
+    ``serializer_context`` is passed to the slider/carousel serializers.
+    Their image fields are stored URLs, so the payload does not depend on
+    the request.
+    """
+    context = serializer_context or {}
+    project = (
+        SiteProject.objects.filter(id=project_id, is_active=True)
+        .values(
+            "id",
+            "name",
+            "slug",
+            "site_template__key",
+            "primary_locale",
+            "additional_locales",
+            *PROJECT_THEME_FIELDS,
+        )
+        .first()
+    )
+    if project is None:
+        return None
+
+    if page_id is None and path is not None:
+        page_id = _resolve_page_id(project_id, path, locale)
+
+    sliders = HomepageSlider.objects.filter(
+        site_project_id=project_id, is_active=True
+    ).prefetch_related(
+        Prefetch(
+            "slides",
+            queryset=HomepageSlide.objects.filter(is_active=True).order_by("order", "id"),
+        )
+    ).order_by("-created_at")
+    carousels = TestimonialCarousel.objects.filter(
+        site_project_id=project_id, is_active=True
+    ).prefetch_related(
+        Prefetch(
+            "testimonials",
+            queryset=TestimonialSlide.objects.filter(is_active=True).order_by("order", "id"),
+        )
+    ).order_by("-created_at")
+
+    return {
+        "project": {
+            "id": str(project["id"]),
+            "name": project["name"],
+            "slug": project["slug"],
+            "site_template_key": project["site_template__key"],
+            "primary_locale": project["primary_locale"],
+            "additional_locales": project["additional_locales"],
+            "theme": {field: project[field] for field in PROJECT_THEME_FIELDS},
+        },
+        "navigation": build_navigation_tree(project_id, locale),
+        "page": _build_page(page_id) if page_id is not None else None,
+        "homepage_sliders": HomepageSliderSerializer(
+            sliders, many=True, context=context
+        ).data,
+        "testimonial_carousels": TestimonialCarouselSerializer(
+            carousels, many=True, context=context
+        ).data,
+    }
@@ -0,0 +1,36 @@
+# [AI-SUGGEST] Cache backends
+
+"""
+``LRUDatabaseCache`` is Django's DatabaseCache with least-recently-used
+culling. Past ``MAX_ENTRIES`` the stock backend deletes a slice of rows in
+``cache_key`` order, which for hashed keys means at random. This one deletes
+the rows that expire first instead (expiry times are stored to the
+second). When every entry is stored with the
+same timeout and readers ``touch()`` the entries they use (as
+sites/suggestions.py does), those are the least recently used ones.
+"""
+
+from django.core.cache.backends.db import DatabaseCache
+from django.db import connections
+
+
+class LRUDatabaseCache(DatabaseCache):
+    def _cull(self, db, cursor, now, num):
+        if self._cull_frequency == 0:
+            self.clear()
+            return
+        connection = connections[db]
+        table = connection.ops.quote_name(self._table)
+        expires = connection.ops.quote_name("expires")
+        cursor.execute(
+            f"DELETE FROM {table} WHERE {expires} < %s",
+            [connection.ops.adapt_datetimefield_value(now)],
+        )
+        remaining_num = num - cursor.rowcount
+        if remaining_num > self._max_entries:
+            cull_num = remaining_num // self._cull_frequency
+            # Same LIMIT/OFFSET form as Django's cache_key_culling_sql()
+            cursor.execute(f"SELECT {expires} FROM {table} ORDER BY {expires} LIMIT 1 OFFSET %s", [cull_num])
+            row = cursor.fetchone()
+            if row:
+                cursor.execute(f"DELETE FROM {table} WHERE {expires} < %s", [row[0]])
@@ -0,0 +1,158 @@
+# [CACHE] Public site payload cache
+
+"""
+Per-project cache for serialized public site payloads.
+
+Entries are keyed by project id and tagged with the project's
+``content_updated_at`` stamp. A stamp mismatch marks the entry stale, so
+invalidating a project is just a matter of bumping that stamp (see
+sites/signals.py). Because the stamp lives in the database, this works
+across worker processes regardless of the configured cache backend; the
+rebuild locks and the payloads themselves are only shared when the backend
+is (see settings.CACHES).
+
+Stale entries keep being served while a single worker rebuilds them, so a
+publish or an expiry on a busy site does not trigger a rebuild per request.
+"""
+
+import time
+import uuid
+from typing import Any, Callable, Optional, Tuple
+
+from django.conf import settings
+from django.core.cache import cache
+from django.utils import timezone
+
+from .models import SiteProject
+
+
+PUBLIC_SITE_CACHE_PREFIX = "sites:public-site"
+
+
+def get_public_site_cache_timeout() -> int:
+    return getattr(settings, "PUBLIC_SITE_CACHE_TIMEOUT", 60 * 60)
+
+
+def content_version(project_ref: dict) -> str:
+    """
+    Return a stable version token for a project's current content.
+
+    ``project_ref`` is a dict with at least ``id`` and ``content_updated_at``,
+    as returned by ``get_public_project_ref``.
+    """
+    stamp = project_ref["content_updated_at"]
+    return str(int(stamp.timestamp() * 1_000_000)) if stamp else "0"
+
+
+def public_site_cache_key(project_id, variant: str = "") -> str:
+    key = f"{PUBLIC_SITE_CACHE_PREFIX}:{project_id}"
+    if variant:
+        key = f"{key}:{variant}"
+    return key
+
+
+def get_public_project_ref(slug: Optional[str] = None, project_id=None) -> Optional[dict]:
+    """
+    Resolve an active project (by slug or id) to
+    ``{"id", "content_updated_at", "primary_locale"}``.
+    Returns None if no such active project exists.
+    """
+    lookup = {"slug": slug} if slug is not None else {"id": project_id}
+    return (
+        SiteProject.objects.filter(is_active=True, **lookup)
+        .values("id", "content_updated_at", "primary_locale")
+        .first()
+    )
+
+
+def get_public_site_soft_timeout() -> int:
+    return getattr(settings, "PUBLIC_SITE_CACHE_SOFT_TIMEOUT", 5 * 60)
+
+
+def get_public_site_lock_timeout() -> int:
+    return getattr(settings, "PUBLIC_SITE_CACHE_LOCK_TIMEOUT", 30)
+
+
+def get_public_site_lock_wait() -> float:
+    return getattr(settings, "PUBLIC_SITE_CACHE_LOCK_WAIT", 2.0)
+
+
+def get_public_site_entry(
+    project_ref: dict,
+    builder: Callable[[], Any],
+    variant: str = "",
+) -> Tuple[Any, str]:
+    """
+    Return ``(data, version)`` for a project's public payload, where
+    ``version`` is the content version the data was built from.
+
+    [CACHE] Stale-while-revalidate with single-flight rebuilds:
+
+    - fresh entry (current version, younger than the soft timeout): served;
+    - stale entry (older version or past the soft timeout): the request that
+      wins the rebuild lock rebuilds it, every other request is served the
+      stale data meanwhile (so ``version`` may be older than the project's);
+    - no entry (cold or past the hard timeout, PUBLIC_SITE_CACHE_TIMEOUT):
+      the lock winner builds it while the others poll for the result and
+      retry the lock, so they take over as soon as it is released. After
+      PUBLIC_SITE_CACHE_LOCK_WAIT seconds they build it themselves.
+
+    A builder result of None (nothing to serve) is returned but not cached.
+
+    There is one rebuild lock per project, shared by all its variants, so a
+    publish rebuilds the project's payloads one at a time. The lock is a
+    ``cache.add`` key: it only spans processes when the cache backend is
+    shared (the database cache or Redis, see settings.CACHES); with a
+    per-process cache each process runs its own rebuild.
+    """
+    key = public_site_cache_key(project_ref["id"], variant)
+    version = content_version(project_ref)
+
+    entry = cache.get(key)
+    if entry is not None:
+        is_current = entry.get("version") == version
+        age = time.time() - entry.get("built_at", 0)
+        if is_current and age < get_public_site_soft_timeout():
+            return entry["data"], entry["version"]
+
+    lock_key = f"{public_site_cache_key(project_ref['id'])}:lock"
+    lock_token = uuid.uuid4().hex
+    deadline = time.monotonic() + get_public_site_lock_wait()
+    while True:
+        if cache.add(lock_key, lock_token, get_public_site_lock_timeout()):
+            try:
+                data = builder()
+                if data is not None:
+                    cache.set(
+                        key,
+                        {"version": version, "data": data, "built_at": time.time()},
+                        get_public_site_cache_timeout(),
+                    )
+                return data, version
+            finally:
+                if cache.get(lock_key) == lock_token:
+                    cache.delete(lock_key)
+
+        if entry is not None:
+            # Someone else is rebuilding: serve what we have
+            return entry["data"], entry["version"]
+        if time.monotonic() >= deadline:
+            break
+        time.sleep(0.05)
+        entry = cache.get(key)
+        if entry is not None:
+            return entry["data"], entry["version"]
+
+    # The rebuild is taking too long (or its worker died): build locally
+    return builder(), version
+
+
+def bump_content_version(**filters) -> None:
+    """
+    Mark the content of every project matching ``filters`` as changed, e.g.
+    ``bump_content_version(id=project.id)`` or
+    ``bump_content_version(pages__sections__id=section.id)``.
+
+    Uses a queryset update so SiteProject save signals are not re-triggered.
+    """
+    SiteProject.objects.filter(**filters).update(content_updated_at=timezone.now())
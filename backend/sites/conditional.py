@@ -0,0 +1,122 @@
+# [CACHE] Conditional GET helpers
+
+"""
+ETag / Last-Modified support for read endpoints.
+
+Validators are computed from cheap metadata (a project's content version, or
+an aggregate over the rows behind a queryset) *before* anything is
+serialized, so a client revalidating an unchanged resource gets a
+``304 Not Modified`` for the price of one small query.
+"""
+
+import hashlib
+from functools import partial
+
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db.models import Count, Max
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date
+from rest_framework import status
+
+
+def make_etag(*parts) -> str:
+    """Build a strong, quoted ETag from the given parts."""
+    raw = "|".join("" if part is None else str(part) for part in parts)
+    return '"%s"' % hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+
+def conditional_response(request, etag, last_modified, build):
+    """
+    Return a 304 when the request's validators match ``etag`` /
+    ``last_modified``; otherwise call ``build()`` and attach the validators
+    to the (successful) response it returns.
+    """
+    last_modified_ts = int(last_modified.timestamp()) if last_modified else None
+
+    not_modified = get_conditional_response(
+        request, etag=etag, last_modified=last_modified_ts
+    )
+    if not_modified is not None:
+        _set_validators(not_modified, etag, last_modified_ts)
+        return not_modified
+
+    response = build()
+    # A builder may set its own ETag, e.g. when it served a stale cached
+    # copy; its Last-Modified would be unknown then, so leave both alone.
+    if response.status_code == status.HTTP_200_OK and not response.has_header("ETag"):
+        _set_validators(response, etag, last_modified_ts)
+    return response
+
+
+def _set_validators(response, etag, last_modified_ts):
+    if etag:
+        response["ETag"] = etag
+    if last_modified_ts is not None:
+        response["Last-Modified"] = http_date(last_modified_ts)
+
+
+class ConditionalGetMixin:
+    """
+    Adds ETag / Last-Modified to ``list`` and ``retrieve`` of a viewset.
+
+    The validators come from a single aggregate over the filtered queryset:
+    ``Max`` of each field in ``conditional_timestamp_fields`` and a distinct
+    ``Count`` of each field in ``conditional_count_fields`` (counts catch
+    deletions that leave the max timestamp unchanged). Include nested
+    relations (e.g. ``slides__updated_at``) when the serializer renders them.
+    """
+
+    conditional_timestamp_fields = ("updated_at",)
+    conditional_count_fields = ("pk",)
+
+    def get_content_validators(self, queryset):
+        aggregates = {}
+        for index, field in enumerate(self.conditional_timestamp_fields):
+            aggregates[f"ts_{index}"] = Max(field)
+        for index, field in enumerate(self.conditional_count_fields):
+            aggregates[f"count_{index}"] = Count(field, distinct=True)
+
+        values = queryset.order_by().aggregate(**aggregates)
+        stamps = [
+            values[f"ts_{index}"]
+            for index in range(len(self.conditional_timestamp_fields))
+        ]
+        counts = [
+            values[f"count_{index}"]
+            for index in range(len(self.conditional_count_fields))
+        ]
+
+        etag = make_etag(
+            self.__class__.__name__,
+            self.action,
+            self.request.get_full_path(),
+            getattr(self.request.user, "is_staff", False),
+            *[stamp.isoformat() if stamp else None for stamp in stamps],
+            *counts,
+        )
+        present = [stamp for stamp in stamps if stamp]
+        return etag, (max(present) if present else None)
+
+    def list(self, request, *args, **kwargs):
+        etag, last_modified = self.get_content_validators(
+            self.filter_queryset(self.get_queryset())
+        )
+        return conditional_response(
+            request, etag, last_modified,
+            partial(super().list, request, *args, **kwargs),
+        )
+
+    def retrieve(self, request, *args, **kwargs):
+        lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+        try:
+            queryset = self.filter_queryset(self.get_queryset()).filter(
+                **{self.lookup_field: kwargs[lookup_url_kwarg]}
+            )
+            etag, last_modified = self.get_content_validators(queryset)
+        except (TypeError, ValueError, DjangoValidationError):
+            # Malformed lookup value; let the regular retrieve answer 404.
+            return super().retrieve(request, *args, **kwargs)
+        return conditional_response(
+            request, etag, last_modified,
+            partial(super().retrieve, request, *args, **kwargs),
+        )
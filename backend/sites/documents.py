@@ -0,0 +1,191 @@
+# [DOCS] Denormalized page content documents
+
+"""
+``Page.content_document`` holds a precomputed copy of a page's sections and
+fields so read endpoints do not have to reassemble hundreds of ``Field``
+rows on every request:
+
+    {
+        "sections": [
+            {
+                "id": 1, "identifier": "...", "internal_name": "...", "order": 0,
+                "values": {"title": "...", ...},
+                "fields": [
+                    {"id": 1, "key": "title", "label": "...", "value": "...",
+                     "order": 0, "created_at": "...", "updated_at": "..."},
+                ],
+            },
+        ],
+    }
+
+Documents are rebuilt inside the writing transaction whenever a Section or
+Field of the page changes (sites/signals.py); every rebuild also bumps
+``Page.version`` (optimistic concurrency for the page batch save endpoint).
+Code that writes many rows at
+once can wrap the work in ``deferred_page_documents()`` so each touched page
+is rebuilt once at the end instead of once per row.
+
+``python manage.py page_documents`` backfills and verifies documents.
+"""
+
+import threading
+from contextlib import contextmanager
+from typing import Dict, Iterable, List
+
+from django.db import transaction
+from django.db.models import F
+from rest_framework.fields import DateTimeField
+
+from .models import Field, Page, Section
+
+
+_state = threading.local()
+_datetime_field = DateTimeField()
+
+
+def _format_datetime(value):
+    # Same representation as the DRF serializers' DateTimeField
+    return _datetime_field.to_representation(value)
+
+
+def build_page_documents(page_ids: Iterable[int]) -> Dict[int, dict]:
+    """Build documents for several pages with two queries."""
+    page_ids = list(page_ids)
+    documents = {page_id: {"sections": []} for page_id in page_ids}
+    if not page_ids:
+        return documents
+
+    sections_by_id = {}
+    section_rows = (
+        Section.objects.filter(page_id__in=page_ids)
+        .order_by("order", "id")
+        .values("id", "page_id", "identifier", "internal_name", "order")
+    )
+    for row in section_rows:
+        section = {
+            "id": row["id"],
+            "identifier": row["identifier"],
+            "internal_name": row["internal_name"],
+            "order": row["order"],
+            "values": {},
+            "fields": [],
+        }
+        sections_by_id[row["id"]] = section
+        documents[row["page_id"]]["sections"].append(section)
+
+    if sections_by_id:
+        field_rows = (
+            Field.objects.filter(section_id__in=sections_by_id.keys())
+            .order_by("order", "id")
+            .values("id", "section_id", "key", "label", "value", "order", "created_at", "updated_at")
+        )
+        for row in field_rows:
+            section = sections_by_id[row["section_id"]]
+            section["values"][row["key"]] = row["value"]
+            section["fields"].append({
+                "id": row["id"],
+                "key": row["key"],
+                "label": row["label"],
+                "value": row["value"],
+                "order": row["order"],
+                "created_at": _format_datetime(row["created_at"]),
+                "updated_at": _format_datetime(row["updated_at"]),
+            })
+
+    return documents
+
+
+def rebuild_page_documents(page_ids: Iterable[int], bump_version: bool = True) -> int:
+    """
+    Recompute and store the documents of the given pages, bumping each
+    page's ``version`` unless ``bump_version`` is false. Returns the number
+    of pages updated. Runs atomically so readers never see half the set.
+    """
+    page_ids = {page_id for page_id in page_ids if page_id is not None}
+    if not page_ids:
+        return 0
+
+    pending = getattr(_state, "pending", None)
+    if pending is not None:
+        pending.update(page_ids)
+        return 0
+
+    changes = {"version": F("version") + 1} if bump_version else {}
+    updated = 0
+    with transaction.atomic():
+        for page_id, document in build_page_documents(page_ids).items():
+            # Queryset update: no Page save signals, no updated_at churn
+            updated += Page.objects.filter(id=page_id).update(
+                content_document=document, **changes
+            )
+    return updated
+
+
+@contextmanager
+def deferred_page_documents(bump_version: bool = True):
+    """
+    Collect page document rebuilds requested inside the block and run them
+    once on exit. Nested blocks are merged into the outermost one.
+    """
+    if getattr(_state, "pending", None) is not None:
+        yield
+        return
+
+    _state.pending = set()
+    try:
+        yield
+    except BaseException:
+        _state.pending = None
+        raise
+    page_ids, _state.pending = _state.pending, None
+    rebuild_page_documents(page_ids, bump_version=bump_version)
+
+
+def has_document(document) -> bool:
+    return isinstance(document, dict) and isinstance(document.get("sections"), list)
+
+
+def public_sections(document: dict) -> List[dict]:
+    """Sections in the shape of SectionPublicSerializer."""
+    return [
+        {
+            "id": section["id"],
+            "identifier": section["identifier"],
+            "internal_name": section["internal_name"],
+            "order": section["order"],
+            "fields": [
+                {
+                    "key": field["key"],
+                    "label": field["label"],
+                    "value": field["value"],
+                    "order": field["order"],
+                }
+                for field in section["fields"]
+            ],
+        }
+        for section in document["sections"]
+    ]
+
+
+def snapshot_sections(document: dict) -> List[dict]:
+    """Sections in the shape of SectionWithFieldsSerializer."""
+    return [
+        {
+            "id": section["id"],
+            "identifier": section["identifier"],
+            "internal_name": section["internal_name"],
+            "order": section["order"],
+            "fields": [
+                {
+                    "id": field["id"],
+                    "key": field["key"],
+                    "label": field["label"],
+                    "value": field["value"],
+                    "created_at": field["created_at"],
+                    "updated_at": field["updated_at"],
+                }
+                for field in section["fields"]
+            ],
+        }
+        for section in document["sections"]
+    ]
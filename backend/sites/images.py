@@ -0,0 +1,180 @@
+# [IMAGES] Screenshot inspection and normalization for vision calls
+
+"""
+Uploaded screenshots are inspected on upload (real MIME type and size,
+read from the file header only) and normalized before they are sent to the
+vision model:
+
+- EXIF orientation is applied and all metadata is dropped
+- the image is scaled down to ``SITES_DRAFT_IMAGE_MAX_DIMENSION`` wide
+- tall full-page screenshots are cut into overlapping tiles of at most
+  that height (``SITES_DRAFT_IMAGE_MAX_TILES``; taller pages are scaled
+  down further to fit)
+- every tile is re-encoded as ``SITES_DRAFT_IMAGE_FORMAT``
+
+so the model receives a few compact images instead of a multi-megabyte
+original labelled with whatever MIME type.
+"""
+
+import hashlib
+import io
+import math
+from typing import IO, List
+
+from django.conf import settings
+from PIL import Image, ImageOps, UnidentifiedImageError
+
+
+IMAGE_FORMAT_MIME_TYPES = {
+    "JPEG": "image/jpeg",
+    "PNG": "image/png",
+    "WEBP": "image/webp",
+    "GIF": "image/gif",
+}
+
+
+class UnsupportedImage(ValueError):
+    """The file is not a raster image the vision model can read."""
+
+
+def get_image_max_dimension() -> int:
+    return getattr(settings, "SITES_DRAFT_IMAGE_MAX_DIMENSION", 1568)
+
+
+def get_image_format() -> str:
+    return getattr(settings, "SITES_DRAFT_IMAGE_FORMAT", "JPEG").upper()
+
+
+def get_image_quality() -> int:
+    return getattr(settings, "SITES_DRAFT_IMAGE_QUALITY", 80)
+
+
+def get_image_max_tiles() -> int:
+    return max(1, getattr(settings, "SITES_DRAFT_IMAGE_MAX_TILES", 6))
+
+
+def get_image_tile_overlap() -> int:
+    return getattr(settings, "SITES_DRAFT_IMAGE_TILE_OVERLAP", 128)
+
+
+def inspect_image(file: IO[bytes]) -> dict:
+    """
+    MIME type and dimensions of an uploaded image, read from its header.
+    Raises UnsupportedImage for anything but PNG, JPEG, WebP and GIF; SVG
+    files get their own message since the vision model cannot read them.
+    """
+    position = file.tell()
+    try:
+        with Image.open(file) as image:
+            mime_type = IMAGE_FORMAT_MIME_TYPES.get(image.format)
+            if mime_type is None:
+                raise UnsupportedImage(f"Unsupported image format '{image.format}'.")
+            return {"mime_type": mime_type, "image_width": image.width, "image_height": image.height}
+    except (UnidentifiedImageError, Image.DecompressionBombError):
+        file.seek(position)
+        head = file.read(1024).lstrip()
+        if head.startswith(b"<?xml") or head.startswith(b"<svg") or b"<svg" in head:
+            raise UnsupportedImage("SVG files are not supported; upload a PNG, JPEG, WebP or GIF screenshot.")
+        raise UnsupportedImage("The file is not a valid image.")
+    finally:
+        file.seek(position)
+
+
+# [AI-CACHE] Fingerprints for the screenshot analysis cache
+def fingerprint_file(file: IO[bytes]) -> str:
+    """SHA-256 of the file content; the read position is restored."""
+    position = file.tell()
+    file.seek(0)
+    digest = hashlib.sha256()
+    for chunk in iter(lambda: file.read(64 * 1024), b""):
+        digest.update(chunk)
+    file.seek(position)
+    return digest.hexdigest()
+
+
+def fingerprint_normalized(normalized: dict) -> str:
+    """
+    SHA-256 of a ``normalize_screenshot`` result: the same picture saved
+    with different metadata or orientation tags gives the same value.
+    """
+    digest = hashlib.sha256(normalized["mime_type"].encode())
+    for tile in normalized["tiles"]:
+        digest.update(len(tile).to_bytes(8, "big"))
+        digest.update(tile)
+    return digest.hexdigest()
+
+
+def _tile_boxes(width: int, height: int, tile_height: int, overlap: int) -> List[tuple]:
+    if height <= tile_height:
+        return [(0, 0, width, height)]
+    step = tile_height - overlap
+    count = math.ceil((height - overlap) / step)
+    boxes = []
+    for index in range(count):
+        # The last tile is aligned to the bottom edge
+        top = min(index * step, height - tile_height)
+        boxes.append((0, top, width, top + tile_height))
+    return boxes
+
+
+def normalize_screenshot(file: IO[bytes]) -> dict:
+    """
+    Decode, downscale, strip and tile a screenshot. Returns a dict with the
+    ``mime_type`` of the tiles, the normalized ``width``/``height`` and the
+    encoded ``tiles`` (bytes, top to bottom). Raises UnsupportedImage.
+    """
+    max_dimension = get_image_max_dimension()
+    max_tiles = get_image_max_tiles()
+    overlap = min(get_image_tile_overlap(), max_dimension // 2)
+    image_format = get_image_format()
+    mime_type = IMAGE_FORMAT_MIME_TYPES.get(image_format)
+    if mime_type is None:
+        raise UnsupportedImage(f"Unsupported output format '{image_format}'.")
+
+    try:
+        image = Image.open(file)
+    except (UnidentifiedImageError, Image.DecompressionBombError) as exc:
+        raise UnsupportedImage("The screenshot is not a raster image (PNG, JPEG, WebP or GIF).") from exc
+
+    with image:
+        # JPEG: decode at a reduced scale right away
+        image.draft("RGB", (max_dimension, max_dimension * max_tiles))
+        image = ImageOps.exif_transpose(image)
+
+        if image.mode in ("RGBA", "LA", "P"):
+            image = image.convert("RGBA")
+            background = Image.new("RGB", image.size, "white")
+            background.paste(image, mask=image.getchannel("A"))
+            image = background
+        elif image.mode != "RGB":
+            image = image.convert("RGB")
+
+        scale = min(1.0, max_dimension / image.width)
+        # Taller than the tiles can cover: scale down to fit
+        step = max_dimension - overlap
+        max_height = max_tiles * step + overlap
+        if image.height * scale > max_height:
+            scale = max_height / image.height
+        if scale < 1.0:
+            size = (max(1, round(image.width * scale)), max(1, round(image.height * scale)))
+            image = image.resize(size, Image.Resampling.LANCZOS)
+
+        tiles = []
+        for box in _tile_boxes(image.width, image.height, max_dimension, overlap):
+            buffer = io.BytesIO()
+            tile = image.crop(box)
+            # No exif/icc arguments: the output carries no metadata
+            if image_format == "JPEG":
+                tile.save(buffer, "JPEG", quality=get_image_quality(), optimize=True)
+            elif image_format == "WEBP":
+                tile.save(buffer, "WEBP", quality=get_image_quality(), method=4)
+            else:
+                tile.save(buffer, image_format, optimize=True)
+            tiles.append(buffer.getvalue())
+
+        return {
+            "mime_type": mime_type,
+            "width": image.width,
+            "height": image.height,
+            "tiles": tiles,
+        }
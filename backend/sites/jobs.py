@@ -0,0 +1,411 @@
+# [JOBS] Database-backed background jobs
+
+"""
+Long operations (project clones, skeleton generation, bulk admin actions)
+are stored as ``BackgroundJob`` rows and executed by
+``python manage.py run_jobs`` so they never hold a web worker.
+
+    job = enqueue_job("clone_project", {"source_project_id": "..."}, user=request.user)
+
+Handlers are registered with ``@job_handler("kind")``. They receive the job,
+may call ``report_progress(job, current, total, message)`` and return a
+JSON-serializable result dict. A handler that raises is retried until
+``max_attempts`` is reached (waiting ``SITES_JOB_RETRY_DELAY`` seconds times
+the attempt number), then the job is marked failed with the traceback.
+
+Workers claim jobs with a conditional UPDATE (queued -> running), so any
+number of worker threads or processes can share the queue. While a handler
+runs, a heartbeat thread refreshes the job's lock every
+``SITES_JOB_HEARTBEAT_INTERVAL`` seconds on its own database connection, so
+handlers that work inside one long transaction (clones, skeletons) stay
+locked too; ``report_progress`` refreshes it as well. Every worker sweeps the
+queue every ``SITES_JOB_STALE_SWEEP_INTERVAL`` seconds and releases running
+jobs without a heartbeat for ``SITES_JOB_STALE_TIMEOUT`` seconds (crashed
+worker). Only the worker still holding a job records its outcome.
+"""
+
+import logging
+import os
+import socket
+import threading
+import time
+import traceback
+from datetime import timedelta
+from typing import Callable, Dict, Iterable, Optional
+
+from django.conf import settings
+from django.db import close_old_connections, connection
+from django.db.models import F
+from django.utils import timezone
+
+from .models import BackgroundJob, Field, Page, Section, SiteProject, SiteTemplate
+
+
+logger = logging.getLogger(__name__)
+
+JOB_HANDLERS: Dict[str, Callable[[BackgroundJob], Optional[dict]]] = {}
+
+
+def get_job_poll_interval() -> float:
+    return getattr(settings, "SITES_JOB_POLL_INTERVAL", 2.0)
+
+
+def get_job_stale_timeout() -> int:
+    return getattr(settings, "SITES_JOB_STALE_TIMEOUT", 30 * 60)
+
+
+def get_job_retry_delay() -> int:
+    return getattr(settings, "SITES_JOB_RETRY_DELAY", 30)
+
+
+def get_job_stale_sweep_interval() -> float:
+    return getattr(settings, "SITES_JOB_STALE_SWEEP_INTERVAL", 60)
+
+
+def get_job_heartbeat_interval() -> float:
+    return getattr(settings, "SITES_JOB_HEARTBEAT_INTERVAL", 60)
+
+
+def job_handler(kind: str):
+    """Register the decorated function as the handler of ``kind`` jobs."""
+    def decorator(func):
+        JOB_HANDLERS[kind] = func
+        return func
+    return decorator
+
+
+def enqueue_job(kind: str, payload: Optional[dict] = None, *, user=None, max_attempts: int = 1) -> BackgroundJob:
+    if kind not in JOB_HANDLERS:
+        raise ValueError(f"Unknown job kind '{kind}'")
+    return BackgroundJob.objects.create(
+        kind=kind,
+        payload=payload or {},
+        created_by=user if user is not None and user.is_authenticated else None,
+        max_attempts=max(1, max_attempts),
+    )
+
+
+def _update(job: BackgroundJob, *, held_by: Optional[str] = None, **changes) -> bool:
+    # Queryset update: progress writes must not clobber other columns
+    changes["updated_at"] = timezone.now()
+    rows = BackgroundJob.objects.filter(pk=job.pk)
+    if held_by is not None:
+        # Only while the job is still running under this worker's lock
+        rows = rows.filter(status=BackgroundJob.STATUS_RUNNING, locked_by=held_by)
+    if not rows.update(**changes):
+        return False
+    for attr, value in changes.items():
+        setattr(job, attr, value)
+    return True
+
+
+def report_progress(job: BackgroundJob, current: int, total: Optional[int] = None, message: Optional[str] = None) -> None:
+    """
+    Record handler progress; visible to the status endpoint immediately
+    (unless the handler is inside a transaction). Also refreshes the job's
+    lock.
+    """
+    changes = {"progress_current": current}
+    if job.status == BackgroundJob.STATUS_RUNNING:
+        changes["locked_at"] = timezone.now()
+    if total is not None:
+        changes["progress_total"] = total
+    if message is not None:
+        changes["progress_message"] = message[:255]
+    _update(job, **changes)
+
+
+def default_worker_id() -> str:
+    return f"{socket.gethostname()}:{os.getpid()}:{threading.get_ident()}"
+
+
+def claim_next_job(worker_id: str, kinds: Optional[Iterable[str]] = None) -> Optional[BackgroundJob]:
+    """Atomically move the oldest due job from queued to running."""
+    now = timezone.now()
+    candidates = BackgroundJob.objects.filter(
+        status=BackgroundJob.STATUS_QUEUED, run_after__lte=now
+    ).order_by("run_after", "created_at")
+    if kinds:
+        candidates = candidates.filter(kind__in=list(kinds))
+
+    for job_id in candidates.values_list("id", flat=True)[:10]:
+        claimed = BackgroundJob.objects.filter(
+            id=job_id, status=BackgroundJob.STATUS_QUEUED
+        ).update(
+            status=BackgroundJob.STATUS_RUNNING,
+            locked_by=worker_id[:100],
+            locked_at=now,
+            started_at=now,
+            attempts=F("attempts") + 1,
+            updated_at=now,
+        )
+        if claimed:
+            return BackgroundJob.objects.get(id=job_id)
+    return None
+
+
+def _heartbeat(job_id, worker_id: str, stop_event: threading.Event) -> None:
+    """Refresh a running job's lock until ``stop_event`` is set."""
+    try:
+        while not stop_event.wait(get_job_heartbeat_interval()):
+            BackgroundJob.objects.filter(
+                pk=job_id, status=BackgroundJob.STATUS_RUNNING, locked_by=worker_id
+            ).update(locked_at=timezone.now())
+    finally:
+        # This thread's own connection
+        connection.close()
+
+
+def run_job(job: BackgroundJob) -> BackgroundJob:
+    """
+    Execute a claimed job and record its outcome, unless the job was
+    released (stale sweep) while it ran; then the outcome is dropped.
+    """
+    handler = JOB_HANDLERS.get(job.kind)
+    worker_id = job.locked_by
+    stop_heartbeat = threading.Event()
+    heartbeat = threading.Thread(
+        target=_heartbeat, args=(job.pk, worker_id, stop_heartbeat), name=f"job-heartbeat-{job.pk}", daemon=True
+    )
+    heartbeat.start()
+    try:
+        if handler is None:
+            raise LookupError(f"No handler registered for job kind '{job.kind}'")
+        result = handler(job) or {}
+    except Exception:
+        logger.exception("Background job %s (%s) failed", job.pk, job.kind)
+        now = timezone.now()
+        released = {"locked_by": "", "locked_at": None, "error": traceback.format_exc()}
+        if handler is not None and job.attempts < job.max_attempts:
+            recorded = _update(
+                job,
+                held_by=worker_id,
+                status=BackgroundJob.STATUS_QUEUED,
+                run_after=now + timedelta(seconds=get_job_retry_delay() * job.attempts),
+                **released,
+            )
+        else:
+            recorded = _update(
+                job, held_by=worker_id, status=BackgroundJob.STATUS_FAILED, finished_at=now, **released
+            )
+    else:
+        recorded = _update(
+            job,
+            held_by=worker_id,
+            status=BackgroundJob.STATUS_SUCCEEDED,
+            result=result,
+            error="",
+            finished_at=timezone.now(),
+            locked_by="",
+            locked_at=None,
+        )
+    finally:
+        stop_heartbeat.set()
+        heartbeat.join()
+
+    if not recorded:
+        logger.warning("Background job %s (%s) was released while running; outcome dropped", job.pk, job.kind)
+    return job
+
+
+def requeue_stale_jobs() -> int:
+    """
+    Put running jobs whose worker stopped responding (no claim or progress
+    heartbeat for SITES_JOB_STALE_TIMEOUT seconds) back in the queue, or
+    fail them when they are out of attempts. Returns the number of jobs.
+    """
+    now = timezone.now()
+    stale = BackgroundJob.objects.filter(
+        status=BackgroundJob.STATUS_RUNNING,
+        locked_at__lt=now - timedelta(seconds=get_job_stale_timeout()),
+    )
+    released = {"locked_by": "", "locked_at": None, "updated_at": now}
+    requeued = stale.filter(attempts__lt=F("max_attempts")).update(
+        status=BackgroundJob.STATUS_QUEUED, run_after=now, **released
+    )
+    failed = stale.update(
+        status=BackgroundJob.STATUS_FAILED,
+        error="Worker stopped responding.",
+        finished_at=now,
+        **released,
+    )
+    return requeued + failed
+
+
+def run_worker(
+    stop_event: threading.Event,
+    *,
+    worker_id: Optional[str] = None,
+    kinds: Optional[Iterable[str]] = None,
+    poll_interval: Optional[float] = None,
+    burst: bool = False,
+) -> int:
+    """
+    Claim and run jobs until ``stop_event`` is set (or, with ``burst``, until
+    the queue is empty), releasing stale jobs between them. Returns the
+    number of jobs processed.
+    """
+    worker_id = worker_id or default_worker_id()
+    poll_interval = get_job_poll_interval() if poll_interval is None else poll_interval
+    processed = 0
+    next_sweep = time.monotonic() + get_job_stale_sweep_interval()
+    try:
+        while not stop_event.is_set():
+            close_old_connections()
+            if time.monotonic() >= next_sweep:
+                released = requeue_stale_jobs()
+                if released:
+                    logger.warning("Released %s stale background jobs", released)
+                next_sweep = time.monotonic() + get_job_stale_sweep_interval()
+            job = claim_next_job(worker_id, kinds)
+            if job is None:
+                if burst:
+                    break
+                stop_event.wait(poll_interval)
+                continue
+            run_job(job)
+            processed += 1
+    finally:
+        close_old_connections()
+    return processed
+
+
+# Handlers
+
+def _project_counts(project_id) -> dict:
+    return {
+        "pages_cloned": Page.objects.filter(project_id=project_id).count(),
+        "sections_cloned": Section.objects.filter(page__project_id=project_id).count(),
+        "fields_cloned": Field.objects.filter(section__page__project_id=project_id).count(),
+    }
+
+
+@job_handler("clone_project")
+def clone_project_job(job: BackgroundJob) -> dict:
+    from django.contrib.auth.models import User
+    from .utils import bulk_clone_project
+
+    payload = job.payload
+    source_project = SiteProject.objects.get(id=payload["source_project_id"])
+    owner = User.objects.get(id=payload["owner_id"]) if payload.get("owner_id") else None
+
+    report_progress(job, 0, 1, f'Cloning "{source_project.name}"')
+    new_project, counts = bulk_clone_project(
+        source_project,
+        owner=owner,
+        name=payload.get("name"),
+        slug=payload.get("slug"),
+        locales=payload.get("locales"),
+    )
+    report_progress(job, 1, 1, f'Cloned to "{new_project.name}"')
+    return {
+        "new_project_id": str(new_project.id),
+        "new_project_name": new_project.name,
+        "pages_cloned": counts["pages"],
+        "sections_cloned": counts["sections"],
+        "fields_cloned": counts["fields"],
+        "hero_slides_cloned": counts["hero_slides"],
+        "navigation_items_cloned": counts["navigation_items"],
+    }
+
+
+@job_handler("generate_skeleton")
+def generate_skeleton_job(job: BackgroundJob) -> dict:
+    from .utils import ensure_template_skeleton
+
+    site_template = SiteTemplate.objects.get(id=job.payload["site_template_id"])
+    report_progress(job, 0, 1, f'Generating skeleton for "{site_template.name}"')
+    master_project = ensure_template_skeleton(site_template)
+    report_progress(job, 1, 1, f'Generated "{master_project.name}"')
+    return {
+        "new_project_id": str(master_project.id),
+        "new_project_name": master_project.name,
+        **_project_counts(master_project.id),
+    }
+
+
+@job_handler("promote_to_master")
+def promote_to_master_job(job: BackgroundJob) -> dict:
+    from .utils import get_template_system_user
+
+    project_ids = job.payload.get("project_ids", [])
+    system_user = get_template_system_user()
+    promoted = []
+    report_progress(job, 0, len(project_ids))
+    for index, project in enumerate(SiteProject.objects.filter(id__in=project_ids), start=1):
+        if not project.is_master_template:
+            project.is_master_template = True
+            project.owner = system_user  # Assign to system user
+            project.is_active = False  # Hide from normal lists
+            project.save()
+            promoted.append(str(project.id))
+        report_progress(job, index, message=f'Processed "{project.name}"')
+    return {"promoted_project_ids": promoted, "promoted": len(promoted)}
+
+
+@job_handler("purge_project")
+def purge_project_job(job: BackgroundJob) -> dict:
+    from .purge import purge_project
+
+    project_id = job.payload["project_id"]
+    if not SiteProject.all_objects.filter(pk=project_id).exists():
+        # A previous attempt finished the purge
+        return {"project_id": project_id, "purged": True}
+
+    steps = []
+
+    def progress(message):
+        steps.append(message)
+        report_progress(job, len(steps), message=message)
+
+    counts = purge_project(project_id, progress=progress)
+    return {"project_id": project_id, "purged": True, **counts}
+
+
+@job_handler("process_section_draft")
+def process_section_draft_job(job: BackgroundJob) -> dict:
+    from .images import UnsupportedImage
+    from .models import SectionDraft
+    from .section_drafts import analyze_screenshot, get_draft_max_attempts
+
+    draft = SectionDraft.objects.select_related("project").get(id=job.payload["draft_id"])
+    if draft.job_id != job.id or draft.status != "processing":
+        # A newer attempt replaced this job (stuck draft was re-queued), or
+        # the draft already gave up
+        return {"draft_id": str(draft.id), "superseded": True}
+
+    # Only this job may write the draft from here on
+    current = SectionDraft.objects.filter(id=draft.id, job_id=job.id)
+    current.update(
+        attempts=F("attempts") + 1,
+        processing_started_at=timezone.now(),
+        updated_at=timezone.now(),
+    )
+    report_progress(job, 0, 1, "Analyzing screenshot")
+    try:
+        ai_data = analyze_screenshot(draft)
+    except UnsupportedImage as exc:
+        # [IMAGES] Retrying cannot fix the file
+        current.update(status="error", error_message=str(exc), updated_at=timezone.now())
+        return {"draft_id": str(draft.id), "error": str(exc)}
+    except Exception as exc:
+        draft.refresh_from_db(fields=["attempts"])
+        final = job.attempts >= job.max_attempts or draft.attempts >= get_draft_max_attempts()
+        current.update(
+            status="error" if final else "processing",
+            error_message=str(exc)[:1000],
+            updated_at=timezone.now(),
+        )
+        raise
+
+    current.update(
+        ai_output_json=ai_data,
+        status="ready",
+        error_message="",
+        # [AI-CACHE] Fingerprints computed while analyzing
+        content_hash=draft.content_hash,
+        image_hash=draft.image_hash,
+        updated_at=timezone.now(),
+    )
+    report_progress(job, 1, 1, "Ready")
+    return {"draft_id": str(draft.id), "sections": len(ai_data.get("sections", []))}
@@ -0,0 +1,87 @@
+# [I18N] Locale fallback chain
+
+"""
+Locale resolution shared by the page, navigation and public site APIs.
+
+A requested locale falls back to its base language ('pt-BR' -> 'pt'), then
+to the project's primary locale, then to settings.SITES_FALLBACK_LOCALE.
+"""
+
+from django.conf import settings
+from django.db import models
+from django.db.models import Case, F, Q, Value, When
+
+from .models import LocaleChoices
+
+
+def _dedupe_locales(codes):
+    chain = []
+    for code in codes:
+        if code and code.lower() not in [c.lower() for c in chain]:
+            chain.append(code)
+    return chain
+
+
+def _requested_locales(locale):
+    """The requested locale followed by its base language ('pt-BR' -> 'pt')."""
+    if not locale:
+        return []
+    return _dedupe_locales([locale, locale.replace('_', '-').split('-', 1)[0]])
+
+
+def get_locale_fallback_chain(locale, primary_locale=None):
+    """
+    Return the ordered list of locales to try for a requested locale:
+    requested locale, its base language ('pt-BR' -> 'pt'), the project's
+    primary locale (when given) and finally settings.SITES_FALLBACK_LOCALE.
+    Duplicates (compared case-insensitively) are dropped.
+    """
+    fallback = getattr(settings, 'SITES_FALLBACK_LOCALE', 'en')
+    return _dedupe_locales(_requested_locales(locale) + [primary_locale, fallback])
+
+
+def normalize_locale(locale, primary_locale=None):
+    """
+    Map a requested locale to a supported one (LocaleChoices): the locale
+    itself or its base language ('pt-BR' -> 'pt'), else the project's
+    primary locale, else settings.SITES_FALLBACK_LOCALE. Returns None when
+    no locale was requested.
+
+    Pages and navigation items only use supported locales, so requested
+    locales with the same normalized code resolve to the same content.
+    """
+    locale = (locale or '').strip()
+    if not locale:
+        return None
+    fallback = getattr(settings, 'SITES_FALLBACK_LOCALE', 'en')
+    supported = {code.lower(): code for code in LocaleChoices.values}
+    for code in _requested_locales(locale) + _requested_locales(primary_locale) + [fallback]:
+        if code.lower() in supported:
+            return supported[code.lower()]
+    return fallback
+
+
+def annotate_locale_rank(queryset, locale):
+    """
+    Restrict a queryset of a model with ``locale`` and ``project`` fields
+    (Page, NavigationItem) to the locales in the fallback chain for
+    ``locale`` and annotate each row with ``locale_rank`` (0 = best match).
+
+    The project's primary_locale is taken from the joined project row, so
+    the chain needs no extra query even across several projects.
+    """
+    requested = _requested_locales(locale)
+    fallback = getattr(settings, 'SITES_FALLBACK_LOCALE', 'en')
+
+    # Locale tags are case-insensitive ('pt-br' == 'pt-BR')
+    whens = [When(locale__iexact=code, then=Value(rank)) for rank, code in enumerate(requested)]
+    whens.append(When(locale=F('project__primary_locale'), then=Value(len(requested))))
+    whens.append(When(locale__iexact=fallback, then=Value(len(requested) + 1)))
+
+    matches = Q(locale=F('project__primary_locale'))
+    for code in requested + [fallback]:
+        matches |= Q(locale__iexact=code)
+
+    return queryset.filter(matches).annotate(
+        locale_rank=Case(*whens, output_field=models.IntegerField())
+    )
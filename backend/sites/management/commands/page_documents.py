@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+# [DOCS] Backfill and verify denormalized page content documents
+
+Rebuilds Page.content_document from the Section/Field rows, or (with
+--verify) only reports pages whose stored document is missing or out of
+date.
+
+Usage:
+    python manage.py page_documents
+    python manage.py page_documents --project marys-restaurant
+    python manage.py page_documents --verify
+"""
+
+from django.core.management.base import BaseCommand, CommandError
+from sites.documents import build_page_documents, rebuild_page_documents
+from sites.models import Page
+
+
+class Command(BaseCommand):
+    help = 'Backfill or verify the precomputed content document of each page'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--project',
+            help='Only process pages of the project with this slug',
+        )
+        parser.add_argument(
+            '--verify',
+            action='store_true',
+            help='Report stale or missing documents without writing; exits non-zero if any are found',
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=200,
+            help='Pages processed per batch (default: 200)',
+        )
+
+    def handle(self, *args, **options):
+        pages = Page.objects.order_by('id')
+        if options['project']:
+            pages = pages.filter(project__slug=options['project'])
+
+        page_ids = list(pages.values_list('id', flat=True))
+        batch_size = max(1, options['batch_size'])
+        verify = options['verify']
+
+        self.stdout.write(
+            f"🧩 {'Verifying' if verify else 'Rebuilding'} content documents for {len(page_ids)} pages..."
+        )
+
+        stale = []
+        rebuilt = 0
+        for start in range(0, len(page_ids), batch_size):
+            batch = page_ids[start:start + batch_size]
+            if verify:
+                expected = build_page_documents(batch)
+                stored = dict(
+                    Page.objects.filter(id__in=batch).values_list('id', 'content_document')
+                )
+                stale.extend(
+                    page_id for page_id in batch
+                    if stored.get(page_id) != expected[page_id]
+                )
+            else:
+                rebuilt += rebuild_page_documents(batch)
+
+        if not verify:
+            self.stdout.write(self.style.SUCCESS(f'✅ Rebuilt {rebuilt} page documents'))
+            return
+
+        if stale:
+            for page_id in stale:
+                self.stdout.write(self.style.WARNING(f'⚠️  Page {page_id}: document missing or stale'))
+            raise CommandError(
+                f'{len(stale)} of {len(page_ids)} page documents are stale. '
+                f'Run "python manage.py page_documents" to rebuild them.'
+            )
+        self.stdout.write(self.style.SUCCESS(f'✅ All {len(page_ids)} page documents are up to date'))
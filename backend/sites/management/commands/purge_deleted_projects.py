@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+# [PURGE] Purge soft-deleted projects and orphaned screenshot files
+
+Deleted projects are normally purged by a background job queued when they
+are deleted. This command purges any that are still left (for example after
+the job ran out of attempts) and removes screenshot files no row references.
+Safe to run from cron.
+
+Usage:
+    python manage.py purge_deleted_projects
+    python manage.py purge_deleted_projects --media
+    python manage.py purge_deleted_projects --media --dry-run
+"""
+
+from django.core.management.base import BaseCommand
+from sites.models import SiteProject
+from sites.purge import purge_orphaned_media, purge_project
+
+
+class Command(BaseCommand):
+    help = 'Purge soft-deleted projects in chunks and optionally remove orphaned media'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=None,
+            help='Rows per transaction (default: SITES_PURGE_CHUNK_SIZE)',
+        )
+        parser.add_argument(
+            '--media',
+            action='store_true',
+            help='Also remove unreferenced screenshot files',
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Only list what would be removed',
+        )
+
+    def handle(self, *args, **options):
+        deleted = SiteProject.all_objects.filter(deleted_at__isnull=False).order_by('deleted_at')
+        for project in deleted:
+            if options['dry_run']:
+                self.stdout.write(f'Would purge "{project.name}" ({project.pk})')
+                continue
+            counts = purge_project(project.pk, chunk_size=options['chunk_size'])
+            summary = ', '.join(f'{count} {name.replace("_", " ")}' for name, count in counts.items() if count)
+            self.stdout.write(self.style.SUCCESS(f'🗑️  Purged "{project.name}": {summary or "no content"}'))
+
+        if options['media']:
+            orphans = purge_orphaned_media(dry_run=options['dry_run'])
+            verb = 'Would remove' if options['dry_run'] else 'Removed'
+            for name in orphans:
+                self.stdout.write(f'  {name}')
+            self.stdout.write(self.style.SUCCESS(f'✅ {verb} {len(orphans)} orphaned media files'))
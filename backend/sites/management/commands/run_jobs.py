@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+# [JOBS] Background job worker
+
+Runs queued BackgroundJob rows (project clones, skeleton generation, bulk
+admin actions) in worker threads. Run one or more of these next to the web
+server; workers on several hosts can share the same queue.
+
+Usage:
+    python manage.py run_jobs
+    python manage.py run_jobs --concurrency 4
+    python manage.py run_jobs --burst              # exit when the queue is empty
+    python manage.py run_jobs --kind clone_project
+"""
+
+import threading
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from sites.jobs import JOB_HANDLERS, default_worker_id, requeue_stale_jobs, run_worker
+
+
+class Command(BaseCommand):
+    help = 'Process queued background jobs'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--concurrency',
+            type=int,
+            default=getattr(settings, 'SITES_JOB_WORKER_CONCURRENCY', 2),
+            help='Number of worker threads (default: SITES_JOB_WORKER_CONCURRENCY)',
+        )
+        parser.add_argument(
+            '--kind',
+            action='append',
+            choices=sorted(JOB_HANDLERS),
+            help='Only process jobs of this kind (repeatable)',
+        )
+        parser.add_argument(
+            '--poll-interval',
+            type=float,
+            default=None,
+            help='Seconds to wait when the queue is empty (default: SITES_JOB_POLL_INTERVAL)',
+        )
+        parser.add_argument(
+            '--burst',
+            action='store_true',
+            help='Exit once the queue is empty instead of waiting for new jobs',
+        )
+
+    def handle(self, *args, **options):
+        concurrency = max(1, options['concurrency'])
+        stop_event = threading.Event()
+        processed = []
+
+        requeued = requeue_stale_jobs()
+        if requeued:
+            self.stdout.write(self.style.WARNING(f'⚠️  Released {requeued} stale jobs'))
+
+        def work(index):
+            processed.append(run_worker(
+                stop_event,
+                worker_id=f'{default_worker_id()}:{index}',
+                kinds=options['kind'],
+                poll_interval=options['poll_interval'],
+                burst=options['burst'],
+            ))
+
+        self.stdout.write(f'⚙️  Starting {concurrency} job worker threads...')
+        threads = [
+            threading.Thread(target=work, args=(index,), name=f'run_jobs-{index}', daemon=True)
+            for index in range(concurrency)
+        ]
+        for thread in threads:
+            thread.start()
+
+        try:
+            while any(thread.is_alive() for thread in threads):
+                for thread in threads:
+                    thread.join(timeout=1)
+        except KeyboardInterrupt:
+            self.stdout.write('🛑 Stopping after the running jobs finish...')
+            stop_event.set()
+            for thread in threads:
+                thread.join()
+
+        self.stdout.write(self.style.SUCCESS(f'✅ Processed {sum(processed)} jobs'))
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.8 on 2026-10-18 09:12
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('sites', '0039_auto_20251119_0248'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='siteproject',
+            name='content_updated_at',
+            field=models.DateTimeField(default=django.utils.timezone.now, editable=False, help_text='Bumped whenever pages, sections, fields or navigation of this project change.'),
+        ),
+    ]
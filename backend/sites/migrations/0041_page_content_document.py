@@ -0,0 +1,18 @@
+# Generated by Django 5.2.8 on 2026-10-18 13:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('sites', '0040_siteproject_content_updated_at'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='page',
+            name='content_document',
+            field=models.JSONField(blank=True, default=dict, editable=False, help_text="Denormalized copy of this page's sections and fields, rebuilt on write."),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.8 on 2026-10-18 13:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('sites', '0041_page_content_document'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='page',
+            name='version',
+            field=models.PositiveIntegerField(default=1, editable=False, help_text='Incremented on every change to this page or its content.'),
+        ),
+    ]
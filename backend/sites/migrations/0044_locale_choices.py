@@ -0,0 +1,26 @@
+# Generated by Django 5.2.8 on 2026-10-18 15:10
+
+from django.db import migrations, models
+
+
+LOCALE_CHOICES = [('en', 'English'), ('pt', 'Português'), ('nl', 'Nederlands'), ('fr', 'Français'), ('de', 'Deutsch'), ('es', 'Español')]
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('sites', '0043_backgroundjob'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='page',
+            name='locale',
+            field=models.CharField(choices=LOCALE_CHOICES, default='en', help_text="Content locale for this page, e.g. 'en', 'pt'.", max_length=5),
+        ),
+        migrations.AlterField(
+            model_name='navigationitem',
+            name='locale',
+            field=models.CharField(choices=LOCALE_CHOICES, default='en', help_text='Language/locale for this navigation item', max_length=5),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.8 on 2026-10-18 15:55
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('sites', '0044_locale_choices'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='sitetemplate',
+            name='skeleton_spec',
+            field=models.JSONField(blank=True, default=dict, help_text='Pages/sections/fields/navigation of the master skeleton. Empty: derived from the template sections.'),
+        ),
+    ]
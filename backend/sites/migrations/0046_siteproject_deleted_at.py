@@ -0,0 +1,18 @@
+# Generated by Django 5.2.8 on 2026-10-18 16:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('sites', '0045_sitetemplate_skeleton_spec'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='siteproject',
+            name='deleted_at',
+            field=models.DateTimeField(blank=True, db_index=True, editable=False, help_text='When the project was deleted. Its content is purged in the background.', null=True),
+        ),
+    ]
@@ -0,0 +1,34 @@
+# Generated by Django 5.2.8 on 2026-10-18 17:20
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('sites', '0046_siteproject_deleted_at'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='sectiondraft',
+            name='job',
+            field=models.ForeignKey(blank=True, help_text='Job currently processing this draft.', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='sites.backgroundjob'),
+        ),
+        migrations.AddField(
+            model_name='sectiondraft',
+            name='attempts',
+            field=models.PositiveSmallIntegerField(default=0, help_text='Number of AI processing attempts so far.'),
+        ),
+        migrations.AddField(
+            model_name='sectiondraft',
+            name='processing_started_at',
+            field=models.DateTimeField(blank=True, help_text='When the current processing attempt started.', null=True),
+        ),
+        migrations.AddField(
+            model_name='sectiondraft',
+            name='error_message',
+            field=models.TextField(blank=True, help_text='Why the last processing attempt failed.'),
+        ),
+    ]
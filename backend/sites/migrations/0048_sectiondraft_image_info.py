@@ -0,0 +1,28 @@
+# Generated by Django 5.2.8 on 2026-10-18 17:55
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('sites', '0047_sectiondraft_processing'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='sectiondraft',
+            name='mime_type',
+            field=models.CharField(blank=True, help_text='Real MIME type of the uploaded image.', max_length=50),
+        ),
+        migrations.AddField(
+            model_name='sectiondraft',
+            name='image_width',
+            field=models.PositiveIntegerField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='sectiondraft',
+            name='image_height',
+            field=models.PositiveIntegerField(blank=True, null=True),
+        ),
+    ]
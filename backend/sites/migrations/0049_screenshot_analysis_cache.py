@@ -0,0 +1,44 @@
+# Generated by Django 5.2.8 on 2026-10-18 19:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('sites', '0048_sectiondraft_image_info'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='sectiondraft',
+            name='content_hash',
+            field=models.CharField(blank=True, help_text='SHA-256 of the uploaded file.', max_length=64),
+        ),
+        migrations.AddField(
+            model_name='sectiondraft',
+            name='image_hash',
+            field=models.CharField(blank=True, help_text='SHA-256 of the normalized image sent to the AI model.', max_length=64),
+        ),
+        migrations.CreateModel(
+            name='ScreenshotAnalysis',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('content_hash', models.CharField(help_text='SHA-256 of the uploaded file.', max_length=64)),
+                ('image_hash', models.CharField(help_text='SHA-256 of the normalized image.', max_length=64)),
+                ('locale', models.CharField(blank=True, max_length=10)),
+                ('prompt_version', models.CharField(max_length=32)),
+                ('ai_output_json', models.JSONField()),
+                ('hits', models.PositiveIntegerField(default=0, help_text='Analyses answered from this entry.')),
+                ('last_used_at', models.DateTimeField(blank=True, null=True)),
+            ],
+            options={
+                'verbose_name_plural': 'screenshot analyses',
+                'ordering': ['-created_at'],
+                'indexes': [models.Index(fields=['image_hash', 'locale', 'prompt_version'], name='sites_shot_image_hash_idx')],
+                'unique_together': {('content_hash', 'locale', 'prompt_version')},
+            },
+        ),
+    ]
@@ -0,0 +1,23 @@
+# [CACHE] The default and AI suggestion caches are database tables unless
+# REDIS_URL is set
+
+from django.core.management import call_command
+from django.db import migrations
+
+
+def create_cache_tables(apps, schema_editor):
+    # No-op for non-database cache backends and existing tables
+    call_command("createcachetable", database=schema_editor.connection.alias, verbosity=0)
+
+
+class Migration(migrations.Migration):
+
+    atomic = False
+
+    dependencies = [
+        ('sites', '0049_screenshot_analysis_cache'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_cache_tables, migrations.RunPython.noop),
+    ]
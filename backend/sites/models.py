@@ -1,6 +1,7 @@
 import uuid
 from django.db import models
 from django.contrib.auth.models import User
+from django.utils import timezone
 
 
 class TimeStampedModel(models.Model):
@@ -117,12 +118,29 @@ class SiteTemplate(TimeStampedModel):
         help_text="URL for the favicon image."
     )
 
+    # [SKELETON] Declarative master project layout, see sites/skeletons.py
+    skeleton_spec = models.JSONField(
+        default=dict,
+        blank=True,
+        help_text="Pages/sections/fields/navigation of the master skeleton. Empty: derived from the template sections.",
+    )
+
     class Meta:
         ordering = ["key"]
 
     def __str__(self) -> str:
         return self.name
 
+    def clean(self):
+        super().clean()
+        if self.skeleton_spec:
+            from django.core.exceptions import ValidationError
+            from .skeletons import SkeletonSpecError, normalize_skeleton_spec
+            try:
+                normalize_skeleton_spec(self.skeleton_spec)
+            except SkeletonSpecError as e:
+                raise ValidationError({"skeleton_spec": str(e)})
+
 
 # [TEMPLAB] Template Section model for reusable section definitions
 class TemplateSection(TimeStampedModel):
@@ -341,6 +359,12 @@ class HeaderBackgroundMode(models.TextChoices):
     PARTICLES = "particles", "Particles"
 
 
+# [PURGE] Soft-deleted projects are hidden from the default manager
+class SiteProjectManager(models.Manager):
+    def get_queryset(self):
+        return super().get_queryset().filter(deleted_at__isnull=True)
+
+
 class SiteProject(TimeStampedModel):
     PRIMARY_GOAL_CHOICES = [
         ("get-leads", "Get leads / requests"),
@@ -524,11 +548,36 @@ class SiteProject(TimeStampedModel):
         help_text="Marks this project as the main Just Code Works website (HQ)."
     )
 
+    # [CACHE] Content version stamp for public payload caching
+    content_updated_at = models.DateTimeField(
+        default=timezone.now,
+        editable=False,
+        help_text="Bumped whenever pages, sections, fields or navigation of this project change.",
+    )
+
+    # [PURGE] Set on delete; the rows are removed later by a purge job
+    deleted_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        db_index=True,
+        editable=False,
+        help_text="When the project was deleted. Its content is purged in the background.",
+    )
+
+    objects = SiteProjectManager()
+    all_objects = models.Manager()  # Includes soft-deleted projects
+
     class Meta:
         ordering = ["name"]
 
     def __str__(self) -> str:
         return self.name
+
+    def soft_delete(self) -> None:
+        """Hide the project everywhere; ``sites.purge`` removes it later."""
+        self.deleted_at = timezone.now()
+        self.is_active = False
+        self.save(update_fields=["deleted_at", "is_active", "content_updated_at", "updated_at"])
     
     def get_site_type_display(self):
         """Return a clear indicator of whether this is HQ or tenant."""
@@ -542,7 +591,10 @@ class SiteProject(TimeStampedModel):
 class LocaleChoices(models.TextChoices):
     EN = "en", "English"
     PT = "pt", "Português"
-    # Later we can add: DE = "de", "Deutsch", FR = "fr", "Français", ES = "es", "Español"
+    NL = "nl", "Nederlands"
+    FR = "fr", "Français"
+    DE = "de", "Deutsch"
+    ES = "es", "Español"
 
 
 class HeroAnimationMode(models.TextChoices):
@@ -596,6 +648,20 @@ class Page(TimeStampedModel):
         help_text="If false, this page should be marked as noindex for search engines.",
     )
 
+    # [DOCS] Precomputed sections/fields document, see sites/documents.py
+    content_document = models.JSONField(
+        default=dict,
+        blank=True,
+        editable=False,
+        help_text="Denormalized copy of this page's sections and fields, rebuilt on write.",
+    )
+    # [EDITOR] Optimistic concurrency token for the page batch save endpoint
+    version = models.PositiveIntegerField(
+        default=1,
+        editable=False,
+        help_text="Incremented on every change to this page or its content.",
+    )
+
     class Meta:
         unique_together = [("project", "slug", "locale")]
         ordering = ["order", "id"]
@@ -737,6 +803,25 @@ class SectionDraft(TimeStampedModel):
         upload_to=section_draft_upload_to,
         help_text="Screenshot image (PNG/JPG/SVG) to generate section from."
     )
+    # [IMAGES] Detected from the file content on upload
+    mime_type = models.CharField(
+        max_length=50,
+        blank=True,
+        help_text="Real MIME type of the uploaded image."
+    )
+    image_width = models.PositiveIntegerField(null=True, blank=True)
+    image_height = models.PositiveIntegerField(null=True, blank=True)
+    # [AI-CACHE] Fingerprints used to reuse earlier analyses
+    content_hash = models.CharField(
+        max_length=64,
+        blank=True,
+        help_text="SHA-256 of the uploaded file."
+    )
+    image_hash = models.CharField(
+        max_length=64,
+        blank=True,
+        help_text="SHA-256 of the normalized image sent to the AI model."
+    )
     
     project = models.ForeignKey(
         'SiteProject',
@@ -776,6 +861,29 @@ class SectionDraft(TimeStampedModel):
         help_text="Locale for generated content (en, pt, etc.)."
     )
     
+    # [AI-DRAFTS] Background processing state
+    job = models.ForeignKey(
+        'BackgroundJob',
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='+',
+        help_text="Job currently processing this draft."
+    )
+    attempts = models.PositiveSmallIntegerField(
+        default=0,
+        help_text="Number of AI processing attempts so far."
+    )
+    processing_started_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        help_text="When the current processing attempt started."
+    )
+    error_message = models.TextField(
+        blank=True,
+        help_text="Why the last processing attempt failed."
+    )
+    
     class Meta:
         ordering = ['-created_at']
     
@@ -784,6 +892,34 @@ class SectionDraft(TimeStampedModel):
         return f"Section Draft ({self.status}){name_part}"
 
 
+# [AI-CACHE] Screenshot analysis cache, see sites/section_drafts.py
+class ScreenshotAnalysis(TimeStampedModel):
+    """
+    Parsed AI output for one screenshot, reused when the same image is
+    analyzed again for the same locale with the same prompt version.
+    Not tied to a project: it holds no more than the screenshot shows.
+    """
+
+    content_hash = models.CharField(max_length=64, help_text="SHA-256 of the uploaded file.")
+    image_hash = models.CharField(max_length=64, help_text="SHA-256 of the normalized image.")
+    locale = models.CharField(max_length=10, blank=True)
+    prompt_version = models.CharField(max_length=32)
+    ai_output_json = models.JSONField()
+    hits = models.PositiveIntegerField(default=0, help_text="Analyses answered from this entry.")
+    last_used_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        ordering = ["-created_at"]
+        unique_together = [("content_hash", "locale", "prompt_version")]
+        indexes = [
+            models.Index(fields=["image_hash", "locale", "prompt_version"], name="sites_shot_image_hash_idx"),
+        ]
+        verbose_name_plural = "screenshot analyses"
+
+    def __str__(self) -> str:
+        return f"Screenshot analysis {self.content_hash[:12]} ({self.locale or 'en'}, {self.prompt_version})"
+
+
 def bug_screenshot_upload_to(instance, filename):
     return f"bug_screenshots/{instance.bug_id}/{filename}"
 
@@ -1251,3 +1387,68 @@ class TestimonialSlide(TimeStampedModel):
     def __str__(self):
         return f"{self.carousel.name} - {self.customer_name}"
 
+
+
+# [JOBS] Database-backed job queue, see sites/jobs.py
+class BackgroundJob(TimeStampedModel):
+    """
+    A long-running operation (project clone, skeleton generation, ...)
+    executed by ``python manage.py run_jobs`` instead of a web worker.
+    """
+
+    STATUS_QUEUED = "queued"
+    STATUS_RUNNING = "running"
+    STATUS_SUCCEEDED = "succeeded"
+    STATUS_FAILED = "failed"
+    STATUS_CHOICES = (
+        (STATUS_QUEUED, "Queued"),
+        (STATUS_RUNNING, "Running"),
+        (STATUS_SUCCEEDED, "Succeeded"),
+        (STATUS_FAILED, "Failed"),
+    )
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    kind = models.CharField(
+        max_length=50,
+        help_text="Registered job handler, e.g. 'clone_project'.",
+    )
+    status = models.CharField(
+        max_length=20,
+        choices=STATUS_CHOICES,
+        default=STATUS_QUEUED,
+    )
+    payload = models.JSONField(default=dict, blank=True)
+    result = models.JSONField(default=dict, blank=True)
+    error = models.TextField(blank=True)
+
+    progress_current = models.PositiveIntegerField(default=0)
+    progress_total = models.PositiveIntegerField(default=0)
+    progress_message = models.CharField(max_length=255, blank=True)
+
+    attempts = models.PositiveSmallIntegerField(default=0)
+    max_attempts = models.PositiveSmallIntegerField(default=1)
+    run_after = models.DateTimeField(
+        default=timezone.now,
+        help_text="The job is not picked up before this time (used for retries).",
+    )
+    locked_by = models.CharField(max_length=100, blank=True)
+    locked_at = models.DateTimeField(null=True, blank=True)
+    started_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    created_by = models.ForeignKey(
+        User,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="background_jobs",
+    )
+
+    class Meta:
+        ordering = ["-created_at"]
+        indexes = [
+            models.Index(fields=["status", "run_after"], name="sites_job_status_run_idx"),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.kind} ({self.status})"
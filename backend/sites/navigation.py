@@ -0,0 +1,88 @@
+# [NAV] Nested navigation trees
+
+"""
+Builds header and footer menus of a project as nested trees (following
+``NavigationItem.parent``) from a single query.
+"""
+
+from .locales import annotate_locale_rank
+from .models import NavigationItem
+
+
+NAVIGATION_LOCATIONS = [code for code, _ in NavigationItem.LOCATION_CHOICES]
+
+NAV_ITEM_VALUES = (
+    "id",
+    "parent_id",
+    "location",
+    "locale",
+    "column",
+    "label",
+    "page_id",
+    "page__slug",
+    "page__path",
+    "url",
+    "is_external",
+    "order",
+)
+
+
+def _node(row: dict) -> dict:
+    return {
+        "id": row["id"],
+        "label": row["label"],
+        "page": row["page_id"],
+        "page_slug": row["page__slug"],
+        "page_path": row["page__path"],
+        "url": row["url"],
+        "is_external": row["is_external"],
+        "column": row["column"],
+        "order": row["order"],
+        "children": [],
+    }
+
+
+def build_navigation_tree(project_id, locale=None) -> dict:
+    """
+    Return ``{"locales": {...}, "header": [...], "footer": [...]}`` for a
+    project.
+
+    Each location independently uses the best locale of the fallback chain
+    that has items (see sites/locales.py); the chosen locale per location is
+    reported under ``"locales"``. Items whose parent is missing from the
+    selected set are promoted to top level. Siblings keep the model ordering
+    (column, order, id).
+    """
+    rows = (
+        annotate_locale_rank(
+            NavigationItem.objects.filter(project_id=project_id), locale
+        )
+        .order_by("column", "order", "id")
+        .values(*NAV_ITEM_VALUES, "locale_rank")
+    )
+
+    rows_by_location = {location: [] for location in NAVIGATION_LOCATIONS}
+    best_rank = {}
+    for row in rows:
+        location = row["location"]
+        rows_by_location.setdefault(location, []).append(row)
+        if location not in best_rank or row["locale_rank"] < best_rank[location]:
+            best_rank[location] = row["locale_rank"]
+
+    tree = {"locales": {}}
+    for location, location_rows in rows_by_location.items():
+        selected = [
+            row for row in location_rows if row["locale_rank"] == best_rank.get(location)
+        ]
+        nodes = {row["id"]: _node(row) for row in selected}
+        roots = []
+        for row in selected:
+            parent = nodes.get(row["parent_id"])
+            if parent is not None and row["parent_id"] != row["id"]:
+                parent["children"].append(nodes[row["id"]])
+            else:
+                roots.append(nodes[row["id"]])
+
+        tree["locales"][location] = selected[0]["locale"] if selected else None
+        tree[location] = roots
+    return tree
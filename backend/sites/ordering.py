@@ -0,0 +1,143 @@
+# [ORDER] Gap-based ordering for sections, slides and navigation items
+
+"""
+Sibling rows (sections of a page, hero slides of a page, navigation items
+under one parent, slides of a slider) are ordered by a sparse integer
+``order``. New rows are appended ``ORDER_GAP`` after the last one, so a row
+can later be moved between two neighbours by giving it a value in the gap.
+
+``reorder_group`` takes the complete new id sequence of a group, keeps the
+longest run of rows whose current values are already in order and only
+writes the rows that moved (usually one for a drag-and-drop). When a gap is
+exhausted the whole group is respaced once.
+"""
+
+from bisect import bisect_left
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from django.db import transaction
+from django.db.models import Max, QuerySet
+from django.utils import timezone
+
+
+ORDER_GAP = 1024
+
+
+class OrderingError(ValueError):
+    """The submitted ids do not describe exactly one sibling group."""
+
+
+def next_order(queryset: QuerySet) -> int:
+    """Order value that appends a row after every row of ``queryset``."""
+    current = queryset.aggregate(order__max=Max("order"))["order__max"]
+    return ORDER_GAP if current is None else current + ORDER_GAP
+
+
+def _kept_positions(values: Sequence[int]) -> List[int]:
+    """Positions of a longest strictly increasing subsequence of ``values``."""
+    tails: List[int] = []  # tail value of the best run of each length
+    tail_positions: List[int] = []
+    previous: List[Optional[int]] = []
+    for position, value in enumerate(values):
+        length = bisect_left(tails, value)
+        if length == len(tails):
+            tails.append(value)
+            tail_positions.append(position)
+        else:
+            tails[length] = value
+            tail_positions[length] = position
+        previous.append(tail_positions[length - 1] if length else None)
+
+    kept = []
+    position = tail_positions[-1] if tail_positions else None
+    while position is not None:
+        kept.append(position)
+        position = previous[position]
+    return kept[::-1]
+
+
+def plan_order(rows: Sequence[Tuple[int, int]]) -> Dict[int, int]:
+    """
+    New order values for ``rows`` — ``(id, current order)`` pairs in the
+    wanted sequence. Returns only the ids whose value changes.
+    """
+    values = [order for _, order in rows]
+    kept = set(_kept_positions(values))
+    planned = list(values)
+
+    position = 0
+    while position < len(rows):
+        if position in kept:
+            position += 1
+            continue
+        # Run of moved rows between two kept neighbours
+        end = position
+        while end < len(rows) and end not in kept:
+            end += 1
+        count = end - position
+        low = planned[position - 1] if position else None
+        high = values[end] if end < len(rows) else None
+
+        if high is None:
+            start = 0 if low is None else low
+            new_values = [start + ORDER_GAP * (i + 1) for i in range(count)]
+        else:
+            floor = -1 if low is None else low
+            step = (high - floor) // (count + 1)
+            if step < 1:
+                # No room left: respace the whole group once
+                return {
+                    row_id: ORDER_GAP * index
+                    for index, (row_id, order) in enumerate(rows, start=1)
+                    if order != ORDER_GAP * index
+                }
+            new_values = [floor + step * (i + 1) for i in range(count)]
+        planned[position:end] = new_values
+        position = end
+
+    return {
+        row_id: order
+        for (row_id, current), order in zip(rows, planned)
+        if order != current
+    }
+
+
+def reorder_group(queryset: QuerySet, ids: Sequence[int], scope_fields: Sequence[str]) -> Dict[int, int]:
+    """
+    Put the sibling group of ``ids[0]`` (rows of ``queryset`` sharing its
+    ``scope_fields`` values) in the order of ``ids`` with one bulk update.
+    ``ids`` must list every row of the group exactly once. Returns the new
+    order values of the rows that were written.
+    """
+    if not ids:
+        raise OrderingError("ids must not be empty.")
+    if len(set(ids)) != len(ids):
+        raise OrderingError("ids must not contain duplicates.")
+
+    scope = queryset.filter(id=ids[0]).values(*scope_fields).first()
+    if scope is None:
+        raise OrderingError(f"Item {ids[0]} not found.")
+
+    with transaction.atomic():
+        return _reorder_locked(queryset.filter(**scope), ids)
+
+
+def _reorder_locked(group: QuerySet, ids: Sequence[int]) -> Dict[int, int]:
+    current = dict(group.select_for_update().values_list("id", "order"))
+    missing = sorted(set(current) - set(ids))
+    foreign = sorted(set(ids) - set(current))
+    if missing or foreign:
+        raise OrderingError(
+            "ids must list every item of one group exactly once "
+            f"(missing: {missing}, not in group: {foreign})."
+        )
+
+    changes = plan_order([(row_id, current[row_id]) for row_id in ids])
+    if changes:
+        model = group.model
+        now = timezone.now()
+        model.objects.bulk_update(
+            [model(id=row_id, order=order, updated_at=now) for row_id, order in changes.items()],
+            ["order", "updated_at"],
+        )
+    return changes
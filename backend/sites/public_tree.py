@@ -0,0 +1,148 @@
+# [PERF] Serializer-free public site tree
+
+"""
+Builds the public site payload (project -> pages -> sections -> fields) from
+flat ``values()`` rows instead of nested ModelSerializers.
+
+The output has exactly the same shape, key order and value types as
+``SiteProjectPublicSerializer`` / ``PagePublicSerializer`` /
+``SectionPublicSerializer`` / ``FieldPublicSerializer``, so the rendered JSON
+is byte-for-byte identical. Keep both in sync when changing either side.
+
+[DOCS] Sections and fields come from ``Page.content_document`` when it is
+present; pages without a document (not yet backfilled) fall back to the
+Section/Field rows.
+"""
+
+from typing import Iterable, List, Optional
+
+from .documents import has_document, public_sections
+from .models import Field, Page, Section, SiteProject
+
+
+PAGE_VALUES = (
+    "id",
+    "slug",
+    "path",
+    "title",
+    "order",
+    "is_published",
+    "locale",
+    "meta_title",
+    "meta_description",
+    "meta_slug",
+    "indexable",
+)
+SECTION_VALUES = ("id", "page_id", "identifier", "internal_name", "order")
+FIELD_VALUES = ("section_id", "key", "label", "value", "order")
+
+
+def _page_seo(row: dict) -> dict:
+    # Same fallbacks as PagePublicSerializer.get_seo
+    return {
+        "meta_title": row["meta_title"] or row["title"],
+        "meta_description": row["meta_description"] or "",
+        "slug": row["meta_slug"] or row["path"] or row["slug"],
+        "indexable": row["indexable"],
+    }
+
+
+def build_public_pages(pages_qs) -> List[dict]:
+    """
+    Return the public page list for ``pages_qs`` (a Page queryset). Pages
+    with a content document need a single query; any others add two more
+    (their sections, and those sections' fields).
+    """
+    page_rows = list(
+        pages_qs.order_by("order", "id").values(*PAGE_VALUES, "content_document")
+    )
+    if not page_rows:
+        return []
+
+    sections_by_page = {
+        row["id"]: public_sections(row["content_document"])
+        for row in page_rows
+        if has_document(row["content_document"])
+    }
+    missing = [row["id"] for row in page_rows if row["id"] not in sections_by_page]
+    if missing:
+        sections_by_page.update(_sections_from_rows(missing))
+
+    return [
+        {
+            "id": row["id"],
+            "slug": row["slug"],
+            "path": row["path"],
+            "title": row["title"],
+            "order": row["order"],
+            "is_published": row["is_published"],
+            "locale": row["locale"],
+            "sections": sections_by_page[row["id"]],
+            "seo": _page_seo(row),
+        }
+        for row in page_rows
+    ]
+
+
+def _sections_from_rows(page_ids) -> dict:
+    """Public sections per page id, read from the Section/Field rows."""
+    sections_by_page = {page_id: [] for page_id in page_ids}
+    sections_by_id = {}
+    section_rows = (
+        Section.objects.filter(page_id__in=sections_by_page.keys())
+        .order_by("order", "id")
+        .values(*SECTION_VALUES)
+    )
+    for row in section_rows:
+        section = {
+            "id": row["id"],
+            "identifier": row["identifier"],
+            "internal_name": row["internal_name"],
+            "order": row["order"],
+            "fields": [],
+        }
+        sections_by_id[row["id"]] = section
+        sections_by_page[row["page_id"]].append(section)
+
+    if sections_by_id:
+        field_rows = (
+            Field.objects.filter(section_id__in=sections_by_id.keys())
+            .order_by("order", "id")
+            .values_list(*FIELD_VALUES)
+        )
+        for section_id, key, label, value, order in field_rows:
+            sections_by_id[section_id]["fields"].append(
+                {"key": key, "label": label, "value": value, "order": order}
+            )
+
+    return sections_by_page
+
+
+def build_public_site(project_id, page_ids: Optional[Iterable[int]] = None) -> Optional[dict]:
+    """
+    Return the public payload for an active project, or None if it does not
+    exist. When ``page_ids`` is given, only those pages are included.
+    """
+    project = (
+        SiteProject.objects.filter(id=project_id, is_active=True)
+        .values("id", "name", "slug", "site_template_id", "site_template__key")
+        .first()
+    )
+    if project is None:
+        return None
+
+    pages_qs = Page.objects.filter(project_id=project_id)
+    if page_ids is not None:
+        pages_qs = pages_qs.filter(id__in=list(page_ids))
+
+    payload = {
+        "id": str(project["id"]),
+        "name": project["name"],
+        "slug": project["slug"],
+    }
+    # DRF skips a dotted-source field whose relation is null, so the key is
+    # omitted (not null) for projects without a template.
+    if project["site_template_id"] is not None:
+        payload["site_template_key"] = project["site_template__key"]
+    payload["pages"] = build_public_pages(pages_qs)
+    return payload
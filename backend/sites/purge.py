@@ -0,0 +1,209 @@
+# [PURGE] Soft delete and chunked background purge of projects
+
+"""
+Deleting a project used to cascade through every page, section, field,
+slide and navigation item in one transaction, locking SQLite for the whole
+cascade. Now ``delete_project`` only marks the project deleted (hidden by
+``SiteProject.objects``) and queues a ``purge_project`` job.
+
+``purge_project`` removes the children leaf-first in transactions of at most
+``SITES_PURGE_CHUNK_SIZE`` rows, so other writers get the database between
+chunks, and deletes the screenshot files of purged section drafts once each
+chunk is committed. Rows are removed without per-row signals; the project
+was already hidden and its caches invalidated by the soft delete.
+
+``purge_orphaned_media`` removes files under the screenshot upload folders
+that no SectionDraft or BugScreenshot row references any more.
+"""
+
+import logging
+import posixpath
+from datetime import timedelta
+from typing import Callable, Dict, Iterable, Optional
+
+from django.conf import settings
+from django.core.files.storage import default_storage
+from django.db import transaction
+from django.db.models import QuerySet
+from django.utils import timezone
+
+from .jobs import enqueue_job
+from .models import (
+    BackgroundJob,
+    BugReport,
+    BugScreenshot,
+    Field,
+    HeroSlide,
+    HomepageSlide,
+    HomepageSlider,
+    NavigationItem,
+    Page,
+    QuoteRequest,
+    Section,
+    SectionDraft,
+    SiteProject,
+    TemplateSection,
+    TestimonialCarousel,
+    TestimonialSlide,
+)
+
+
+logger = logging.getLogger(__name__)
+
+ORPHAN_MEDIA_FOLDERS = ("screenshot_uploads", "bug_screenshots")
+
+
+def get_purge_chunk_size() -> int:
+    return getattr(settings, "SITES_PURGE_CHUNK_SIZE", 500)
+
+
+def get_orphan_media_grace() -> int:
+    return getattr(settings, "SITES_ORPHAN_MEDIA_GRACE", 24 * 60 * 60)
+
+
+def delete_project(project: SiteProject, *, user=None) -> BackgroundJob:
+    """Soft-delete ``project`` and queue the job that purges its rows."""
+    project.soft_delete()
+    return enqueue_job("purge_project", {"project_id": str(project.pk)}, user=user, max_attempts=3)
+
+
+def _delete_files(names: Iterable[str]) -> int:
+    deleted = 0
+    for name in names:
+        if not name:
+            continue
+        try:
+            default_storage.delete(name)
+            deleted += 1
+        except OSError:
+            logger.warning("Could not delete media file %s", name, exc_info=True)
+    return deleted
+
+
+def _delete_in_chunks(
+    queryset: QuerySet,
+    chunk_size: int,
+    before_delete: Optional[Callable[[list], None]] = None,
+) -> int:
+    """
+    Delete the rows of ``queryset`` in transactions of ``chunk_size`` rows.
+    ``before_delete(ids)`` runs inside each transaction first, e.g. to clear
+    SET_NULL references that a raw delete would not handle.
+    """
+    model = queryset.model
+    total = 0
+    while True:
+        with transaction.atomic():
+            ids = list(queryset.values_list("pk", flat=True)[:chunk_size])
+            if not ids:
+                return total
+            if before_delete is not None:
+                before_delete(ids)
+            # Raw delete: no collector and no per-row signals (see module doc)
+            chunk = model._base_manager.filter(pk__in=ids)
+            total += chunk._raw_delete(chunk.db)
+
+
+def purge_project(project_id, *, chunk_size: Optional[int] = None, progress: Optional[Callable[[str], None]] = None) -> Dict[str, int]:
+    """
+    Remove a soft-deleted project and everything that belongs to it, in
+    bounded chunks. Returns the number of deleted rows per kind.
+    """
+    project = SiteProject.all_objects.get(pk=project_id)
+    if project.deleted_at is None:
+        raise ValueError(f"Project {project_id} is not deleted; refusing to purge it.")
+
+    chunk_size = chunk_size or get_purge_chunk_size()
+    counts: Dict[str, int] = {"media_files": 0}
+
+    def step(name, queryset, before_delete=None):
+        if progress is not None:
+            progress(f"Purging {name.replace('_', ' ')}")
+        counts[name] = _delete_in_chunks(queryset, chunk_size, before_delete)
+
+    def delete_draft_images(ids):
+        names = list(SectionDraft.objects.filter(pk__in=ids).values_list("image", flat=True))
+
+        def after_commit():
+            counts["media_files"] += _delete_files(names)
+
+        # Files go only once their rows are gone for good
+        transaction.on_commit(after_commit)
+
+    step("fields", Field.objects.filter(section__page__project_id=project.pk))
+    step(
+        "sections",
+        Section.objects.filter(page__project_id=project.pk),
+        lambda ids: TemplateSection.objects.filter(source_section_id__in=ids).update(source_section=None),
+    )
+    step("hero_slides", HeroSlide.objects.filter(page__project_id=project.pk))
+
+    # Only items without children: parents become leaves as chunks are
+    # deleted, so the self reference never dangles
+    step(
+        "navigation_items",
+        NavigationItem.objects.filter(project_id=project.pk, children__isnull=True),
+    )
+
+    step(
+        "pages",
+        Page.objects.filter(project_id=project.pk),
+        lambda ids: NavigationItem.objects.filter(page_id__in=ids).update(page=None),
+    )
+    step("homepage_slides", HomepageSlide.objects.filter(slider__site_project_id=project.pk))
+    step("homepage_sliders", HomepageSlider.objects.filter(site_project_id=project.pk))
+    step("testimonial_slides", TestimonialSlide.objects.filter(carousel__site_project_id=project.pk))
+    step("testimonial_carousels", TestimonialCarousel.objects.filter(site_project_id=project.pk))
+    step("quote_requests", QuoteRequest.objects.filter(site_project_id=project.pk))
+    step("section_drafts", SectionDraft.objects.filter(project_id=project.pk), delete_draft_images)
+
+    # Bug reports outlive the project (SET_NULL)
+    while True:
+        with transaction.atomic():
+            ids = list(BugReport.objects.filter(project_id=project.pk).values_list("pk", flat=True)[:chunk_size])
+            if not ids:
+                break
+            BugReport.objects.filter(pk__in=ids).update(project=None)
+
+    # Nothing is left to cascade; the regular delete sends the project signals
+    project.delete()
+    return counts
+
+
+def _walk(folder: str):
+    try:
+        directories, files = default_storage.listdir(folder)
+    except (FileNotFoundError, NotImplementedError):
+        return
+    for name in files:
+        yield posixpath.join(folder, name)
+    for directory in directories:
+        yield from _walk(posixpath.join(folder, directory))
+
+
+def purge_orphaned_media(*, grace: Optional[int] = None, dry_run: bool = False) -> list:
+    """
+    Delete screenshot files that no SectionDraft/BugScreenshot references.
+    Files younger than ``grace`` seconds are kept (their row may not be
+    committed yet). Returns the orphaned file names.
+    """
+    grace = get_orphan_media_grace() if grace is None else grace
+    cutoff = timezone.now() - timedelta(seconds=grace)
+    referenced = set(SectionDraft.objects.values_list("image", flat=True))
+    referenced.update(BugScreenshot.objects.values_list("image", flat=True))
+
+    orphans = []
+    for folder in ORPHAN_MEDIA_FOLDERS:
+        for name in _walk(folder):
+            if name in referenced:
+                continue
+            try:
+                if default_storage.get_modified_time(name) > cutoff:
+                    continue
+            except (NotImplementedError, OSError):
+                pass
+            orphans.append(name)
+
+    if not dry_run:
+        _delete_files(orphans)
+    return orphans
@@ -0,0 +1,230 @@
+# [ROUTES] Compiled per-project route tables
+
+"""
+In-memory route tables answering "which page, which locale, or which
+redirect" for a public URL of a tenant site without touching the database.
+
+A table is compiled per project from its published pages:
+
+- every page is reachable at its canonical path: ``Page.path`` with the last
+  segment replaced by ``meta_slug`` when one is set (the home page ``/``
+  keeps its path);
+- when ``meta_slug`` changes the path, the original ``Page.path`` becomes an
+  alias that redirects to the canonical path;
+- URLs may carry a locale prefix (``/pt/sobre``); unprefixed URLs use the
+  requested locale or the project's primary locale, and missing
+  translations fall back along the locale chain (sites/locales.py).
+
+Tables live in process memory. Page and project changes drop the table of
+the writing process at once and replace a token in the shared cache (see
+sites/signals.py). Other processes read that token at most every
+``SITES_ROUTE_TABLE_CHECK_INTERVAL`` seconds per project, so a warm lookup
+does not touch the database (the shared cache may be a database table) and
+their changes show up within that interval. Tables are also recompiled
+after ``SITES_ROUTE_TABLE_MAX_AGE`` seconds as a safety net for per-process
+cache backends.
+"""
+
+import threading
+import time
+import uuid
+from typing import Optional
+
+from django.conf import settings
+from django.core.cache import cache
+
+from .locales import get_locale_fallback_chain
+from .models import Page, SiteProject
+
+
+ROUTE_TABLE_TOKEN_PREFIX = "sites:route-table"
+
+_route_tables = {}
+_route_tables_lock = threading.Lock()
+# project id -> number of invalidations seen by this process
+_local_generations = {}
+_local_generations_lock = threading.Lock()
+
+
+def get_route_table_max_age() -> int:
+    return getattr(settings, "SITES_ROUTE_TABLE_MAX_AGE", 5 * 60)
+
+
+def get_route_table_check_interval() -> float:
+    return getattr(settings, "SITES_ROUTE_TABLE_CHECK_INTERVAL", 2.0)
+
+
+def normalize_path(path: Optional[str]) -> str:
+    """'about/' -> '/about', '' -> '/'."""
+    path = "/" + (path or "").strip().strip("/")
+    return path
+
+
+def canonical_page_path(path: str, meta_slug: str) -> str:
+    path = normalize_path(path)
+    if not meta_slug or path == "/":
+        return path
+    parent = path.rsplit("/", 1)[0]
+    return f"{parent}/{meta_slug}"
+
+
+def _route_token_key(project_id) -> str:
+    return f"{ROUTE_TABLE_TOKEN_PREFIX}:{project_id}"
+
+
+class RouteTable:
+    """Compiled routes for one project. Lookups are dict accesses only."""
+
+    def __init__(self, project: dict, pages):
+        self.project_id = project["id"]
+        self.slug = project["slug"]
+        self.primary_locale = project["primary_locale"]
+        self.token = None
+        self.generation = 0
+        self.built_at = time.monotonic()
+        self.checked_at = self.built_at
+
+        # lowercase code -> code as stored
+        self.locales = {}
+        for code in [self.primary_locale, *(project["additional_locales"] or [])]:
+            if isinstance(code, str) and code:
+                self.locales.setdefault(code.lower(), code)
+
+        self.routes = {}
+        self.aliases = {}
+        self.slugs = {}
+        for page in pages:
+            locale_key = page["locale"].lower()
+            self.locales.setdefault(locale_key, page["locale"])
+            canonical = canonical_page_path(page["path"], page["meta_slug"])
+            entry = {
+                "page": page["id"],
+                "slug": page["slug"],
+                "locale": page["locale"],
+                "path": canonical,
+            }
+            # First page wins on conflicting paths (pages are in page order)
+            self.routes.setdefault((locale_key, canonical), entry)
+            self.slugs.setdefault((locale_key, page["slug"]), entry)
+            original = normalize_path(page["path"])
+            if original != canonical:
+                self.aliases.setdefault((locale_key, original), entry)
+
+    def resolve(self, path: str, locale: Optional[str] = None) -> Optional[dict]:
+        """
+        Return ``{"type": "page", ...}``, ``{"type": "redirect", ...}`` or
+        None when nothing matches.
+        """
+        path = normalize_path(path)
+        prefix = ""
+        first, _, rest = path[1:].partition("/")
+        if first and first.lower() in self.locales:
+            locale = self.locales[first.lower()]
+            prefix = f"/{first}"
+            path = normalize_path(rest)
+
+        for code in get_locale_fallback_chain(locale, self.primary_locale):
+            key = (code.lower(), path)
+            entry = self.routes.get(key)
+            if entry is not None:
+                return {"type": "page", "requested_locale": locale, **entry}
+            entry = self.aliases.get(key)
+            if entry is not None:
+                return {
+                    "type": "redirect",
+                    "location": prefix + entry["path"],
+                    "status": 301,
+                    "page": entry["page"],
+                    "locale": entry["locale"],
+                }
+        return None
+
+    def resolve_slug(self, slug: str, locale: Optional[str] = None) -> Optional[dict]:
+        """Return ``{"type": "page", ...}`` for a page slug, or None."""
+        for code in get_locale_fallback_chain(locale, self.primary_locale):
+            entry = self.slugs.get((code.lower(), slug))
+            if entry is not None:
+                return {"type": "page", "requested_locale": locale, **entry}
+        return None
+
+
+def _get_route_project(slug: str) -> Optional[dict]:
+    return (
+        SiteProject.objects.filter(slug=slug, is_active=True)
+        .values("id", "slug", "primary_locale", "additional_locales")
+        .first()
+    )
+
+
+def compile_route_table(slug: str, project: Optional[dict] = None) -> Optional[RouteTable]:
+    """Build the route table of an active project from the database."""
+    project = project or _get_route_project(slug)
+    if project is None:
+        return None
+    pages = (
+        Page.objects.filter(project_id=project["id"], is_published=True)
+        .order_by("order", "id")
+        .values("id", "slug", "path", "locale", "meta_slug")
+    )
+    return RouteTable(project, pages)
+
+
+def get_route_table(slug: str) -> Optional[RouteTable]:
+    """
+    Return the compiled route table for a project slug, recompiling it when
+    it was invalidated or is older than the configured max age.
+    """
+    table = _route_tables.get(slug)
+    if table is not None and _is_fresh(table):
+        return table
+
+    with _route_tables_lock:
+        table = _route_tables.get(slug)
+        if table is not None and _is_fresh(table):
+            return table
+
+        project = _get_route_project(slug)
+        if project is None:
+            _route_tables.pop(slug, None)
+            return None
+
+        # The token and generation are read (or created) before the pages
+        # are: an invalidation while compiling changes them, so this table is
+        # recompiled instead of being served as fresh.
+        generation = _local_generations.get(project["id"], 0)
+        key = _route_token_key(project["id"])
+        token = uuid.uuid4().hex
+        if not cache.add(key, token, None):
+            token = cache.get(key) or token
+
+        table = compile_route_table(slug, project)
+        table.token = token
+        table.generation = generation
+        _route_tables[slug] = table
+        return table
+
+
+def _is_fresh(table: RouteTable) -> bool:
+    now = time.monotonic()
+    if now - table.built_at > get_route_table_max_age():
+        return False
+    if _local_generations.get(table.project_id, 0) != table.generation:
+        return False
+    if now - table.checked_at < get_route_table_check_interval():
+        return True
+    # Invalidations from other processes only show up in the shared token
+    if cache.get(_route_token_key(table.project_id)) != table.token:
+        return False
+    table.checked_at = now
+    return True
+
+
+def invalidate_route_table(project_id) -> None:
+    """
+    Drop the project's route table in this process and make every other
+    process recompile it within ``SITES_ROUTE_TABLE_CHECK_INTERVAL`` seconds.
+    """
+    # Not _route_tables_lock: pages may be saved while a table is compiled
+    with _local_generations_lock:
+        _local_generations[project_id] = _local_generations.get(project_id, 0) + 1
+    cache.delete(_route_token_key(project_id))
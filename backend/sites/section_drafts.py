@@ -0,0 +1,335 @@
+# [AI-DRAFTS] Screenshot analysis for section drafts
+
+"""
+Screenshot drafts are analyzed by the background job worker instead of the
+web request (a vision call takes 10-40 seconds):
+
+    job = queue_section_draft(draft, user=request.user)   # 202 to the client
+
+The ``process_section_draft`` job handler (sites/jobs.py) calls
+``analyze_screenshot`` and stores the result on the draft. Clients poll
+``GET /api/sections/drafts/<id>/`` until the status is ready or error.
+
+An attempt that runs longer than ``SITES_DRAFT_PROCESSING_TIMEOUT`` seconds
+(or whose worker died) is treated as stuck: ``recover_stuck_draft`` queues a
+new attempt until ``SITES_DRAFT_MAX_ATTEMPTS`` is used up and then marks the
+draft as failed.
+
+[AI-CACHE] Parsed results are cached in ``ScreenshotAnalysis`` under the
+file's content hash (checked before a job is queued) and the normalized
+image hash (checked by the worker before the model call), together with
+the locale and ``get_screenshot_prompt_version()``. Re-uploading the same
+screenshot, or the same picture saved again, reuses the earlier result.
+"""
+
+import base64
+import hashlib
+import json
+from datetime import timedelta
+from typing import Optional
+
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.db.models import F
+from django.utils import timezone
+
+from .ai import complete_json
+from .images import fingerprint_file, fingerprint_normalized, normalize_screenshot
+from .jobs import enqueue_job
+from .models import BackgroundJob, ScreenshotAnalysis, SectionDraft
+
+
+SCREENSHOT_SYSTEM_PROMPT = """You are an expert web designer that analyzes website screenshots and extracts section information.
+
+Analyze the provided screenshot and identify distinct website sections (header, hero, about, services, contact, etc.).
+
+Return a JSON object with this structure:
+{
+    "sections": [
+        {
+            "type": "hero",
+            "title": "Main heading text",
+            "content": "Body text content",
+            "image_url": "URL if there's an image",
+            "cta_text": "Call to action text if present",
+            "cta_url": "Call to action URL if present"
+        },
+        {
+            "type": "about",
+            "title": "About section heading",
+            "content": "About section text content"
+        }
+    ],
+    "overall_theme": "modern/classic/minimal/etc",
+    "color_scheme": "blue/green/red/etc",
+    "business_type": "restaurant/services/ecommerce/etc"
+}
+
+Extract all visible text accurately. Identify section types like: hero, about, services, menu, contact, footer, testimonials, gallery, etc."""
+
+SCREENSHOT_USER_PROMPT = """Analyze this website screenshot and extract all visible sections with their content.
+
+Locale: {locale}
+
+Please provide accurate extraction of all text, headings, and identify the section types clearly."""
+
+# Appended to the user prompt when a tall screenshot is sent as tiles
+SCREENSHOT_TILES_PROMPT = (
+    "\n\nThe full-page screenshot is split into {count} overlapping parts, "
+    "top to bottom. Treat them as one page and do not repeat sections that "
+    "appear in the overlap."
+)
+
+SCREENSHOT_MODEL = "gpt-4o"
+
+# [AI-CACHE] Bump when the prompts or the output handling change
+SCREENSHOT_PROMPT_VERSION = "1"
+
+DRAFT_FINISHED_STATUSES = ("ready", "error")
+
+
+def get_draft_processing_timeout() -> int:
+    return getattr(settings, "SITES_DRAFT_PROCESSING_TIMEOUT", 180)
+
+
+def get_draft_max_attempts() -> int:
+    return max(1, getattr(settings, "SITES_DRAFT_MAX_ATTEMPTS", 2))
+
+
+def get_draft_events_timeout() -> int:
+    return getattr(settings, "SITES_DRAFT_EVENTS_TIMEOUT", 5)
+
+
+def get_analysis_cache_ttl() -> int:
+    return getattr(settings, "SITES_DRAFT_ANALYSIS_CACHE_TTL", 30 * 24 * 60 * 60)
+
+
+def get_screenshot_prompt_version() -> str:
+    """Manual version plus a digest of the model and every prompt template."""
+    prompts = "\n".join([SCREENSHOT_MODEL, SCREENSHOT_SYSTEM_PROMPT, SCREENSHOT_USER_PROMPT, SCREENSHOT_TILES_PROMPT])
+    digest = hashlib.sha256(prompts.encode()).hexdigest()
+    return f"{SCREENSHOT_PROMPT_VERSION}-{digest[:8]}"
+
+
+def build_user_prompt(draft: SectionDraft) -> str:
+    # [AI-CACHE] Only inputs that are part of the cache key (the locale) may
+    # go into the prompt, so a cached answer fits every draft it is used for
+    return SCREENSHOT_USER_PROMPT.format(locale=draft.locale or "en")
+
+
+def analyze_screenshot(draft: SectionDraft) -> dict:
+    """Run the vision model on the draft's screenshot and return its JSON."""
+    # [IMAGES] Scaled, stripped and tiled copy instead of the raw upload
+    with draft.image.open("rb") as image_file:
+        if not draft.content_hash:
+            draft.content_hash = fingerprint_file(image_file)
+        normalized = normalize_screenshot(image_file)
+
+    # [AI-CACHE] The same picture saved differently has the same image hash
+    draft.image_hash = fingerprint_normalized(normalized)
+    cached = find_cached_analysis(draft)
+    if cached is not None:
+        if cached.content_hash != draft.content_hash:
+            # Next upload of this exact file is answered without a job
+            remember_analysis(draft, cached.ai_output_json)
+        return cached.ai_output_json
+
+    ai_data = json.loads(call_vision_model(build_screenshot_content(draft, normalized)))
+    remember_analysis(draft, ai_data)
+    return ai_data
+
+
+def build_screenshot_content(draft: SectionDraft, normalized: dict) -> list:
+    """User message parts: the prompt followed by the screenshot tiles."""
+    tiles = normalized["tiles"]
+    text = build_user_prompt(draft)
+    if len(tiles) > 1:
+        text += SCREENSHOT_TILES_PROMPT.format(count=len(tiles))
+    return [{"type": "text", "text": text}] + [
+        {
+            "type": "image_url",
+            "image_url": {
+                "url": f"data:{normalized['mime_type']};base64,{base64.b64encode(tile).decode('ascii')}"
+            },
+        }
+        for tile in tiles
+    ]
+
+
+def call_vision_model(content: list) -> str:
+    # [AI-PROVIDER] Retries included, the call must end before the attempt
+    # counts as stuck
+    return complete_json(
+        [
+            {"role": "system", "content": SCREENSHOT_SYSTEM_PROMPT},
+            {"role": "user", "content": content},
+        ],
+        model=SCREENSHOT_MODEL,  # Use the vision model
+        timeout=get_draft_processing_timeout(),
+        budget=get_draft_processing_timeout(),
+    )
+
+
+def find_cached_analysis(draft: SectionDraft) -> Optional[ScreenshotAnalysis]:
+    """
+    Cached analysis for the draft's content hash or, failing that, its
+    image hash. Counts the hit. None when nothing fresh is cached.
+    """
+    ttl = get_analysis_cache_ttl()
+    if not ttl:
+        return None
+    entries = ScreenshotAnalysis.objects.filter(
+        locale=draft.locale or "en",
+        prompt_version=get_screenshot_prompt_version(),
+        created_at__gte=timezone.now() - timedelta(seconds=ttl),
+    )
+    entry = None
+    if draft.content_hash:
+        entry = entries.filter(content_hash=draft.content_hash).first()
+    if entry is None and draft.image_hash:
+        entry = entries.filter(image_hash=draft.image_hash).first()
+    if entry is not None:
+        ScreenshotAnalysis.objects.filter(pk=entry.pk).update(hits=F("hits") + 1, last_used_at=timezone.now())
+    return entry
+
+
+def remember_analysis(draft: SectionDraft, ai_data) -> None:
+    """Cache a parsed analysis under the draft's fingerprints."""
+    ttl = get_analysis_cache_ttl()
+    if not ttl or not isinstance(ai_data, dict) or not (draft.content_hash and draft.image_hash):
+        return
+    now = timezone.now()
+    ScreenshotAnalysis.objects.filter(created_at__lt=now - timedelta(seconds=ttl)).delete()
+    key = {
+        "content_hash": draft.content_hash,
+        "locale": draft.locale or "en",
+        "prompt_version": get_screenshot_prompt_version(),
+    }
+    defaults = {"image_hash": draft.image_hash, "ai_output_json": ai_data, "created_at": now}
+    try:
+        with transaction.atomic():
+            ScreenshotAnalysis.objects.update_or_create(**key, defaults=defaults)
+    except IntegrityError:
+        # Another worker cached the same file in between: keep the newer answer
+        ScreenshotAnalysis.objects.filter(**key).update(**defaults)
+
+
+def apply_cached_analysis(draft: SectionDraft) -> bool:
+    """
+    Finish the draft from the cache without queuing a job. Returns True on
+    a hit. Drafts uploaded before fingerprinting are hashed here.
+    """
+    if not draft.content_hash:
+        with draft.image.open("rb") as image_file:
+            draft.content_hash = fingerprint_file(image_file)
+        SectionDraft.objects.filter(pk=draft.pk).update(content_hash=draft.content_hash)
+    cached = find_cached_analysis(draft)
+    if cached is None:
+        return False
+    now = timezone.now()
+    changes = {
+        "status": "ready",
+        "ai_output_json": cached.ai_output_json,
+        "image_hash": cached.image_hash,
+        "error_message": "",
+        "updated_at": now,
+    }
+    # Not while an attempt is running: that job owns the draft
+    if not SectionDraft.objects.filter(pk=draft.pk).exclude(status="processing").update(**changes):
+        return False
+    for attr, value in changes.items():
+        setattr(draft, attr, value)
+    return True
+
+
+def queue_section_draft(draft: SectionDraft, *, user=None, reset_attempts: bool = True) -> Optional[BackgroundJob]:
+    """
+    Move the draft to ``processing`` and queue a ``process_section_draft``
+    job. Returns None when another request queued it first.
+
+    ``reset_attempts=False`` retries the attempt ``draft`` was loaded with
+    (stuck draft recovery); it only queues a job while that attempt is
+    still the current one.
+    """
+    now = timezone.now()
+    with transaction.atomic():
+        drafts = SectionDraft.objects.filter(pk=draft.pk)
+        # Conditional updates: concurrent requests queue a single job
+        if reset_attempts:
+            claimed = drafts.exclude(status="processing").update(
+                status="processing", attempts=0, updated_at=now
+            )
+            if not claimed:
+                return None
+            draft.attempts = 0
+        else:
+            claimed = drafts.filter(
+                status="processing", job=draft.job_id, processing_started_at=draft.processing_started_at
+            ).update(processing_started_at=now, updated_at=now)
+            if not claimed:
+                return None
+        remaining = get_draft_max_attempts() - draft.attempts
+        job = enqueue_job(
+            "process_section_draft", {"draft_id": str(draft.pk)}, user=user, max_attempts=remaining
+        )
+        changes = {
+            "status": "processing",
+            "job": job,
+            "processing_started_at": now,
+            "error_message": "",
+            "updated_at": now,
+        }
+        drafts.update(**changes)
+    for attr, value in changes.items():
+        setattr(draft, attr, value)
+    return job
+
+
+def is_draft_stuck(draft: SectionDraft) -> bool:
+    """True when a processing draft has no live attempt behind it."""
+    if draft.status != "processing":
+        return False
+    job = draft.job
+    if job is not None and job.status == BackgroundJob.STATUS_QUEUED:
+        return False  # Waiting for a worker or the retry delay
+    if job is not None and job.status == BackgroundJob.STATUS_RUNNING:
+        started = draft.processing_started_at or job.started_at
+        deadline = timezone.now() - timedelta(seconds=get_draft_processing_timeout())
+        return started is None or started < deadline
+    # No job, or it finished without updating the draft
+    return True
+
+
+def recover_stuck_draft(draft: SectionDraft) -> bool:
+    """
+    Retry a stuck draft, or mark it failed when it is out of attempts.
+    Returns True when the draft was changed.
+    """
+    if not is_draft_stuck(draft):
+        return False
+    if draft.attempts < get_draft_max_attempts():
+        job = queue_section_draft(draft, user=draft.job.created_by if draft.job else None, reset_attempts=False)
+        return job is not None
+    now = timezone.now()
+    SectionDraft.objects.filter(pk=draft.pk, status="processing", job=draft.job_id).update(
+        status="error", error_message="Processing timed out.", updated_at=now
+    )
+    draft.status, draft.error_message, draft.updated_at = "error", "Processing timed out.", now
+    return True
+
+
+def draft_status_payload(draft: SectionDraft) -> dict:
+    """Small status document for polling clients and the event stream."""
+    job = draft.job
+    return {
+        "id": str(draft.pk),
+        "status": draft.status,
+        "attempts": draft.attempts,
+        "error_message": draft.error_message,
+        "progress": {
+            "current": job.progress_current,
+            "total": job.progress_total,
+            "message": job.progress_message,
+        } if job is not None else None,
+        "updated_at": draft.updated_at.isoformat() if draft.updated_at else None,
+    }
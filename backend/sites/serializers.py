@@ -1,9 +1,18 @@
 import base64
 import uuid
 from django.core.files.base import ContentFile
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
 from rest_framework import serializers
-from .models import Template, SiteTemplate, TemplateSection, SiteProject, Page, Section, Field, BugReport, BugScreenshot, NavigationItem, HeroSlide, QuoteRequest, SectionDraft, HomepageSlider, HomepageSlide, TestimonialCarousel, TestimonialSlide
+from rest_framework.validators import UniqueValidator
+from .models import Template, SiteTemplate, TemplateSection, SiteProject, Page, Section, Field, BugReport, BugScreenshot, NavigationItem, HeroSlide, QuoteRequest, SectionDraft, HomepageSlider, HomepageSlide, TestimonialCarousel, TestimonialSlide, BackgroundJob, LocaleChoices
 from tenant_dashboards.models import DashboardTemplate, DashboardBlock
+from .caching import bump_content_version
+from .documents import deferred_page_documents, has_document, rebuild_page_documents, snapshot_sections
+from .images import UnsupportedImage, fingerprint_file, inspect_image
+from .ordering import ORDER_GAP, plan_order
+from .slugs import create_with_unique_slug
 
 
 class TemplateSerializer(serializers.ModelSerializer):
@@ -255,6 +264,17 @@ class SiteProjectSerializer(serializers.ModelSerializer):
             "hero_particles_size",
         ]
         read_only_fields = ["id", "created_at", "updated_at", "template"]
+        extra_kwargs = {
+            # [PURGE] Soft-deleted projects keep their slug until purged
+            "slug": {
+                "validators": [
+                    UniqueValidator(
+                        queryset=SiteProject.all_objects.all(),
+                        message="A project with this slug already exists.",
+                    )
+                ]
+            },
+        }
 
     def create(self, validated_data):
         from .models import Template
@@ -368,11 +388,19 @@ class SectionDraftSerializer(serializers.ModelSerializer):
             "status",
             "section_name",
             "locale",
+            "mime_type",
+            "image_width",
+            "image_height",
             "ai_output_json",
+            "attempts",
+            "error_message",
             "created_at",
             "updated_at",
         ]
-        read_only_fields = ["id", "created_at", "updated_at", "status", "ai_output_json"]
+        read_only_fields = [
+            "id", "created_at", "updated_at", "status", "ai_output_json", "attempts", "error_message",
+            "mime_type", "image_width", "image_height",
+        ]
     
     def get_image_url(self, obj):
         if obj.image:
@@ -402,7 +430,7 @@ class SectionDraftCreateSerializer(serializers.ModelSerializer):
             raise serializers.ValidationError("Image file is required.")
         
         # Check file extension
-        allowed_extensions = ['png', 'jpg', 'jpeg', 'svg']
+        allowed_extensions = ['png', 'jpg', 'jpeg', 'webp', 'gif']
         file_extension = value.name.split('.')[-1].lower()
         
         if file_extension not in allowed_extensions:
@@ -418,7 +446,18 @@ class SectionDraftCreateSerializer(serializers.ModelSerializer):
                 f"File size too large. Maximum size is {max_size // (1024*1024)}MB."
             )
         
+        # [IMAGES] The content must really be an image; keep its real type
+        try:
+            self._image_info = inspect_image(value)
+        except UnsupportedImage as exc:
+            raise serializers.ValidationError(str(exc))
+        # [AI-CACHE] Lets a re-upload reuse an earlier analysis
+        self._image_info["content_hash"] = fingerprint_file(value)
+        
         return value
+    
+    def create(self, validated_data):
+        return super().create({**validated_data, **getattr(self, "_image_info", {})})
 
 
 # Hero Slide Serializer
@@ -492,11 +531,27 @@ class PageSnapshotSerializer(serializers.ModelSerializer):
             "order",
             "is_published",
             "locale",
+            "version",
             "sections",
             "hero_slides",
         ]
 
 
+# [DOCS] Snapshot served from the page's precomputed content document
+class PageDocumentSnapshotSerializer(PageSnapshotSerializer):
+    """
+    Same output as PageSnapshotSerializer, but sections and fields are read
+    from Page.content_document instead of the Section/Field rows.
+    """
+    sections = serializers.SerializerMethodField()
+
+    def get_sections(self, obj):
+        if has_document(obj.content_document):
+            return snapshot_sections(obj.content_document)
+        # Not backfilled yet
+        return SectionWithFieldsSerializer(obj.sections.all(), many=True).data
+
+
 # Bug Screenshot Serializer
 class BugScreenshotSerializer(serializers.ModelSerializer):
     class Meta:
@@ -738,7 +793,8 @@ class CloneProjectSerializer(serializers.Serializer):
     
     def validate_slug(self, value):
         """Validate that slug is unique."""
-        if value and SiteProject.objects.filter(slug=value).exists():
+        # [PURGE] Including soft-deleted projects, which keep their slug until purged
+        if value and SiteProject.all_objects.filter(slug=value).exists():
             raise serializers.ValidationError("A project with this slug already exists.")
         return value
 
@@ -752,6 +808,74 @@ class CloneProjectResponseSerializer(serializers.Serializer):
     pages_cloned = serializers.IntegerField(required=False)
     sections_cloned = serializers.IntegerField(required=False)
     fields_cloned = serializers.IntegerField(required=False)
+    hero_slides_cloned = serializers.IntegerField(required=False)
+    navigation_items_cloned = serializers.IntegerField(required=False)
+
+
+# [I18N] Copy one locale of a project into another
+class LocaleDuplicateSerializer(serializers.Serializer):
+    """Input for POST /api/projects/<id>/duplicate-locale/."""
+    source_locale = serializers.ChoiceField(choices=LocaleChoices.choices)
+    target_locale = serializers.ChoiceField(choices=LocaleChoices.choices)
+    mode = serializers.ChoiceField(choices=["skip", "merge"], default="skip")
+    pages = serializers.ListField(
+        child=serializers.IntegerField(),
+        required=False,
+        help_text="Only copy these source page ids (default: every page of the source locale)",
+    )
+    include_navigation = serializers.BooleanField(default=True)
+
+    def validate(self, attrs):
+        if attrs["source_locale"] == attrs["target_locale"]:
+            raise serializers.ValidationError("Source and target locale must differ.")
+        return attrs
+
+
+# [JOBS] Background job status
+class BackgroundJobSerializer(serializers.ModelSerializer):
+    """
+    ``error`` is the last line of the failure (e.g. "ValueError: ...");
+    the full ``traceback`` is only included for staff users.
+    """
+    progress = serializers.SerializerMethodField()
+    error = serializers.SerializerMethodField()
+    traceback = serializers.CharField(source="error", read_only=True)
+
+    class Meta:
+        model = BackgroundJob
+        fields = [
+            "id",
+            "kind",
+            "status",
+            "progress",
+            "result",
+            "error",
+            "traceback",
+            "attempts",
+            "max_attempts",
+            "created_at",
+            "started_at",
+            "finished_at",
+        ]
+        read_only_fields = fields
+
+    def get_progress(self, obj):
+        return {
+            "current": obj.progress_current,
+            "total": obj.progress_total,
+            "message": obj.progress_message,
+        }
+
+    def get_error(self, obj):
+        lines = obj.error.strip().splitlines()
+        return lines[-1][:255] if lines else ""
+
+    def to_representation(self, instance):
+        data = super().to_representation(instance)
+        request = self.context.get("request")
+        if not (request and request.user.is_staff):
+            data.pop("traceback")
+        return data
 
 
 # [TEMPLAB] Template Lab admin serializers
@@ -893,33 +1017,288 @@ class PageSeoUpdateSerializer(serializers.ModelSerializer):
 
 # [CONTENT] Field and Section Content Update Serializers
 class FieldUpdateSerializer(serializers.Serializer):
-    key = serializers.CharField()
+    key = serializers.CharField(max_length=80)
     value = serializers.CharField(allow_blank=True, allow_null=True, required=False)
 
 
 class SectionContentUpdateSerializer(serializers.Serializer):
     """
     Payload to update fields of a single Section.
+
+    All changes are written with one bulk_update inside one transaction;
+    unchanged values are skipped. Keys the section does not have are
+    reported in ``unknown_keys``, or created in bulk (and reported in
+    ``created_keys``) when ``create_missing`` is true.
     """
     fields = FieldUpdateSerializer(many=True)
+    create_missing = serializers.BooleanField(required=False, default=False, write_only=True)
 
     def update(self, instance, validated_data):
         fields_data = validated_data.get("fields", [])
-        field_map = {f.key: f for f in instance.fields.all()}
+        create_missing = validated_data.get("create_missing", False)
 
+        # Last value wins when a key is sent twice
+        values = {}
         for item in fields_data:
-            key = item.get("key")
-            value = item.get("value", "")
-            field = field_map.get(key)
-            if field:
-                field.value = value
-                field.save()
-
+            values[item["key"]] = item.get("value") or ""
+
+        with transaction.atomic():
+            field_map = {f.key: f for f in instance.fields.all()}
+            now = timezone.now()
+
+            changed = []
+            for key, value in values.items():
+                field = field_map.get(key)
+                if field is not None and field.value != value:
+                    field.value = value
+                    field.updated_at = now
+                    changed.append(field)
+            if changed:
+                Field.objects.bulk_update(changed, ["value", "updated_at"])
+
+            unknown_keys = [key for key in values if key not in field_map]
+            created_keys = []
+            if unknown_keys and create_missing:
+                next_order = max((f.order for f in field_map.values()), default=-1) + 1
+                Field.objects.bulk_create([
+                    Field(
+                        section=instance,
+                        key=key,
+                        label=key.replace("_", " ").title(),
+                        value=values[key],
+                        order=next_order + index,
+                    )
+                    for index, key in enumerate(unknown_keys)
+                ])
+                created_keys, unknown_keys = unknown_keys, []
+
+            # Bulk writes bypass the Field signals (sites/signals.py)
+            if changed or created_keys:
+                bump_content_version(pages__id=instance.page_id)
+                rebuild_page_documents([instance.page_id])
+
+        self._unknown_keys = unknown_keys
+        self._created_keys = created_keys
         return instance
 
     def create(self, validated_data):
         raise NotImplementedError("Use update() with an existing Section.")
 
+    def to_representation(self, instance):
+        data = super().to_representation(instance)
+        data["unknown_keys"] = getattr(self, "_unknown_keys", [])
+        data["created_keys"] = getattr(self, "_created_keys", [])
+        return data
+
+
+# [ORDER] Reorder a group of sections, slides or navigation items
+class ReorderSerializer(serializers.Serializer):
+    """The complete new id sequence of one sibling group."""
+
+    ids = serializers.ListField(
+        child=serializers.IntegerField(min_value=1), allow_empty=False, max_length=1000
+    )
+
+
+# [EDITOR] Page batch save with optimistic concurrency
+class PageVersionConflict(Exception):
+    """The page changed since the version the client based its edits on."""
+
+    def __init__(self, current_version):
+        super().__init__(f"Page is at version {current_version}")
+        self.current_version = current_version
+
+
+class BatchFieldValueSerializer(serializers.Serializer):
+    section = serializers.IntegerField()
+    key = serializers.CharField(max_length=80)
+    value = serializers.CharField(allow_blank=True, allow_null=True, required=False)
+
+
+class BatchNewFieldSerializer(serializers.Serializer):
+    key = serializers.CharField(max_length=80)
+    label = serializers.CharField(max_length=120, allow_blank=True, required=False)
+    value = serializers.CharField(allow_blank=True, allow_null=True, required=False)
+
+
+class BatchNewSectionSerializer(serializers.Serializer):
+    identifier = serializers.CharField(max_length=80)
+    internal_name = serializers.CharField(max_length=120, allow_blank=True, required=False)
+    order = serializers.IntegerField(min_value=0, required=False)
+    fields = BatchNewFieldSerializer(many=True, required=False)
+
+
+class PageBatchSaveSerializer(serializers.Serializer):
+    """
+    One editor save for a whole page: field values, section order, added
+    and removed sections and SEO fields, applied in a single transaction.
+
+    ``version`` must be the page version the client loaded (it is part of
+    the page snapshot). If the page changed in the meantime nothing is
+    written and PageVersionConflict is raised. On success the page version
+    is incremented once and the response is the updated page snapshot.
+
+    ``section_order`` lists section ids in their new order; sections that
+    are not listed keep their relative order after the listed ones. Field
+    values for keys a section does not have are reported in
+    ``unknown_fields``.
+    """
+    version = serializers.IntegerField(min_value=1)
+    fields = BatchFieldValueSerializer(many=True, required=False)
+    section_order = serializers.ListField(child=serializers.IntegerField(), required=False)
+    add_sections = BatchNewSectionSerializer(many=True, required=False)
+    remove_sections = serializers.ListField(child=serializers.IntegerField(), required=False)
+    seo = PageSeoUpdateSerializer(required=False)
+
+    def validate(self, attrs):
+        page = self.instance
+        # Report a stale page before validating edits against its newer state
+        if attrs["version"] != page.version:
+            raise PageVersionConflict(page.version)
+
+        sections = dict(Section.objects.filter(page=page).values_list("id", "identifier"))
+        removed = set(attrs.get("remove_sections", []))
+        remaining = set(sections) - removed
+
+        errors = {}
+        if removed - set(sections):
+            errors["remove_sections"] = "Some sections do not belong to this page."
+
+        order = attrs.get("section_order", [])
+        if len(set(order)) != len(order):
+            errors["section_order"] = "Section ids must not repeat."
+        elif set(order) - remaining:
+            errors["section_order"] = "Some sections do not belong to this page or are being removed."
+
+        if {item["section"] for item in attrs.get("fields", [])} - remaining:
+            errors["fields"] = "Some sections do not belong to this page or are being removed."
+
+        taken = {sections[section_id] for section_id in remaining}
+        for item in attrs.get("add_sections", []):
+            if item["identifier"] in taken:
+                errors["add_sections"] = f"Identifier '{item['identifier']}' is already used on this page."
+                break
+            taken.add(item["identifier"])
+
+        if errors:
+            raise serializers.ValidationError(errors)
+        return attrs
+
+    def update(self, instance, validated_data):
+        expected_version = validated_data["version"]
+        seo = validated_data.get("seo") or {}
+        has_changes = any(
+            validated_data.get(key)
+            for key in ("fields", "section_order", "add_sections", "remove_sections", "seo")
+        )
+
+        self._unknown_fields = []
+        self._created_sections = {}
+
+        with transaction.atomic():
+            # Compare-and-swap: the conditional UPDATE also locks the page row
+            # until commit, so concurrent batch saves are serialized.
+            pages = Page.objects.filter(pk=instance.pk, version=expected_version)
+            matched = pages.update(version=F("version") + 1) if has_changes else pages.exists()
+            if not matched:
+                current = Page.objects.filter(pk=instance.pk).values_list("version", flat=True).first()
+                raise PageVersionConflict(current)
+            if not has_changes:
+                return instance
+
+            # The version was bumped above, so the rebuild must not bump it again
+            with deferred_page_documents(bump_version=False):
+                self._apply_changes(instance, validated_data)
+                if seo:
+                    for attr, value in seo.items():
+                        setattr(instance, attr, value)
+                    # Page signals bump the content version and route tables
+                    instance.save(update_fields=[*seo, "updated_at"])
+
+        instance.refresh_from_db()
+        return instance
+
+    def _apply_changes(self, page, validated_data):
+        removed = validated_data.get("remove_sections", [])
+        if removed:
+            Section.objects.filter(page=page, id__in=removed).delete()
+
+        sections = list(Section.objects.filter(page=page).order_by("order", "id"))
+
+        order = validated_data.get("section_order", [])
+        if order:
+            position = {section_id: index for index, section_id in enumerate(order)}
+            sections.sort(key=lambda section: position.get(section.id, len(position)))
+            # [ORDER] Only sections that actually moved are written
+            changes = plan_order([(section.id, section.order) for section in sections])
+            moved = []
+            for section in sections:
+                if section.id in changes:
+                    section.order = changes[section.id]
+                    moved.append(section)
+            if moved:
+                Section.objects.bulk_update(moved, ["order"])
+
+        values = {}
+        for item in validated_data.get("fields", []):
+            # Last value wins when a key is sent twice
+            values[(item["section"], item["key"])] = item.get("value") or ""
+        if values:
+            now = timezone.now()
+            existing = Field.objects.filter(section_id__in={section_id for section_id, _ in values})
+            field_map = {(field.section_id, field.key): field for field in existing}
+            changed = []
+            for lookup, value in values.items():
+                field = field_map.get(lookup)
+                if field is None:
+                    self._unknown_fields.append({"section": lookup[0], "key": lookup[1]})
+                elif field.value != value:
+                    field.value = value
+                    field.updated_at = now
+                    changed.append(field)
+            if changed:
+                Field.objects.bulk_update(changed, ["value", "updated_at"])
+
+        added = validated_data.get("add_sections", [])
+        if added:
+            next_order = max((section.order for section in sections), default=0) + ORDER_GAP
+            new_sections = []
+            for item in added:
+                new_sections.append(Section(
+                    page=page,
+                    identifier=item["identifier"],
+                    internal_name=item.get("internal_name", ""),
+                    order=item.get("order", next_order),
+                ))
+                if "order" not in item:
+                    next_order += ORDER_GAP
+            Section.objects.bulk_create(new_sections)
+            Field.objects.bulk_create([
+                Field(
+                    section=section,
+                    key=field["key"],
+                    label=field.get("label") or field["key"].replace("_", " ").title(),
+                    value=field.get("value") or "",
+                    order=index,
+                )
+                for section, item in zip(new_sections, added)
+                for index, field in enumerate(item.get("fields", []))
+            ])
+            self._created_sections = {section.identifier: section.id for section in new_sections}
+
+        # Bulk writes bypass the Section/Field signals (sites/signals.py)
+        bump_content_version(id=page.project_id)
+        rebuild_page_documents([page.id])
+
+    def create(self, validated_data):
+        raise NotImplementedError("Use update() with an existing Page.")
+
+    def to_representation(self, instance):
+        data = PageDocumentSnapshotSerializer(instance, context=self.context).data
+        data["unknown_fields"] = getattr(self, "_unknown_fields", [])
+        data["created_sections"] = getattr(self, "_created_sections", {})
+        return data
+
 
 # [GARAGE-FORM] Quote Request Serializer
 class QuoteRequestSerializer(serializers.ModelSerializer):
@@ -1121,20 +1500,11 @@ class Step0OnboardingSerializer(serializers.Serializer):
         else:
             # Create new project (no projects or multiple projects)
             business_name = validated_data['business_name']
-            base_slug = slugify(business_name)
-            
-            # Ensure unique slug
-            slug = base_slug
-            counter = 1
-            while SiteProject.objects.filter(slug=slug).exists():
-                slug = f"{base_slug}-{counter}"
-                counter += 1
             
             # Set default values
             project_data = {
                 'owner': user,
                 'name': business_name,
-                'slug': slug,
                 **validated_data
             }
             
@@ -1149,7 +1519,12 @@ class Step0OnboardingSerializer(serializers.Serializer):
                 if default_template:
                     project_data['site_template'] = default_template
             
-            project = SiteProject.objects.create(**project_data)
+            # Unique slug; retried if a concurrent signup takes it first
+            project = create_with_unique_slug(
+                SiteProject.all_objects.all(), 'slug', slugify(business_name),
+                lambda slug: SiteProject.objects.create(slug=slug, **project_data),
+                max_length=150, fallback='site',
+            )
         
         project.save()
         return project
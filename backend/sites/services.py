@@ -1,7 +1,15 @@
 # [TEMPLAB] Services for Template Lab functionality
 
-from typing import Optional
-from .models import Section, TemplateSection, TemplateSectionField
+from typing import List, Optional
+
+from django.db import transaction
+from django.utils import timezone
+
+from .caching import bump_content_version
+from .documents import rebuild_page_documents
+from .models import Field, Page, Section, TemplateSection, TemplateSectionField
+from .ordering import ORDER_GAP, next_order
+from .slugs import create_with_unique_slug, free_slug
 
 
 def create_template_section_from_section(
@@ -22,37 +30,39 @@ def create_template_section_from_section(
     Returns:
         The created TemplateSection with cloned fields
     """
-    if key is None:
+    generated = key is None
+    if generated:
         # Generate key pattern: jcw-<template-key>-<page-slug>-<section-identifier>
-        template_key = section.page.site.site_template.key.replace("_", "-")
+        template_key = section.page.project.site_template.key.replace("_", "-")
         page_slug = section.page.slug.replace("_", "-") 
         section_id = section.identifier.replace("_", "-")
         key = f"jcw-{template_key}-{page_slug}-{section_id}"
-        
-        # Ensure uniqueness by appending counter if needed
-        base_key = key
-        counter = 1
-        while TemplateSection.objects.filter(code=key).exists():
-            key = f"{base_key}-{counter:02d}"
-            counter += 1
     
     if name is None:
         name = section.internal_name or section.identifier
     
-    # Create the TemplateSection
-    template_section = TemplateSection.objects.create(
-        site_template=section.page.site.site_template,
-        identifier=section.identifier,
-        internal_name=name,
-        code=key,
-        source_section=section,
-        # Set reasonable defaults for other fields
-        group=_extract_group_from_identifier(section.identifier),
-        section_type=_infer_section_type(section.identifier),
-        default_order=section.order,
-        is_active=True,
-        notes=f"Cloned from {section.page.site.name} - {section.page.title} - {section.identifier}"
-    )
+    def create(code):
+        return TemplateSection.objects.create(
+            site_template=section.page.project.site_template,
+            identifier=section.identifier,
+            internal_name=name,
+            code=code,
+            source_section=section,
+            # Set reasonable defaults for other fields
+            group=_extract_group_from_identifier(section.identifier),
+            section_type=_infer_section_type(section.identifier),
+            default_order=section.order,
+            is_active=True,
+            notes=f"Cloned from {section.page.project.name} - {section.page.title} - {section.identifier}"
+        )
+    
+    # Create the TemplateSection; generated keys get a counter if taken
+    if generated:
+        template_section = create_with_unique_slug(
+            TemplateSection.objects.all(), "code", key, create, width=2, max_length=150
+        )
+    else:
+        template_section = create(key)
     
     # Copy all fields from the original section
     for field in section.fields.all().order_by("order", "id"):
@@ -120,4 +130,118 @@ def _infer_section_type(identifier: str) -> str:
         if pattern in identifier_lower:
             return section_type
     
-    return 'other'
\ No newline at end of file
+    return 'other'
+
+# [AI-DRAFTS] Section draft materialization
+
+# (AI key, Field key, label) in field order
+AI_SECTION_FIELDS = [
+    ("title", "title", "Title"),
+    ("content", "content", "Content"),
+    ("image_url", "image_url", "Image URL"),
+    ("cta_text", "cta_text", "Call to Action Text"),
+    ("cta_url", "cta_url", "Call to Action URL"),
+]
+AI_METADATA_FIELDS = [
+    ("business_type", "Business Type"),
+    ("overall_theme", "Overall Theme"),
+    ("color_scheme", "Color Scheme"),
+]
+AI_METADATA_IDENTIFIER = "ai-metadata"
+
+
+def materialize_section_draft(page: Page, ai_data: dict) -> List[dict]:
+    """
+    Create Sections and Fields on ``page`` from a SectionDraft's AI output
+    in one transaction: identifiers are allocated in memory from a single
+    query and rows are written with one bulk_create per model, so a failure
+    leaves nothing behind. Returns a summary dict per created section.
+    """
+    sections_data = ai_data.get("sections", [])
+    metadata = [
+        (order, key, label, ai_data[key])
+        for order, (key, label) in enumerate(AI_METADATA_FIELDS)
+        if ai_data.get(key)
+    ]
+
+    with transaction.atomic():
+        existing = dict(page.sections.values_list("identifier", "id"))
+        taken = set(existing)
+        first_order = next_order(page.sections.all())
+
+        new_sections = []
+        section_fields = []
+        for i, section_data in enumerate(sections_data):
+            section_type = str(section_data.get("type", "content"))
+            section_title = section_data.get("title", f"AI Section {i + 1}")
+
+            identifier = free_slug(f"ai-{section_type}"[:70] + f"-{i + 1}", taken)
+            taken.add(identifier)
+            new_sections.append(Section(
+                page=page,
+                identifier=identifier,
+                internal_name=str(section_title)[:120],
+                order=first_order + ORDER_GAP * i,
+            ))
+
+            fields = [
+                (key, label, section_data[ai_key])
+                for ai_key, key, label in AI_SECTION_FIELDS
+                if section_data.get(ai_key)
+            ]
+            # Section type field for frontend rendering
+            fields.append(("section_type", "Section Type", section_type))
+            section_fields.append(fields)
+
+        metadata_section_id = existing.get(AI_METADATA_IDENTIFIER)
+        if metadata and metadata_section_id is None:
+            # Put metadata at the top
+            new_sections.append(Section(
+                page=page, identifier=AI_METADATA_IDENTIFIER, internal_name="AI Metadata", order=0
+            ))
+
+        Section.objects.bulk_create(new_sections)
+        new_fields = [
+            Field(section=section, key=key, label=label, value=value, order=order)
+            for section, fields in zip(new_sections, section_fields)
+            for order, (key, label, value) in enumerate(fields)
+        ]
+
+        if metadata:
+            if metadata_section_id is None:
+                metadata_section_id = new_sections[-1].id
+            current = {
+                field.key: field
+                for field in Field.objects.filter(
+                    section_id=metadata_section_id, key__in=[key for _, key, _, _ in metadata]
+                )
+            }
+            changed = []
+            for order, key, label, value in metadata:
+                field = current.get(key)
+                if field is None:
+                    new_fields.append(Field(
+                        section_id=metadata_section_id, key=key, label=label, value=value, order=order
+                    ))
+                else:
+                    field.label, field.value, field.order = label, value, order
+                    field.updated_at = timezone.now()
+                    changed.append(field)
+            if changed:
+                Field.objects.bulk_update(changed, ["label", "value", "order", "updated_at"])
+
+        Field.objects.bulk_create(new_fields)
+
+        # Bulk writes skip the model signals
+        bump_content_version(id=page.project_id)
+        rebuild_page_documents([page.id])
+
+    return [
+        {
+            "id": section.id,
+            "identifier": section.identifier,
+            "internal_name": section.internal_name,
+            "fields_count": len(fields),
+        }
+        for section, fields in zip(new_sections, section_fields)
+    ]
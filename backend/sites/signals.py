@@ -0,0 +1,126 @@
+# [CACHE] Content change signals
+
+"""
+Keeps state derived from a project's content tree in sync on write:
+
+- ``SiteProject.content_updated_at``, which versions the cached public
+  payloads and the ETags derived from them (sites/caching.py);
+- ``Page.content_document`` (sites/documents.py);
+- compiled route tables (sites/routing.py).
+
+Cascade deletes send post_delete for every child row; handlers use the
+delete's ``origin`` to skip work the parent's own handler covers, and
+lookups for rows already gone simply match nothing.
+"""
+
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+from django.utils import timezone
+
+from .caching import bump_content_version
+from .documents import rebuild_page_documents
+from .routing import invalidate_route_table
+from .models import (
+    Field,
+    HeroSlide,
+    HomepageSlide,
+    HomepageSlider,
+    NavigationItem,
+    Page,
+    Section,
+    SiteProject,
+    TestimonialCarousel,
+    TestimonialSlide,
+)
+
+
+@receiver(pre_save, sender=SiteProject)
+def site_project_pre_save(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    instance.content_updated_at = timezone.now()
+
+
+@receiver([post_save, post_delete], sender=SiteProject)
+def site_project_changed(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    # [ROUTES] slug and locales feed the compiled route table
+    invalidate_route_table(instance.pk)
+
+
+@receiver([post_save, post_delete], sender=Page)
+def page_changed(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    bump_content_version(id=instance.project_id)
+    invalidate_route_table(instance.project_id)
+    if kwargs.get("signal") is post_save and not kwargs.get("created"):
+        # [EDITOR] A full save writes back the in-memory content_document;
+        # rebuilding it also bumps the page version (unless a batch save
+        # defers the rebuild after bumping it itself)
+        rebuild_page_documents([instance.pk])
+        instance.version = Page.objects.filter(pk=instance.pk).values_list("version", flat=True).first()
+
+
+@receiver([post_save, post_delete], sender=Section)
+def section_changed(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    bump_content_version(pages__id=instance.page_id)
+    # [DOCS] No document to maintain when the whole page is being deleted
+    if not isinstance(kwargs.get("origin"), Page):
+        rebuild_page_documents([instance.page_id])
+
+
+@receiver([post_save, post_delete], sender=HeroSlide)
+def hero_slide_changed(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    bump_content_version(pages__id=instance.page_id)
+
+
+@receiver([post_save, post_delete], sender=Field)
+def field_changed(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    bump_content_version(pages__sections__id=instance.section_id)
+    # [DOCS] Cascades from a section/page delete are handled by the parent
+    if not isinstance(kwargs.get("origin"), (Page, Section)):
+        page_id = (
+            Section.objects.filter(id=instance.section_id)
+            .values_list("page_id", flat=True)
+            .first()
+        )
+        rebuild_page_documents([page_id])
+
+
+@receiver([post_save, post_delete], sender=NavigationItem)
+def navigation_item_changed(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    bump_content_version(id=instance.project_id)
+
+
+# Sliders and carousels are part of the site bootstrap payload
+
+@receiver([post_save, post_delete], sender=HomepageSlider)
+@receiver([post_save, post_delete], sender=TestimonialCarousel)
+def slider_changed(sender, instance, raw=False, **kwargs):
+    if raw or not instance.site_project_id:
+        return
+    bump_content_version(id=instance.site_project_id)
+
+
+@receiver([post_save, post_delete], sender=HomepageSlide)
+def homepage_slide_changed(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    bump_content_version(homepage_sliders__id=instance.slider_id)
+
+
+@receiver([post_save, post_delete], sender=TestimonialSlide)
+def testimonial_slide_changed(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    bump_content_version(testimonial_carousels__id=instance.carousel_id)
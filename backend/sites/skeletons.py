@@ -0,0 +1,454 @@
+# [SKELETON] Declarative template skeletons
+
+"""
+The skeleton of a SiteTemplate (the pages, sections, fields and navigation
+of its hidden master project) is described as data:
+
+    {
+        "pages": [
+            {
+                "slug": "home", "path": "/", "title": "Home", "order": 0,
+                "locale": "en",                                   # optional
+                "sections": [
+                    {
+                        "identifier": "front-hero1", "internal_name": "Hero Section",
+                        "fields": [
+                            {"key": "title", "label": "Main Title", "value": "Welcome"},
+                        ],
+                    },
+                ],
+            },
+        ],
+        "navigation": [
+            {"location": "header", "label": "Home", "url": "/", "order": 0},
+            {"location": "footer", "label": "Home", "url": "/", "column": 1, "order": 0},
+        ],
+    }
+
+Missing ``order`` values default to the position in their list and missing
+labels are derived from the key. The spec of a template is, in order of
+preference: ``SiteTemplate.skeleton_spec``; one derived from the template's
+active TemplateSection/TemplateSectionField rows; ``DEFAULT_SKELETON_SPEC``.
+
+``apply_skeleton`` diffs a spec against an existing master project and only
+creates, updates or deletes the rows that differ (bulk operations per
+level), so page, section and field ids survive regeneration.
+"""
+
+from typing import Dict, List
+
+from django.db import transaction
+
+from .caching import bump_content_version
+from .documents import rebuild_page_documents
+from .models import (
+    Field,
+    NavigationItem,
+    Page,
+    Section,
+    SiteProject,
+    SiteTemplate,
+    TemplateSection,
+    TemplateSectionField,
+)
+from .routing import invalidate_route_table
+from .slugs import free_slug
+
+
+SKELETON_BATCH_SIZE = 500
+
+DEFAULT_SKELETON_SPEC = {
+    "pages": [
+        {
+            "slug": "home",
+            "path": "/",
+            "title": "Home",
+            "sections": [
+                {
+                    "identifier": "front-hero1",
+                    "internal_name": "Hero Section",
+                    "fields": [
+                        {"key": "title", "label": "Main Title", "value": "Welcome to Our Website"},
+                        {"key": "subtitle", "label": "Subtitle", "value": "We provide amazing services"},
+                        {"key": "cta_text", "label": "Call to Action Text", "value": "Get Started"},
+                        {"key": "cta_url", "label": "Call to Action URL", "value": "/contact"},
+                    ],
+                },
+                {
+                    "identifier": "front-services1",
+                    "internal_name": "Services Overview",
+                    "fields": [
+                        {"key": "title", "label": "Section Title", "value": "Our Services"},
+                        {"key": "description", "label": "Description", "value": "We offer a range of professional services"},
+                        {"key": "items", "label": "Service Items (JSON)", "value": "[]"},
+                    ],
+                },
+                {
+                    "identifier": "front-cta1",
+                    "internal_name": "Call to Action",
+                    "fields": [
+                        {"key": "title", "label": "CTA Title", "value": "Ready to Get Started?"},
+                        {"key": "text", "label": "CTA Text", "value": "Contact us today"},
+                        {"key": "button_text", "label": "Button Text", "value": "Contact Us"},
+                        {"key": "button_url", "label": "Button URL", "value": "/contact"},
+                    ],
+                },
+            ],
+        },
+        {
+            "slug": "about",
+            "path": "/about",
+            "title": "About Us",
+            "sections": [
+                {
+                    "identifier": "about-main1",
+                    "internal_name": "About Content",
+                    "fields": [
+                        {"key": "title", "label": "Page Title", "value": "About Us"},
+                        {"key": "content", "label": "Main Content", "value": "Tell your story here..."},
+                    ],
+                },
+            ],
+        },
+        {
+            "slug": "services",
+            "path": "/services",
+            "title": "Services",
+            "sections": [
+                {
+                    "identifier": "services-main1",
+                    "internal_name": "Services Content",
+                    "fields": [
+                        {"key": "title", "label": "Page Title", "value": "Our Services"},
+                        {"key": "services_list", "label": "Services List (JSON)", "value": "[]"},
+                    ],
+                },
+            ],
+        },
+        {
+            "slug": "contact",
+            "path": "/contact",
+            "title": "Contact",
+            "sections": [
+                {
+                    "identifier": "contact-main1",
+                    "internal_name": "Contact Content",
+                    "fields": [
+                        {"key": "title", "label": "Page Title", "value": "Contact Us"},
+                        {"key": "address", "label": "Address", "value": "Your address here"},
+                        {"key": "phone", "label": "Phone", "value": "Your phone here"},
+                        {"key": "email", "label": "Email", "value": "your@email.com"},
+                    ],
+                },
+            ],
+        },
+    ],
+    "navigation": [
+        {"location": "header", "label": "Home", "url": "/", "order": 0},
+        {"location": "header", "label": "About", "url": "/about", "order": 1},
+        {"location": "header", "label": "Services", "url": "/services", "order": 2},
+        {"location": "header", "label": "Contact", "url": "/contact", "order": 3},
+        # Footer navigation
+        {"location": "footer", "label": "Home", "url": "/", "column": 1, "order": 0},
+        {"location": "footer", "label": "About", "url": "/about", "column": 1, "order": 1},
+        {"location": "footer", "label": "Services", "url": "/services", "column": 2, "order": 0},
+        {"location": "footer", "label": "Contact", "url": "/contact", "column": 2, "order": 1},
+    ],
+}
+
+# TemplateSection.section_type -> page of the default layout it is placed on
+SECTION_TYPE_PAGES = {
+    "about": "about",
+    "team": "about",
+    "services": "services",
+    "pricing": "services",
+    "menu": "services",
+    "form-contact": "contact",
+    "form-booking": "contact",
+    "form-lead": "contact",
+    "form-quote": "contact",
+}
+
+
+class SkeletonSpecError(ValueError):
+    pass
+
+
+def normalize_skeleton_spec(spec: dict, default_locale: str = "en") -> dict:
+    """Validate a spec and fill in defaults (orders, labels, locales)."""
+    if not isinstance(spec, dict) or not isinstance(spec.get("pages"), list):
+        raise SkeletonSpecError('A skeleton spec needs a "pages" list.')
+
+    pages, seen_pages = [], set()
+    for page_index, page in enumerate(spec["pages"]):
+        try:
+            slug, path, title = page["slug"], page["path"], page.get("title") or page["slug"].title()
+        except (KeyError, TypeError, AttributeError):
+            raise SkeletonSpecError(f'Page #{page_index} needs "slug" and "path".')
+        locale = page.get("locale") or default_locale
+        if (slug, locale) in seen_pages:
+            raise SkeletonSpecError(f'Page "{slug}" ({locale}) is defined twice.')
+        seen_pages.add((slug, locale))
+
+        sections, seen_sections = [], set()
+        for section_index, section in enumerate(page.get("sections") or []):
+            identifier = section.get("identifier")
+            if not identifier or identifier in seen_sections:
+                raise SkeletonSpecError(f'Page "{slug}": section #{section_index} needs a unique "identifier".')
+            if len(identifier) > Section._meta.get_field("identifier").max_length:
+                raise SkeletonSpecError(f'Section "{identifier}": the identifier is too long.')
+            seen_sections.add(identifier)
+
+            fields, seen_keys = [], set()
+            for field_index, field in enumerate(section.get("fields") or []):
+                key = field.get("key")
+                if not key or key in seen_keys:
+                    raise SkeletonSpecError(f'Section "{identifier}": field #{field_index} needs a unique "key".')
+                seen_keys.add(key)
+                fields.append({
+                    "key": key,
+                    "label": field.get("label") or key.replace("_", " ").title(),
+                    "value": field.get("value") or "",
+                    "order": field.get("order", field_index),
+                })
+            sections.append({
+                "identifier": identifier,
+                "internal_name": section.get("internal_name", ""),
+                "order": section.get("order", section_index),
+                "fields": fields,
+            })
+        pages.append({
+            "slug": slug,
+            "path": path,
+            "title": title,
+            "locale": locale,
+            "order": page.get("order", page_index),
+            "is_published": page.get("is_published", True),
+            "sections": sections,
+        })
+
+    navigation = []
+    for nav_index, item in enumerate(spec.get("navigation") or []):
+        if not item.get("location") or not item.get("label"):
+            raise SkeletonSpecError(f'Navigation item #{nav_index} needs "location" and "label".')
+        navigation.append({
+            "location": item["location"],
+            "label": item["label"],
+            "url": item.get("url", ""),
+            "column": item.get("column"),
+            "locale": item.get("locale") or default_locale,
+            "is_external": item.get("is_external", False),
+            "order": item.get("order", nav_index),
+        })
+
+    return {"pages": pages, "navigation": navigation}
+
+
+def derive_skeleton_spec(site_template: SiteTemplate):
+    """
+    Build a spec from the template's active TemplateSections (first variant
+    of each group, placed on a default page by section type). Returns None
+    when the template has no sections.
+    """
+    template_sections = list(
+        TemplateSection.objects.filter(site_template=site_template, is_active=True)
+        .order_by("default_order", "variant_index", "id")
+    )
+    first_variants, seen_groups = [], set()
+    for template_section in template_sections:
+        group = template_section.group or template_section.code
+        if group not in seen_groups:
+            seen_groups.add(group)
+            first_variants.append(template_section)
+    if not first_variants:
+        return None
+
+    fields_by_section = {}
+    for field in TemplateSectionField.objects.filter(
+        template_section__in=first_variants
+    ).order_by("order", "id"):
+        fields_by_section.setdefault(field.template_section_id, []).append(
+            {"key": field.key, "label": field.label, "value": field.value, "order": field.order}
+        )
+
+    identifier_length = Section._meta.get_field("identifier").max_length
+    pages = [dict(page, sections=[]) for page in DEFAULT_SKELETON_SPEC["pages"]]
+    pages_by_slug = {page["slug"]: page for page in pages}
+    for template_section in first_variants:
+        page = pages_by_slug[SECTION_TYPE_PAGES.get(template_section.section_type, "home")]
+        # Template identifiers and codes may be longer than Section.identifier
+        identifier = free_slug(
+            template_section.identifier or template_section.code,
+            [section["identifier"] for section in page["sections"]],
+            max_length=identifier_length,
+        )
+        page["sections"].append({
+            "identifier": identifier,
+            "internal_name": template_section.internal_name,
+            "fields": fields_by_section.get(template_section.id, []),
+        })
+    # Pages the template has nothing for keep the default layout
+    for page, default_page in zip(pages, DEFAULT_SKELETON_SPEC["pages"]):
+        if not page["sections"]:
+            page["sections"] = default_page["sections"]
+
+    return {"pages": pages, "navigation": DEFAULT_SKELETON_SPEC["navigation"]}
+
+
+def get_skeleton_spec(site_template: SiteTemplate) -> dict:
+    """The normalized skeleton spec of a template (see module docstring)."""
+    spec = site_template.skeleton_spec or derive_skeleton_spec(site_template) or DEFAULT_SKELETON_SPEC
+    return normalize_skeleton_spec(spec)
+
+
+def _apply_changes(model, existing: dict, wanted: dict, build, attrs: List[str]):
+    """
+    Diff rows by key: bulk_create missing ones, bulk_update changed ones and
+    delete the rest. Returns (created, updated, deleted) model instances.
+    """
+    created = [build(key, values) for key, values in wanted.items() if key not in existing]
+    model.objects.bulk_create(created, batch_size=SKELETON_BATCH_SIZE)
+
+    updated = []
+    for key, obj in existing.items():
+        values = wanted.get(key)
+        if values is None:
+            continue
+        changed = [attr for attr in attrs if getattr(obj, attr) != values[attr]]
+        if changed:
+            for attr in attrs:
+                setattr(obj, attr, values[attr])
+            updated.append(obj)
+    if updated:
+        model.objects.bulk_update(updated, attrs, batch_size=SKELETON_BATCH_SIZE)
+
+    deleted = [obj for key, obj in existing.items() if key not in wanted]
+    if deleted:
+        model.objects.filter(pk__in=[obj.pk for obj in deleted]).delete()
+    return created, updated, deleted
+
+
+def apply_skeleton(project: SiteProject, spec: dict) -> Dict[str, int]:
+    """
+    Make a (master) project match a normalized skeleton spec, touching only
+    the rows that differ. Returns created/updated/deleted counts per model.
+    """
+    counts = {}
+
+    def count(name, result):
+        created, updated, deleted = result
+        counts[f"{name}_created"] = len(created)
+        counts[f"{name}_updated"] = len(updated)
+        counts[f"{name}_deleted"] = len(deleted)
+
+    with transaction.atomic():
+        # Pages, keyed by (slug, locale)
+        wanted_pages = {(page["slug"], page["locale"]): page for page in spec["pages"]}
+        existing_pages = {
+            (page.slug, page.locale): page for page in Page.objects.filter(project=project)
+        }
+        page_attrs = ["path", "title", "order", "is_published"]
+        result = _apply_changes(
+            Page,
+            existing_pages,
+            wanted_pages,
+            lambda key, values: Page(
+                project=project, slug=key[0], locale=key[1],
+                **{attr: values[attr] for attr in page_attrs}
+            ),
+            page_attrs,
+        )
+        count("pages", result)
+        page_ids = {
+            (page.slug, page.locale): page.id
+            for page in [*existing_pages.values(), *result[0]]
+            if (page.slug, page.locale) in wanted_pages
+        }
+        touched_page_ids = {page.id for page in [*result[0], *result[1]]}
+
+        # Sections, keyed by (page id, identifier)
+        wanted_sections = {
+            (page_ids[page_key], section["identifier"]): section
+            for page_key, page in wanted_pages.items()
+            for section in page["sections"]
+        }
+        existing_sections = {
+            (section.page_id, section.identifier): section
+            for section in Section.objects.filter(page_id__in=page_ids.values())
+        }
+        section_attrs = ["internal_name", "order"]
+        result = _apply_changes(
+            Section,
+            existing_sections,
+            wanted_sections,
+            lambda key, values: Section(
+                page_id=key[0], identifier=key[1],
+                **{attr: values[attr] for attr in section_attrs}
+            ),
+            section_attrs,
+        )
+        count("sections", result)
+        section_ids = {
+            (section.page_id, section.identifier): section.id
+            for section in [*existing_sections.values(), *result[0]]
+            if (section.page_id, section.identifier) in wanted_sections
+        }
+        touched_page_ids.update(section.page_id for section in [*result[0], *result[1]])
+
+        # Fields, keyed by (section id, key)
+        wanted_fields = {
+            (section_ids[section_key], field["key"]): field
+            for section_key, section in wanted_sections.items()
+            for field in section["fields"]
+        }
+        existing_fields = {
+            (field.section_id, field.key): field
+            for field in Field.objects.filter(section_id__in=section_ids.values())
+        }
+        field_attrs = ["label", "value", "order"]
+        result = _apply_changes(
+            Field,
+            existing_fields,
+            wanted_fields,
+            lambda key, values: Field(
+                section_id=key[0], key=key[1],
+                **{attr: values[attr] for attr in field_attrs}
+            ),
+            field_attrs,
+        )
+        count("fields", result)
+        section_pages = {section_id: key[0] for key, section_id in section_ids.items()}
+        touched_page_ids.update(
+            section_pages[field.section_id] for field in [*result[0], *result[1]]
+        )
+
+        # Navigation, keyed by (locale, location, column, label)
+        wanted_nav = {
+            (item["locale"], item["location"], item["column"], item["label"]): item
+            for item in spec["navigation"]
+        }
+        existing_nav = {
+            (item.locale, item.location, item.column, item.label): item
+            for item in NavigationItem.objects.filter(project=project)
+        }
+        nav_attrs = ["url", "is_external", "order"]
+        result = _apply_changes(
+            NavigationItem,
+            existing_nav,
+            wanted_nav,
+            lambda key, values: NavigationItem(
+                project=project, locale=key[0], location=key[1], column=key[2], label=key[3],
+                **{attr: values[attr] for attr in nav_attrs}
+            ),
+            nav_attrs,
+        )
+        count("navigation_items", result)
+
+        # Bulk writes bypass the model signals (sites/signals.py); deletes
+        # above went through them already.
+        rebuild_page_documents(touched_page_ids & set(page_ids.values()))
+        if any(counts.values()):
+            bump_content_version(id=project.id)
+            invalidate_route_table(project.id)
+
+    return counts
@@ -0,0 +1,103 @@
+# [SLUGS] Unique slug allocation
+
+"""
+Allocates unique slug-like values ("cafe", "cafe-1", "cafe-2", ...) with a
+single query per attempt instead of one ``exists()`` query per collision.
+
+``next_free_slug`` reads every taken value sharing the base with one prefix
+query and returns the base or the next numeric suffix after the highest one
+in use. ``create_with_unique_slug`` also performs the insert and, when a
+concurrent writer took the same value first (IntegrityError on the unique
+constraint), allocates again and retries.
+"""
+
+import re
+from typing import Callable, Iterable, Optional, TypeVar
+
+from django.db import IntegrityError, transaction
+from django.db.models import Q, QuerySet
+
+
+T = TypeVar("T")
+
+SLUG_CREATE_ATTEMPTS = 5
+
+
+def next_free_slug(
+    queryset: QuerySet,
+    field: str,
+    base: str,
+    *,
+    separator: str = "-",
+    width: int = 0,
+    max_length: Optional[int] = None,
+    fallback: str = "item",
+) -> str:
+    """
+    Return ``base`` if no row of ``queryset`` uses it in ``field``, otherwise
+    ``<base><separator><n>`` with n one above the highest suffix in use
+    (zero-padded to ``width`` digits). ``base`` is shortened when needed so
+    the suffixed value fits ``max_length``.
+    """
+    base = shorten_slug_base(base or fallback, max_length, separator=separator, width=width, fallback=fallback)
+    taken = queryset.filter(
+        Q(**{field: base}) | Q(**{f"{field}__startswith": f"{base}{separator}"})
+    ).values_list(field, flat=True)
+    return free_slug(base, taken, separator=separator, width=width)
+
+
+def shorten_slug_base(base: str, max_length: Optional[int], *, separator: str = "-", width: int = 0,
+                      fallback: str = "item") -> str:
+    """Cut ``base`` so that it still fits ``max_length`` with a numeric suffix."""
+    if not max_length:
+        return base
+    # Room for a separator and a few digits
+    return base[:max(1, max_length - len(separator) - max(width, 4))].rstrip(separator) or fallback
+
+
+def free_slug(base: str, taken: Iterable[str], *, separator: str = "-", width: int = 0,
+              max_length: Optional[int] = None) -> str:
+    """
+    In-memory variant of ``next_free_slug`` for callers that allocate many
+    values against one set of taken values read up front.
+    """
+    if max_length and len(base) > max_length:
+        base = shorten_slug_base(base, max_length, separator=separator, width=width)
+    taken = set(taken)
+    if base not in taken:
+        return base
+
+    suffix = re.compile(rf"^{re.escape(base)}{re.escape(separator)}(\d+)$")
+    numbers = [int(match.group(1)) for match in map(suffix.match, taken) if match]
+    slug = f"{base}{separator}{max(numbers, default=0) + 1:0{width}d}"
+    if max_length and len(slug) > max_length:
+        # The suffix does not fit: start over from a shortened base
+        return free_slug(shorten_slug_base(base, max_length, separator=separator, width=width),
+                         taken, separator=separator, width=width)
+    return slug
+
+
+def create_with_unique_slug(
+    queryset: QuerySet,
+    field: str,
+    base: str,
+    create: Callable[[str], T],
+    *,
+    attempts: int = SLUG_CREATE_ATTEMPTS,
+    **options,
+) -> T:
+    """
+    Call ``create(slug)`` with the next free slug (see ``next_free_slug``)
+    inside a savepoint. If the insert fails because another request took the
+    slug in the meantime, allocate a new one and try again.
+    """
+    for attempt in range(attempts):
+        slug = next_free_slug(queryset, field, base, **options)
+        try:
+            with transaction.atomic():
+                return create(slug)
+        except IntegrityError:
+            # Only retry collisions on the slug itself
+            if attempt == attempts - 1 or not queryset.filter(**{field: slug}).exists():
+                raise
+    raise AssertionError("unreachable")
@@ -0,0 +1,206 @@
+# [AI-SUGGEST] Cached, coalesced AI content suggestions for sections
+
+"""
+``SectionAISuggestView`` used to call the model on every click. Suggestions
+are now cached under a key derived from the normalized prompt inputs
+(section identifier, field keys and labels, business name and industry,
+locale, tone, extra instructions, model and prompt version):
+
+    suggestions, cached = suggest_section_content(section, locale="en", tone="...")
+
+The cache is the ``SITES_AI_SUGGEST_CACHE`` alias (the ``jcw_ai_cache``
+database table or Redis by default). Hits are touched, so entries expire
+``SITES_AI_SUGGEST_CACHE_TIMEOUT`` seconds after their last use and a full
+cache evicts the least recently used ones (see settings.CACHES).
+
+Identical requests in flight are coalesced like public site rebuilds
+(sites/caching.py): the request that wins a ``cache.add`` lock calls the
+model, the others wait up to ``SITES_AI_SUGGEST_LOCK_WAIT`` seconds for its
+result, polling after 50 ms and then less and less often. Locks and errors live in the ``SITES_AI_SUGGEST_LOCK_CACHE`` alias
+(the default cache), so culling the answers never drops a lock. The call gets the same time as its budget, so the lock cannot
+expire while it is still running. A failed call is shared with the waiters
+for a few seconds instead of being retried by each of them. Coalescing
+only spans processes when the alias is a shared backend; a LocMemCache
+alias coalesces within each process only.
+
+``refresh=True`` skips the cached entry and stores the new answer; it still
+joins a call that is already in flight, whose answer is new anyway.
+"""
+
+import hashlib
+import json
+import time
+import uuid
+from typing import Tuple
+
+from django.conf import settings
+from django.core.cache import caches
+
+from .ai import AIBusyError, AIProviderError, complete_json
+from .models import Section
+
+
+SUGGEST_MODEL = "gpt-4o-mini"
+
+# Bump when the prompts or the output handling change
+SUGGEST_PROMPT_VERSION = "1"
+
+SUGGEST_CACHE_PREFIX = "sites:ai-suggest"
+
+SUGGEST_SYSTEM_PROMPT = """You are an assistant that writes website copy for small businesses.
+You must return a JSON object with keys that match the section field keys.
+Do not include any extra keys or explanations – only the JSON.
+Keep content concise and professional."""
+
+# Seconds a failed call is reported to coalesced waiters
+SUGGEST_ERROR_TIMEOUT = 5
+
+# Waiters poll after 50 ms, doubling up to once a second
+SUGGEST_POLL_INTERVAL = 0.05
+SUGGEST_MAX_POLL_INTERVAL = 1.0
+
+
+def get_suggest_cache():
+    return caches[getattr(settings, "SITES_AI_SUGGEST_CACHE", "default")]
+
+
+def get_suggest_lock_cache():
+    return caches[getattr(settings, "SITES_AI_SUGGEST_LOCK_CACHE", "default")]
+
+
+def get_suggest_cache_timeout() -> int:
+    return getattr(settings, "SITES_AI_SUGGEST_CACHE_TIMEOUT", 60 * 60)
+
+
+def get_suggest_lock_wait() -> float:
+    return getattr(settings, "SITES_AI_SUGGEST_LOCK_WAIT", 30.0)
+
+
+def _normalize(value) -> str:
+    return " ".join(str(value or "").split())
+
+
+def build_suggestion_params(section: Section, *, locale: str, tone: str, extra_instructions: str) -> dict:
+    """Prompt inputs in normalized form; equal dicts produce equal prompts."""
+    project = section.page.project
+    fields = sorted(
+        (key, _normalize(label) or key)
+        for key, label in section.fields.values_list("key", "label")
+    )
+    return {
+        "identifier": section.identifier,
+        "fields": fields,
+        "business_name": _normalize(project.name),
+        "industry": _normalize(getattr(project, "business_type", None)) or "local business",
+        "locale": _normalize(locale).lower() or "en",
+        "tone": _normalize(tone).lower() or "friendly and professional",
+        "extra_instructions": _normalize(extra_instructions),
+    }
+
+
+def suggestion_cache_key(params: dict) -> str:
+    payload = json.dumps(params, sort_keys=True, ensure_ascii=False)
+    digest = hashlib.sha256(f"{SUGGEST_MODEL}\n{SUGGEST_PROMPT_VERSION}\n{payload}".encode()).hexdigest()
+    return f"{SUGGEST_CACHE_PREFIX}:{digest}"
+
+
+def build_user_prompt(params: dict) -> str:
+    field_context = ", ".join(f'"{key}": {label}' for key, label in params["fields"])
+    extra_instructions = params["extra_instructions"]
+    return f"""Business name: {params["business_name"]}
+Industry: {params["industry"]}
+Language: {params["locale"]}
+Section type: {params["identifier"]}
+
+Fields needed: {field_context}
+Tone: {params["tone"]}
+{f"Special instructions: {extra_instructions}" if extra_instructions else ""}
+
+Write short, clear copy for this section.
+Keep it realistic for a small business website.
+Return JSON with only the field keys that exist in this section."""
+
+
+def _call_model(params: dict) -> dict:
+    content = complete_json(
+        [
+            {"role": "system", "content": SUGGEST_SYSTEM_PROMPT},
+            {"role": "user", "content": build_user_prompt(params)},
+        ],
+        model=SUGGEST_MODEL,
+        # Finish (or give up) before the coalescing lock expires
+        budget=get_suggest_lock_wait(),
+    )
+    suggested_data = json.loads(content)
+    # Filter to only include valid field keys
+    valid_keys = {key for key, _ in params["fields"]}
+    return {k: v for k, v in suggested_data.items() if k in valid_keys}
+
+
+def suggest_section_content(section: Section, *, locale: str = "en", tone: str = "",
+                            extra_instructions: str = "", refresh: bool = False) -> Tuple[dict, bool]:
+    """
+    Return ``(suggestions, cached)``; ``cached`` is True when no model call
+    was made for this request (cache hit or coalesced with another one).
+    Raises the errors of ``sites.ai.complete_json`` and ValueError for
+    unparseable model output.
+    """
+    params = build_suggestion_params(section, locale=locale, tone=tone, extra_instructions=extra_instructions)
+    key = suggestion_cache_key(params)
+    cache = get_suggest_cache()
+    lock_cache = get_suggest_lock_cache()
+    started = time.time()
+
+    if not refresh:
+        entry = cache.get(key)
+        if entry is not None:
+            # Recently used entries are the last ones evicted
+            cache.touch(key, get_suggest_cache_timeout())
+            return entry["data"], True
+
+    lock_key = f"{key}:lock"
+    error_key = f"{key}:error"
+    lock_token = uuid.uuid4().hex
+    if lock_cache.add(lock_key, lock_token, get_suggest_lock_wait()):
+        try:
+            lock_cache.delete(error_key)
+            data = _call_model(params)
+            cache.set(key, {"data": data, "built_at": time.time()}, get_suggest_cache_timeout())
+            return data, False
+        except Exception as exc:
+            lock_cache.set(error_key, {"message": str(exc), "at": time.time()}, SUGGEST_ERROR_TIMEOUT)
+            raise
+        finally:
+            if lock_cache.get(lock_key) == lock_token:
+                lock_cache.delete(lock_key)
+
+    # Another request is asking the same question: wait for its answer,
+    # polling less and less often
+    deadline = time.monotonic() + get_suggest_lock_wait()
+    interval = SUGGEST_POLL_INTERVAL
+    while True:
+        entry = cache.get(key)
+        if entry is not None and (not refresh or entry["built_at"] >= started):
+            return entry["data"], True
+        error = lock_cache.get(error_key)
+        if error is not None and error["at"] >= started:
+            raise AIProviderError(error["message"], retryable=False)
+        if lock_cache.get(lock_key) is None:
+            break
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise AIBusyError("An identical suggestion request is still running; try again shortly.")
+        time.sleep(min(interval, remaining))
+        interval = min(interval * 2, SUGGEST_MAX_POLL_INTERVAL)
+
+    # The lock is gone; the answer (or error) may have been stored just before
+    entry = cache.get(key)
+    if entry is not None and (not refresh or entry["built_at"] >= started):
+        return entry["data"], True
+    error = lock_cache.get(error_key)
+    if error is not None and error["at"] >= started:
+        raise AIProviderError(error["message"], retryable=False)
+    # The call ended without an answer (e.g. its worker died): ask ourselves
+    return suggest_section_content(
+        section, locale=locale, tone=tone, extra_instructions=extra_instructions, refresh=refresh
+    )
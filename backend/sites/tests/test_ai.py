@@ -0,0 +1,81 @@
+from django.test import SimpleTestCase, override_settings
+
+from sites import ai
+
+
+@override_settings(SITES_AI_BACKOFF=0.001, SITES_AI_MAX_BACKOFF=0.01, SITES_AI_MAX_RETRIES=2)
+class CompleteJsonTests(SimpleTestCase):
+    messages = [{"role": "user", "content": "Hi"}]
+
+    def use(self, **options):
+        provider = ai.FakeProvider(response='{"ok": true}', **options)
+        ai.set_provider(provider)
+        self.addCleanup(ai.set_provider, None)
+        return provider
+
+    def complete(self, **kwargs):
+        return ai.complete_json(self.messages, model="test-model", **kwargs)
+
+    def test_retries_rate_limits_and_server_errors(self):
+        provider = self.use(failures=[429, 503])
+
+        with self.assertLogs("sites.ai", "WARNING"):
+            self.assertEqual(self.complete(), '{"ok": true}')
+        self.assertEqual(len(provider.calls), 3)
+
+    def test_gives_up_after_max_retries(self):
+        provider = self.use(failures=[500, 500, 500])
+
+        with self.assertLogs("sites.ai", "WARNING"), self.assertRaises(ai.AIProviderError) as raised:
+            self.complete()
+        self.assertEqual(raised.exception.status_code, 500)
+        self.assertEqual(len(provider.calls), 3)
+
+    def test_client_errors_are_not_retried(self):
+        provider = self.use(failures=[400])
+
+        with self.assertRaises(ai.AIProviderError) as raised:
+            self.complete()
+        self.assertFalse(raised.exception.retryable)
+        self.assertEqual(len(provider.calls), 1)
+
+    @override_settings(SITES_AI_BACKOFF=5, SITES_AI_MAX_BACKOFF=5)
+    def test_budget_stops_retries(self):
+        provider = self.use(failures=[503])
+
+        with self.assertRaises(ai.AIProviderError):
+            self.complete(budget=2)
+        self.assertEqual(len(provider.calls), 1)
+
+    def test_budget_limits_attempt_timeout(self):
+        provider = self.use()
+
+        self.complete(timeout=30, budget=1)
+
+        self.assertLessEqual(provider.calls[0]["timeout"], 1)
+
+    @override_settings(SITES_AI_MAX_CONCURRENCY=1, SITES_AI_QUEUE_TIMEOUT=0.05)
+    def test_busy_when_every_slot_is_taken(self):
+        provider = self.use()
+        semaphore = ai._get_semaphore()
+        semaphore.acquire()
+        try:
+            with self.assertRaises(ai.AIBusyError):
+                self.complete()
+        finally:
+            semaphore.release()
+        self.assertEqual(provider.calls, [])
+        self.complete()
+
+    def test_unconfigured_provider(self):
+        ai.set_provider(ai.OpenAIProvider(api_key=""))
+        self.addCleanup(ai.set_provider, None)
+
+        with self.assertRaises(ai.AIConfigurationError):
+            self.complete()
+
+    def test_retry_after_is_honoured(self):
+        error = ai.AIProviderError("Slow down", status_code=429, retry_after=0.5)
+
+        with self.settings(SITES_AI_MAX_BACKOFF=8):
+            self.assertGreaterEqual(ai._backoff_delay(0, error), 0.5)
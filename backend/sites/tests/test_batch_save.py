@@ -0,0 +1,59 @@
+from rest_framework.test import APIClient, APITestCase
+
+from sites.models import Field, Page, Section
+
+from .utils import make_project
+
+
+class PageBatchSaveTests(APITestCase):
+    def setUp(self):
+        self.project = make_project()
+        self.page = Page.objects.get(project=self.project, slug="home")
+        self.section = Section.objects.filter(page=self.page).first()
+        self.client = APIClient()
+        self.client.force_authenticate(self.project.owner)
+        self.url = f"/api/pages/{self.page.pk}/batch/"
+
+    def save(self, version, **changes):
+        return self.client.post(self.url, {"version": version, **changes}, format="json")
+
+    def edit(self, value):
+        return {"fields": [{"section": self.section.pk, "key": "k0", "value": value}]}
+
+    def test_save_bumps_version_once(self):
+        version = Page.objects.get(pk=self.page.pk).version
+
+        response = self.save(version, seo={"meta_title": "Home"}, **self.edit("New"))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["version"], version + 1)
+        self.assertEqual(Page.objects.get(pk=self.page.pk).version, version + 1)
+        self.assertEqual(Field.objects.get(section=self.section, key="k0").value, "New")
+
+    def test_stale_version_conflicts_and_writes_nothing(self):
+        version = Page.objects.get(pk=self.page.pk).version
+        self.save(version, **self.edit("First"))
+
+        response = self.save(version, **self.edit("Second"))
+
+        self.assertEqual(response.status_code, 409)
+        self.assertEqual(response.data["current_version"], version + 1)
+        self.assertEqual(Field.objects.get(section=self.section, key="k0").value, "First")
+
+    def test_other_page_edits_cause_a_conflict(self):
+        version = Page.objects.get(pk=self.page.pk).version
+        response = self.client.patch(f"/api/pages/{self.page.pk}/seo/", {"meta_title": "Elsewhere"}, format="json")
+        self.assertEqual(response.status_code, 200)
+
+        self.assertEqual(self.save(version, **self.edit("Late")).status_code, 409)
+
+    def test_full_save_does_not_restore_a_stale_document(self):
+        stale = Page.objects.get(pk=self.page.pk)
+        self.save(stale.version, add_sections=[{"identifier": "extra"}])
+
+        stale.title = "Renamed"
+        stale.save()
+
+        page = Page.objects.get(pk=self.page.pk)
+        self.assertIn("extra", [section["identifier"] for section in page.content_document["sections"]])
+        self.assertEqual(stale.version, page.version)
@@ -0,0 +1,53 @@
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from sites.bootstrap import build_site_bootstrap
+from sites.models import HeroSlide, NavigationItem, Page, SiteProject
+
+from .utils import make_project
+
+
+class SiteBootstrapTests(TestCase):
+    def setUp(self):
+        self.project = make_project(locales=("en", "pt"))
+
+    def test_payload(self):
+        data = build_site_bootstrap(self.project.pk, "/about", "pt")
+
+        self.assertEqual(data["project"]["slug"], "cafe")
+        self.assertIn("primary_color", data["project"]["theme"])
+        self.assertEqual([item["label"] for item in data["navigation"]["header"]], ["Home"])
+        page = data["page"]
+        self.assertEqual((page["slug"], page["locale"]), ("about", "pt"))
+        self.assertEqual([section["identifier"] for section in page["sections"]], ["section-0", "section-1"])
+        self.assertEqual([slide["title"] for slide in page["hero_slides"]], ["Slide"])
+        self.assertEqual((data["homepage_sliders"], data["testimonial_carousels"]), ([], []))
+
+    def test_page_falls_back_and_may_be_missing(self):
+        Page.objects.filter(project=self.project, locale="pt", slug="about").delete()
+
+        self.assertEqual(build_site_bootstrap(self.project.pk, "/about", "pt")["page"]["locale"], "en")
+        missing = build_site_bootstrap(self.project.pk, "/nope", "pt")
+        self.assertIsNone(missing["page"])
+        self.assertEqual(len(missing["navigation"]["header"]), 1)
+
+    def test_inactive_project(self):
+        SiteProject.objects.filter(pk=self.project.pk).update(is_active=False)
+
+        self.assertIsNone(build_site_bootstrap(self.project.pk))
+
+    def test_query_count_does_not_grow_with_the_site(self):
+        with CaptureQueriesContext(connection) as small:
+            build_site_bootstrap(self.project.pk, "/", "en")
+        big = make_project(slug="big", pages=("home", "a", "b", "c"), sections=6, fields=8)
+        home = Page.objects.get(project=big, slug="home")
+        HeroSlide.objects.bulk_create([HeroSlide(page=home, title=f"Slide {i}", order=i) for i in range(1, 6)])
+        parent = NavigationItem.objects.get(project=big)
+        NavigationItem.objects.bulk_create([
+            NavigationItem(project=big, location="header", label=f"Item {i}", url="#", parent=parent, order=i)
+            for i in range(10)
+        ])
+
+        with self.assertNumQueries(len(small)):
+            build_site_bootstrap(big.pk, "/", "en")
@@ -0,0 +1,63 @@
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+
+from sites.caching import (
+    bump_content_version,
+    get_public_project_ref,
+    get_public_site_entry,
+    public_site_cache_key,
+)
+
+from .utils import make_project
+
+
+class PublicSiteEntryTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.project = make_project()
+        self.builds = []
+
+    def ref(self):
+        return get_public_project_ref(project_id=self.project.pk)
+
+    def builder(self, value="payload"):
+        def build():
+            self.builds.append(value)
+            return value
+        return build
+
+    def test_builds_once_then_serves_cached_entry(self):
+        first = get_public_site_entry(self.ref(), self.builder(), variant="en")
+        second = get_public_site_entry(self.ref(), self.builder(), variant="en")
+
+        self.assertEqual(first, second)
+        self.assertEqual(self.builds, ["payload"])
+
+    def test_content_change_rebuilds(self):
+        get_public_site_entry(self.ref(), self.builder("old"))
+        bump_content_version(id=self.project.pk)
+
+        data, version = get_public_site_entry(self.ref(), self.builder("new"))
+
+        self.assertEqual(data, "new")
+        self.assertEqual(self.builds, ["old", "new"])
+
+    def test_rebuild_lock_is_shared_by_variants(self):
+        get_public_site_entry(self.ref(), self.builder("old"), variant="en")
+        bump_content_version(id=self.project.pk)
+        # Another request is rebuilding some variant of this project
+        cache.add(f"{public_site_cache_key(self.project.pk)}:lock", "other", 30)
+
+        data, _ = get_public_site_entry(self.ref(), self.builder("new"), variant="en")
+
+        self.assertEqual(data, "old")
+        self.assertEqual(self.builds, ["old"])
+
+    @override_settings(PUBLIC_SITE_CACHE_LOCK_WAIT=0.1)
+    def test_cold_miss_builds_locally_after_waiting(self):
+        cache.add(f"{public_site_cache_key(self.project.pk)}:lock", "other", 30)
+
+        data, _ = get_public_site_entry(self.ref(), self.builder(), variant="pt")
+
+        self.assertEqual(data, "payload")
+        self.assertEqual(self.builds, ["payload"])
@@ -0,0 +1,74 @@
+from django.test import TestCase
+
+from sites.models import Field, HeroSlide, NavigationItem, Page, Section, SiteProject
+from sites.utils import bulk_clone_project
+
+from .utils import make_project, make_user
+
+
+class BulkCloneTests(TestCase):
+    def setUp(self):
+        self.project = make_project(locales=("en", "pt"))
+        self.about = Page.objects.get(project=self.project, slug="about", locale="en")
+        self.nav = NavigationItem.objects.get(project=self.project)
+
+    def nav_tree(self, project):
+        items = NavigationItem.objects.filter(project=project).select_related("parent", "page")
+        return sorted(
+            (item.label, item.parent.label if item.parent else None, item.page.slug if item.page else None)
+            for item in items
+        )
+
+    def test_clone_copies_every_level(self):
+        new_project, counts = bulk_clone_project(self.project, owner=make_user("buyer"), name="Cafe Two")
+
+        self.assertEqual(counts, {
+            "pages": 4, "sections": 8, "fields": 24, "hero_slides": 4, "navigation_items": 1,
+        })
+        self.assertEqual(new_project.slug, "cafe-two")
+        self.assertEqual(new_project.owner.username, "buyer")
+        self.assertEqual(Field.objects.filter(section__page__project=new_project).count(), 24)
+        self.assertEqual(HeroSlide.objects.filter(page__project=new_project).count(), 4)
+        # Source rows are untouched
+        self.assertEqual(Section.objects.filter(page__project=self.project).count(), 8)
+
+    def test_nested_navigation_keeps_its_parents(self):
+        services = NavigationItem.objects.create(project=self.project, location="header", label="Services", url="#")
+        about = NavigationItem.objects.create(
+            project=self.project, location="header", label="About", page=self.about, parent=services
+        )
+        NavigationItem.objects.create(project=self.project, location="header", label="Team", url="#", parent=about)
+        # A parent created after its child
+        self.nav.parent = NavigationItem.objects.create(project=self.project, location="header", label="Top", url="#")
+        self.nav.save()
+
+        new_project, counts = bulk_clone_project(self.project)
+
+        self.assertEqual(counts["navigation_items"], 5)
+        self.assertEqual(self.nav_tree(new_project), self.nav_tree(self.project))
+        cloned_about = NavigationItem.objects.get(project=new_project, label="About")
+        self.assertEqual(cloned_about.page.project_id, new_project.pk)
+        self.assertEqual(cloned_about.parent.project_id, new_project.pk)
+
+    def test_locales_filter(self):
+        self.nav.page = self.about
+        self.nav.save()
+
+        new_project, counts = bulk_clone_project(self.project, locales=["pt"])
+
+        self.assertEqual(counts["pages"], 2)
+        self.assertEqual(set(Page.objects.filter(project=new_project).values_list("locale", flat=True)), {"pt"})
+        # Links to pages that were not cloned are dropped
+        nav = NavigationItem.objects.get(project=new_project)
+        self.assertIsNone(nav.page_id)
+
+    def test_clone_builds_documents_and_unique_slugs(self):
+        first, _ = bulk_clone_project(self.project)
+        second, _ = bulk_clone_project(self.project)
+
+        self.assertNotEqual(first.slug, second.slug)
+        self.assertTrue(SiteProject.objects.filter(pk=second.pk, is_master_template=False).exists())
+        page = Page.objects.get(project=second, slug="home", locale="en")
+        self.assertEqual(
+            [section["values"]["k0"] for section in page.content_document["sections"]], ["v0-en", "v0-en"]
+        )
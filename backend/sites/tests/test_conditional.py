@@ -0,0 +1,63 @@
+from rest_framework.test import APITestCase
+
+from sites.models import Field, NavigationItem, Page
+
+from .utils import make_project
+
+
+class PageSnapshotConditionalTests(APITestCase):
+    def setUp(self):
+        self.project = make_project()
+        self.page = Page.objects.get(project=self.project, slug="home")
+        self.url = f"/api/pages/{self.page.pk}/snapshot/"
+
+    def test_not_modified_until_content_changes(self):
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("Last-Modified", response)
+
+        not_modified = self.client.get(self.url, HTTP_IF_NONE_MATCH=response["ETag"])
+        self.assertEqual(not_modified.status_code, 304)
+        self.assertEqual(not_modified.content, b"")
+
+        field = Field.objects.filter(section__page=self.page).first()
+        field.value = "Changed"
+        field.save()
+
+        changed = self.client.get(self.url, HTTP_IF_NONE_MATCH=response["ETag"])
+        self.assertEqual(changed.status_code, 200)
+        self.assertNotEqual(changed["ETag"], response["ETag"])
+
+
+class NavigationListConditionalTests(APITestCase):
+    def setUp(self):
+        self.project = make_project()
+        self.url = "/api/navigation/"
+        self.params = {"project": self.project.pk}
+
+    def etag(self):
+        return self.client.get(self.url, self.params)["ETag"]
+
+    def assertChanged(self, etag):
+        response = self.client.get(self.url, self.params, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], etag)
+        return response["ETag"]
+
+    def test_validators_follow_items_and_filters(self):
+        etag = self.etag()
+        self.assertEqual(self.client.get(self.url, self.params, HTTP_IF_NONE_MATCH=etag).status_code, 304)
+        # Other filters are a different representation
+        self.assertNotEqual(self.client.get(self.url, {**self.params, "location": "footer"})["ETag"], etag)
+
+        item = NavigationItem.objects.create(project=self.project, location="header", label="Menu", url="/menu")
+        etag = self.assertChanged(etag)
+        # A deletion can leave the max updated_at unchanged; the count catches it
+        item.delete()
+        etag = self.assertChanged(etag)
+
+        # Linked pages are rendered too
+        page = Page.objects.get(project=self.project, slug="about")
+        page.title = "About us"
+        page.save()
+        self.assertChanged(etag)
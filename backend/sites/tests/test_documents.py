@@ -0,0 +1,61 @@
+from io import StringIO
+
+from django.core.management import CommandError, call_command
+from django.test import TestCase
+
+from sites.models import Field, Page, Section, SiteProject
+
+from .utils import make_project
+
+
+class ContentDocumentTests(TestCase):
+    """Page.content_document and the content version follow every write."""
+
+    def setUp(self):
+        self.project = make_project()
+        self.page = Page.objects.get(project=self.project, slug="home")
+        self.section = Section.objects.filter(page=self.page).first()
+
+    def document(self):
+        return Page.objects.get(pk=self.page.pk).content_document
+
+    def values(self, identifier=None):
+        sections = {section["identifier"]: section for section in self.document()["sections"]}
+        return sections[identifier or self.section.identifier]["values"]
+
+    def stamp(self):
+        return SiteProject.objects.get(pk=self.project.pk).content_updated_at
+
+    def test_field_save_and_delete(self):
+        stamp = self.stamp()
+        field = Field.objects.get(section=self.section, key="k0")
+        field.value = "Changed"
+        field.save()
+
+        self.assertEqual(self.values()["k0"], "Changed")
+        self.assertGreater(self.stamp(), stamp)
+
+        field.delete()
+        self.assertNotIn("k0", self.values())
+
+    def test_section_create_and_delete(self):
+        section = Section.objects.create(page=self.page, identifier="new", internal_name="New", order=99)
+        self.assertEqual(self.values("new"), {})
+
+        section.delete()
+        self.assertNotIn("new", [s["identifier"] for s in self.document()["sections"]])
+
+    def test_page_delete_cascades_without_errors(self):
+        self.page.delete()
+
+        self.assertFalse(Section.objects.filter(page_id=self.page.pk).exists())
+
+    def test_verify_and_backfill_command(self):
+        Page.objects.filter(pk=self.page.pk).update(content_document={})
+
+        with self.assertRaisesMessage(CommandError, "1 of 2 page documents are stale"):
+            call_command("page_documents", "--verify", stdout=StringIO())
+        call_command("page_documents", stdout=StringIO())
+        call_command("page_documents", "--verify", stdout=StringIO())
+
+        self.assertIn("k0", self.values())
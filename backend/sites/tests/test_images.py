@@ -0,0 +1,115 @@
+import io
+
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import TestCase, override_settings
+from PIL import Image, PngImagePlugin
+
+from sites.images import UnsupportedImage, fingerprint_normalized, inspect_image, normalize_screenshot
+from sites.serializers import SectionDraftCreateSerializer
+
+from .utils import make_project, png_bytes
+
+
+SVG = b'<?xml version="1.0"?><svg xmlns="http://www.w3.org/2000/svg" width="10" height="10"></svg>'
+
+
+class InspectImageTests(TestCase):
+    def test_raster_formats(self):
+        for image_format, mime_type in (("PNG", "image/png"), ("JPEG", "image/jpeg"),
+                                        ("WEBP", "image/webp"), ("GIF", "image/gif")):
+            upload = SimpleUploadedFile("shot", png_bytes(40, 30, image_format=image_format))
+            info = inspect_image(upload)
+            self.assertEqual(info, {"mime_type": mime_type, "image_width": 40, "image_height": 30})
+            self.assertEqual(upload.tell(), 0)
+
+    def test_svg_is_rejected(self):
+        with self.assertRaisesMessage(UnsupportedImage, "SVG files are not supported"):
+            inspect_image(SimpleUploadedFile("shot.svg", SVG))
+
+
+@override_settings(SITES_DRAFT_IMAGE_MAX_DIMENSION=100, SITES_DRAFT_IMAGE_TILE_OVERLAP=20,
+                   SITES_DRAFT_IMAGE_MAX_TILES=3, SITES_DRAFT_IMAGE_FORMAT="JPEG")
+class NormalizeScreenshotTests(TestCase):
+    def normalize(self, content):
+        return normalize_screenshot(io.BytesIO(content))
+
+    def sizes(self, normalized):
+        return [Image.open(io.BytesIO(tile)).size for tile in normalized["tiles"]]
+
+    def test_wide_image_is_scaled_down(self):
+        normalized = self.normalize(png_bytes(400, 100))
+
+        self.assertEqual(normalized["mime_type"], "image/jpeg")
+        self.assertEqual((normalized["width"], normalized["height"]), (100, 25))
+        self.assertEqual(self.sizes(normalized), [(100, 25)])
+
+    def test_tall_image_is_cut_into_overlapping_tiles(self):
+        normalized = self.normalize(png_bytes(100, 250))
+
+        # Tops at 0, 80 and 150: the last tile is aligned to the bottom edge
+        self.assertEqual(self.sizes(normalized), [(100, 100)] * 3)
+
+    def test_very_tall_image_is_scaled_to_fit_the_tiles(self):
+        normalized = self.normalize(png_bytes(100, 1000))
+
+        self.assertEqual((normalized["width"], normalized["height"]), (26, 260))
+        self.assertEqual(len(normalized["tiles"]), 3)
+
+    def test_orientation_transparency_and_metadata(self):
+        exif = Image.Exif()
+        exif[0x0112] = 6  # Rotated 90 degrees
+        buffer = io.BytesIO()
+        Image.new("RGB", (60, 40), (30, 60, 90)).save(buffer, "JPEG", exif=exif)
+        normalized = self.normalize(buffer.getvalue())
+
+        self.assertEqual((normalized["width"], normalized["height"]), (40, 60))
+        self.assertFalse(Image.open(io.BytesIO(normalized["tiles"][0])).getexif())
+
+        buffer = io.BytesIO()
+        Image.new("RGBA", (20, 20), (0, 0, 0, 0)).save(buffer, "PNG")
+        tile = Image.open(io.BytesIO(self.normalize(buffer.getvalue())["tiles"][0]))
+        self.assertEqual(tile.mode, "RGB")
+        self.assertGreater(min(tile.getpixel((10, 10))), 240)
+
+    def test_fingerprint_ignores_metadata(self):
+        info = PngImagePlugin.PngInfo()
+        info.add_text("Software", "Screenshot tool")
+        buffer = io.BytesIO()
+        Image.open(io.BytesIO(png_bytes(80, 60))).save(buffer, "PNG", pnginfo=info)
+
+        self.assertEqual(
+            fingerprint_normalized(self.normalize(png_bytes(80, 60))),
+            fingerprint_normalized(self.normalize(buffer.getvalue())),
+        )
+
+    def test_garbage_is_rejected(self):
+        with self.assertRaises(UnsupportedImage):
+            self.normalize(b"not an image")
+
+
+class DraftUploadValidationTests(TestCase):
+    def setUp(self):
+        self.project = make_project()
+
+    def validate(self, name, content):
+        serializer = SectionDraftCreateSerializer(
+            data={"image": SimpleUploadedFile(name, content), "project": self.project.pk}
+        )
+        return serializer.is_valid(), serializer.errors
+
+    def test_svg_upload_is_rejected(self):
+        valid, errors = self.validate("shot.svg", SVG)
+
+        self.assertFalse(valid)
+        self.assertIn("image", errors)
+
+    def test_svg_content_with_png_name_is_rejected(self):
+        valid, errors = self.validate("shot.png", SVG)
+
+        self.assertFalse(valid)
+        self.assertIn("SVG files are not supported", str(errors["image"]))
+
+    def test_webp_and_gif_uploads(self):
+        for name, image_format in (("shot.webp", "WEBP"), ("shot.gif", "GIF")):
+            valid, errors = self.validate(name, png_bytes(image_format=image_format))
+            self.assertTrue(valid, errors)
@@ -0,0 +1,137 @@
+import threading
+import time
+from datetime import timedelta
+
+from django.test import TestCase, TransactionTestCase, override_settings
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from sites.jobs import (
+    JOB_HANDLERS,
+    claim_next_job,
+    enqueue_job,
+    report_progress,
+    requeue_stale_jobs,
+    run_job,
+    run_worker,
+)
+from sites.models import BackgroundJob
+
+from .utils import make_user
+
+
+def failing_job(job):
+    raise ValueError("Something broke")
+
+
+class TestHandlersMixin:
+    def setUp(self):
+        super().setUp()
+        JOB_HANDLERS.update(test_fail=failing_job, test_ok=lambda job: {"ok": True})
+        self.addCleanup(JOB_HANDLERS.pop, "test_fail")
+        self.addCleanup(JOB_HANDLERS.pop, "test_ok")
+
+
+class JobHeartbeatTests(TestHandlersMixin, TestCase):
+    def setUp(self):
+        super().setUp()
+        self.job = enqueue_job("test_fail", max_attempts=2)
+
+    def age(self, job, seconds):
+        BackgroundJob.objects.filter(pk=job.pk).update(locked_at=timezone.now() - timedelta(seconds=seconds))
+
+    def test_progress_refreshes_the_lock(self):
+        job = claim_next_job("worker")
+        self.age(job, 3600)
+
+        report_progress(job, 1, 2, "Halfway")
+
+        job.refresh_from_db()
+        self.assertGreater(job.locked_at, timezone.now() - timedelta(seconds=5))
+        self.assertEqual(job.progress_message, "Halfway")
+
+    @override_settings(SITES_JOB_STALE_SWEEP_INTERVAL=0, SITES_JOB_STALE_TIMEOUT=60)
+    def test_worker_loop_releases_stale_jobs(self):
+        stale = claim_next_job("dead-worker")
+        self.age(stale, 120)
+        alive = enqueue_job("test_ok")
+        alive_claim = claim_next_job("other-worker")
+        self.assertEqual(alive_claim.pk, alive.pk)
+
+        with self.assertLogs("sites.jobs", "WARNING") as logs:
+            run_worker(threading.Event(), worker_id="worker", kinds=["test_fail"], burst=True)
+
+        self.assertIn("Released 1 stale background jobs", logs.output[0])
+        stale.refresh_from_db()
+        # Released by the sweep, then claimed again and failed for good
+        self.assertEqual((stale.status, stale.attempts), (BackgroundJob.STATUS_FAILED, 2))
+        alive.refresh_from_db()
+        self.assertEqual(alive.status, BackgroundJob.STATUS_RUNNING)
+
+
+class JobOwnershipTests(TestHandlersMixin, TestCase):
+    def test_late_finisher_does_not_overwrite_a_reclaimed_job(self):
+        def released_while_running(running_job):
+            # The sweep released the job and another worker claimed it
+            BackgroundJob.objects.filter(pk=running_job.pk).update(locked_at=timezone.now() - timedelta(hours=1))
+            requeue_stale_jobs()
+            claim_next_job("other-worker")
+            return {"done": True}
+
+        JOB_HANDLERS["test_slow"] = released_while_running
+        self.addCleanup(JOB_HANDLERS.pop, "test_slow")
+        job = enqueue_job("test_slow", max_attempts=2)
+
+        with self.assertLogs("sites.jobs", "WARNING") as logs:
+            run_job(claim_next_job("worker"))
+
+        self.assertIn("outcome dropped", logs.output[0])
+        job.refresh_from_db()
+        self.assertEqual((job.status, job.locked_by, job.result), (BackgroundJob.STATUS_RUNNING, "other-worker", {}))
+
+
+@override_settings(SITES_JOB_HEARTBEAT_INTERVAL=0.05)
+class JobHeartbeatThreadTests(TestHandlersMixin, TransactionTestCase):
+    def test_lock_is_refreshed_while_the_handler_runs(self):
+        seen = {}
+
+        def slow(job):
+            BackgroundJob.objects.filter(pk=job.pk).update(locked_at=timezone.now() - timedelta(hours=1))
+            time.sleep(0.3)
+            seen["locked_at"] = BackgroundJob.objects.get(pk=job.pk).locked_at
+            return {}
+
+        JOB_HANDLERS["test_slow"] = slow
+        self.addCleanup(JOB_HANDLERS.pop, "test_slow")
+        enqueue_job("test_slow")
+
+        job = run_job(claim_next_job("worker"))
+
+        self.assertGreater(seen["locked_at"], timezone.now() - timedelta(seconds=5))
+        self.assertEqual(job.status, BackgroundJob.STATUS_SUCCEEDED)
+
+
+class JobStatusErrorTests(TestHandlersMixin, TestCase):
+    def setUp(self):
+        super().setUp()
+        self.owner = make_user()
+        self.job = enqueue_job("test_fail", user=self.owner)
+        with self.assertLogs("sites.jobs", "ERROR"):
+            run_job(claim_next_job("worker"))
+
+    def get(self, user):
+        client = APIClient()
+        client.force_authenticate(user)
+        return client.get(f"/api/jobs/{self.job.pk}/")
+
+    def test_owner_sees_short_error_only(self):
+        response = self.get(self.owner)
+
+        self.assertEqual(response.data["status"], BackgroundJob.STATUS_FAILED)
+        self.assertEqual(response.data["error"], "ValueError: Something broke")
+        self.assertNotIn("traceback", response.data)
+
+    def test_staff_sees_traceback(self):
+        response = self.get(make_user("admin", is_staff=True))
+
+        self.assertIn("Traceback (most recent call last)", response.data["traceback"])
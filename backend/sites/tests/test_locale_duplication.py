@@ -0,0 +1,76 @@
+from rest_framework.test import APIClient, APITestCase
+
+from sites.models import Field, HeroSlide, NavigationItem, Page, Section, SiteProject
+from sites.utils import duplicate_project_locale
+
+from .utils import make_project
+
+
+class LocaleDuplicationTests(APITestCase):
+    def setUp(self):
+        self.project = make_project()
+        # A partial Dutch home page: one section with one translated field
+        self.nl_home = Page.objects.create(project=self.project, slug="home", path="/", title="Thuis", locale="nl")
+        section = Section.objects.create(page=self.nl_home, identifier="section-0", internal_name="Sectie", order=0)
+        Field.objects.create(section=section, key="k0", label="Label 0", value="Hallo", order=0)
+
+    def values(self, page):
+        document = Page.objects.get(pk=page.pk).content_document
+        return {section["identifier"]: section["values"] for section in document["sections"]}
+
+    def test_skip_leaves_existing_pages_alone(self):
+        counts = duplicate_project_locale(self.project, "en", "nl")
+
+        self.assertEqual(
+            (counts["pages_created"], counts["pages_skipped"], counts["pages_merged"]), (1, 1, 0)
+        )
+        self.assertEqual(Section.objects.filter(page=self.nl_home).count(), 1)
+        about = Page.objects.get(project=self.project, slug="about", locale="nl")
+        self.assertEqual(self.values(about)["section-1"], {"k0": "v0-en", "k1": "v1-en", "k2": "v2-en"})
+        self.assertEqual(HeroSlide.objects.filter(page=about).count(), 1)
+
+    def test_merge_adds_only_what_is_missing(self):
+        version = Page.objects.get(pk=self.nl_home.pk).version
+
+        counts = duplicate_project_locale(self.project, "en", "nl", mode="merge")
+
+        self.assertEqual((counts["pages_created"], counts["pages_merged"]), (1, 1))
+        # 1 missing section on home + 2 on about; 2 missing fields + 3 per new section
+        self.assertEqual((counts["sections_created"], counts["fields_created"]), (3, 11))
+        self.assertEqual(self.values(self.nl_home)["section-0"], {"k0": "Hallo", "k1": "v1-en", "k2": "v2-en"})
+        self.nl_home.refresh_from_db()
+        self.assertEqual(self.nl_home.version, version + 1)
+        self.assertEqual(HeroSlide.objects.filter(page=self.nl_home).count(), 1)
+
+        # Running it again changes nothing
+        again = duplicate_project_locale(self.project, "en", "nl", mode="merge")
+        self.assertEqual((again["sections_created"], again["fields_created"], again["hero_slides_created"]), (0, 0, 0))
+
+    def test_navigation_is_not_duplicated(self):
+        NavigationItem.objects.filter(project=self.project).update(
+            page=Page.objects.get(project=self.project, slug="home", locale="en")
+        )
+
+        first = duplicate_project_locale(self.project, "en", "nl")
+        second = duplicate_project_locale(self.project, "en", "nl")
+
+        self.assertEqual((first["navigation_items_created"], second["navigation_items_skipped"]), (1, 1))
+        item = NavigationItem.objects.get(project=self.project, locale="nl")
+        self.assertEqual(item.page_id, self.nl_home.pk)
+
+    def test_target_locale_is_added_to_the_project(self):
+        duplicate_project_locale(self.project, "en", "fr", page_ids=[])
+
+        self.assertIn("fr", SiteProject.objects.get(pk=self.project.pk).additional_locales)
+
+    def test_endpoint(self):
+        client = APIClient()
+        client.force_authenticate(self.project.owner)
+        url = f"/api/projects/{self.project.pk}/duplicate-locale/"
+
+        response = client.post(url, {"source_locale": "en", "target_locale": "nl", "mode": "merge"}, format="json")
+        invalid = client.post(url, {"source_locale": "en", "target_locale": "en"}, format="json")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual((response.data["mode"], response.data["pages_merged"]), ("merge", 1))
+        self.assertEqual(invalid.status_code, 400)
@@ -0,0 +1,59 @@
+from django.test import SimpleTestCase, TestCase, override_settings
+
+from sites.locales import get_locale_fallback_chain, normalize_locale
+from sites.models import Page, SiteProject
+from sites.views import get_page_with_locale_fallback, resolve_page_ids_with_locale_fallback
+
+from .utils import make_project
+
+
+@override_settings(SITES_FALLBACK_LOCALE="en")
+class LocaleChainTests(SimpleTestCase):
+    def test_chain(self):
+        self.assertEqual(get_locale_fallback_chain("pt-BR", "nl"), ["pt-BR", "pt", "nl", "en"])
+        self.assertEqual(get_locale_fallback_chain("pt_br", "PT"), ["pt_br", "pt", "en"])
+        self.assertEqual(get_locale_fallback_chain(None, "nl"), ["nl", "en"])
+        self.assertEqual(get_locale_fallback_chain("EN"), ["EN"])
+
+    def test_normalize(self):
+        self.assertEqual(normalize_locale(" pt-BR "), "pt")
+        self.assertEqual(normalize_locale("NL"), "nl")
+        self.assertEqual(normalize_locale("xx", "fr-CA"), "fr")
+        self.assertEqual(normalize_locale("xx"), "en")
+        self.assertIsNone(normalize_locale(""))
+
+
+class PageLocaleFallbackTests(TestCase):
+    def setUp(self):
+        # Dutch site with an English home page and a Portuguese about page
+        self.project = make_project(locales=("nl", "en"), pages=("home",))
+        Page.objects.create(project=self.project, slug="about", path="/about", title="Sobre", locale="pt", order=1)
+        Page.objects.create(project=self.project, slug="about", path="/about", title="Over", locale="nl", order=1)
+        self.pages = Page.objects.filter(project=self.project)
+
+    def locale_of(self, page_id):
+        return Page.objects.get(pk=page_id).locale
+
+    def test_single_page_in_one_query(self):
+        with self.assertNumQueries(1):
+            page = get_page_with_locale_fallback(self.pages, slug="about", locale="pt-BR")
+        self.assertEqual(page.locale, "pt")
+
+        self.assertEqual(get_page_with_locale_fallback(self.pages, slug="home", locale="pt-BR").locale, "nl")
+        self.assertEqual(get_page_with_locale_fallback(self.pages, slug="about", locale="de").locale, "nl")
+        self.assertIsNone(get_page_with_locale_fallback(self.pages, slug="menu", locale="pt"))
+
+    def test_site_resolves_page_by_page(self):
+        with self.assertNumQueries(1):
+            ids = resolve_page_ids_with_locale_fallback(self.pages, locale="PT")
+
+        self.assertEqual([(Page.objects.get(pk=i).slug, self.locale_of(i)) for i in ids], [("home", "nl"), ("about", "pt")])
+
+    def test_primary_locale_before_global_fallback(self):
+        ids = resolve_page_ids_with_locale_fallback(self.pages, locale="fr")
+        self.assertEqual([self.locale_of(i) for i in ids], ["nl", "nl"])
+
+        SiteProject.objects.filter(pk=self.project.pk).update(primary_locale="en")
+        ids = resolve_page_ids_with_locale_fallback(self.pages, locale="fr")
+        # No English or French about page: only home resolves
+        self.assertEqual([(Page.objects.get(pk=i).slug, self.locale_of(i)) for i in ids], [("home", "en")])
@@ -0,0 +1,90 @@
+from unittest import mock
+
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from sites.models import Field, Page, Section, SiteProject
+from sites.services import materialize_section_draft
+
+from .utils import make_project
+
+
+def ai_data(count, **metadata):
+    return {
+        "sections": [
+            {"type": "hero", "title": f"Hero {i}", "content": f"Body {i}", "cta_text": "Go"}
+            for i in range(count)
+        ],
+        **metadata,
+    }
+
+
+class MaterializeSectionDraftTests(TestCase):
+    def setUp(self):
+        self.project = make_project()
+        self.page = Page.objects.get(project=self.project, slug="home")
+
+    def stamp(self):
+        return SiteProject.objects.get(pk=self.project.pk).content_updated_at
+
+    def test_creates_sections_and_fields(self):
+        stamp = self.stamp()
+        created = materialize_section_draft(self.page, ai_data(2))
+
+        self.assertEqual([s["identifier"] for s in created], ["ai-hero-1", "ai-hero-2"])
+        self.assertEqual([s["fields_count"] for s in created], [4, 4])
+        section = Section.objects.get(pk=created[0]["id"])
+        self.assertEqual(section.internal_name, "Hero 0")
+        self.assertEqual(
+            list(section.fields.order_by("order").values_list("key", "value")),
+            [("title", "Hero 0"), ("content", "Body 0"), ("cta_text", "Go"), ("section_type", "hero")],
+        )
+        # New sections go after the existing ones
+        orders = list(Section.objects.filter(page=self.page).order_by("order").values_list("identifier", flat=True))
+        self.assertEqual(orders[-2:], ["ai-hero-1", "ai-hero-2"])
+
+        # Bulk writes skip the signals, so the service refreshes both itself
+        self.assertGreater(self.stamp(), stamp)
+        document = Page.objects.get(pk=self.page.pk).content_document
+        sections = {s["identifier"]: s for s in document["sections"]}
+        self.assertEqual(sections["ai-hero-2"]["values"]["content"], "Body 1")
+
+    def test_identifiers_do_not_collide(self):
+        materialize_section_draft(self.page, ai_data(1))
+        created = materialize_section_draft(self.page, ai_data(1))
+
+        self.assertEqual(created[0]["identifier"], "ai-hero-1-1")
+        self.assertEqual(Section.objects.filter(page=self.page, identifier__startswith="ai-hero").count(), 2)
+
+    def test_metadata_is_created_then_updated(self):
+        materialize_section_draft(self.page, ai_data(1, business_type="Cafe", overall_theme="Warm"))
+        materialize_section_draft(self.page, ai_data(1, business_type="Bakery"))
+
+        metadata = Section.objects.get(page=self.page, identifier="ai-metadata")
+        self.assertEqual(metadata.order, 0)
+        self.assertEqual(
+            dict(metadata.fields.values_list("key", "value")),
+            {"business_type": "Bakery", "overall_theme": "Warm"},
+        )
+
+    def test_query_count_does_not_grow_with_sections(self):
+        # Both measured calls update the existing metadata section
+        materialize_section_draft(self.page, ai_data(1, business_type="Cafe"))
+        with CaptureQueriesContext(connection) as one:
+            materialize_section_draft(self.page, ai_data(1, business_type="Cafe"))
+        with CaptureQueriesContext(connection) as many:
+            materialize_section_draft(self.page, ai_data(30, business_type="Bakery"))
+
+        self.assertEqual(len(many), len(one))
+
+    def test_failure_leaves_nothing_behind(self):
+        sections = Section.objects.count()
+        fields = Field.objects.count()
+
+        with mock.patch("sites.services.rebuild_page_documents", side_effect=RuntimeError("boom")):
+            with self.assertRaises(RuntimeError):
+                materialize_section_draft(self.page, ai_data(3, business_type="Cafe"))
+
+        self.assertEqual(Section.objects.count(), sections)
+        self.assertEqual(Field.objects.count(), fields)
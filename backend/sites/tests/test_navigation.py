@@ -0,0 +1,65 @@
+from django.core.cache import cache
+from rest_framework.test import APITestCase
+
+from sites.models import NavigationItem, Page
+from sites.navigation import build_navigation_tree
+
+from .utils import make_project
+
+
+class NavigationTreeTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.project = make_project(locales=("en", "pt"))
+        self.home = NavigationItem.objects.get(project=self.project)
+        self.services = NavigationItem.objects.create(
+            project=self.project, location="header", label="Services", url="#", order=1
+        )
+        about = Page.objects.get(project=self.project, slug="about", locale="en")
+        self.about = NavigationItem.objects.create(
+            project=self.project, location="header", label="About", page=about, parent=self.services, order=0
+        )
+        NavigationItem.objects.create(
+            project=self.project, location="header", label="Team", url="/team", parent=self.about, order=0
+        )
+
+    def labels(self, nodes):
+        return [(node["label"], self.labels(node["children"])) for node in nodes]
+
+    def test_nested_tree_in_one_query(self):
+        with self.assertNumQueries(1):
+            tree = build_navigation_tree(self.project.pk)
+
+        self.assertEqual(
+            self.labels(tree["header"]),
+            [("Home", []), ("Services", [("About", [("Team", [])])])],
+        )
+        self.assertEqual(tree["header"][1]["children"][0]["page_slug"], "about")
+        self.assertEqual(tree["footer"], [])
+        self.assertEqual(tree["locales"], {"header": "en", "footer": None})
+
+    def test_each_location_falls_back_on_its_own(self):
+        NavigationItem.objects.create(project=self.project, location="footer", label="Contacto", url="#", locale="pt")
+
+        tree = build_navigation_tree(self.project.pk, "pt-BR")
+
+        self.assertEqual(tree["locales"], {"header": "en", "footer": "pt"})
+        self.assertEqual(self.labels(tree["footer"]), [("Contacto", [])])
+
+    def test_items_with_a_missing_parent_are_promoted(self):
+        NavigationItem.objects.filter(pk=self.services.pk).update(locale="pt")
+
+        tree = build_navigation_tree(self.project.pk, "en")
+
+        self.assertEqual(self.labels(tree["header"]), [("Home", []), ("About", [("Team", [])])])
+
+    def test_endpoint_is_invalidated_by_navigation_changes(self):
+        url = "/api/navigation/tree/"
+        etag = self.client.get(url, {"project": self.project.pk})["ETag"]
+        self.home.label = "Start"
+        self.home.save()
+
+        response = self.client.get(url, {"project": self.project.pk}, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["header"][0]["label"], "Start")
@@ -0,0 +1,125 @@
+from django.test import SimpleTestCase
+from rest_framework.test import APIClient, APITestCase
+
+from sites.models import HeroSlide, NavigationItem, Page, Section, SiteProject
+from sites.ordering import ORDER_GAP, plan_order
+
+from .utils import make_project, make_user
+
+
+def apply(rows, changes):
+    """Order values after ``changes``, in the submitted sequence."""
+    return [changes.get(row_id, order) for row_id, order in rows]
+
+
+class PlanOrderTests(SimpleTestCase):
+    def assertIncreasing(self, values):
+        self.assertEqual(values, sorted(set(values)))
+
+    def test_unchanged_sequence_writes_nothing(self):
+        self.assertEqual(plan_order([(1, 1024), (2, 2048), (3, 3072)]), {})
+
+    def test_single_move_writes_one_row(self):
+        rows = [(1, 1024), (3, 3072), (2, 2048), (4, 4096)]
+
+        changes = plan_order(rows)
+
+        self.assertEqual(len(changes), 1)
+        self.assertIncreasing(apply(rows, changes))
+
+    def test_move_to_the_ends(self):
+        to_front = [(4, 4096), (1, 1024), (2, 2048), (3, 3072)]
+        to_back = [(2, 2048), (3, 3072), (4, 4096), (1, 1024)]
+
+        self.assertEqual(list(plan_order(to_front)), [4])
+        self.assertIncreasing(apply(to_front, plan_order(to_front)))
+        self.assertEqual(plan_order(to_back), {1: 4096 + ORDER_GAP})
+
+    def test_exhausted_gap_respaces_the_group(self):
+        rows = [(1, 0), (3, 2), (2, 1)]
+
+        changes = plan_order(rows)
+
+        self.assertEqual(apply(rows, changes), [ORDER_GAP, 2 * ORDER_GAP, 3 * ORDER_GAP])
+
+    def test_dense_legacy_values(self):
+        # Rows created before gap ordering all share order 0
+        rows = [(1, 0), (2, 0), (3, 0)]
+
+        self.assertIncreasing(apply(rows, plan_order(rows)))
+
+
+class ReorderEndpointTests(APITestCase):
+    def setUp(self):
+        self.owner = make_user()
+        self.project = make_project(self.owner, sections=4)
+        self.page = Page.objects.get(project=self.project, slug="home")
+        self.client = APIClient()
+        self.client.force_authenticate(self.owner)
+
+    def section_ids(self):
+        return list(Section.objects.filter(page=self.page).order_by("order").values_list("id", flat=True))
+
+    def test_sections_reorder(self):
+        ids = self.section_ids()
+        wanted = [ids[0], ids[2], ids[1], ids[3]]
+        stamp = SiteProject.objects.get(pk=self.project.pk).content_updated_at
+
+        response = self.client.post("/api/sections/reorder/", {"ids": wanted}, format="json")
+
+        self.assertEqual(response.status_code, 200)
+        # The fixture's dense 0, 1, 2, 3 values have no gaps: respaced once
+        self.assertEqual(response.data["updated"], 4)
+        self.assertEqual(self.section_ids(), wanted)
+        self.assertGreater(SiteProject.objects.get(pk=self.project.pk).content_updated_at, stamp)
+        document = Page.objects.get(pk=self.page.pk).content_document
+        self.assertEqual([section["id"] for section in document["sections"]], wanted)
+
+        # Later moves only write the moved row
+        wanted = [wanted[3], *wanted[:3]]
+        response = self.client.post("/api/sections/reorder/", {"ids": wanted}, format="json")
+        self.assertEqual(response.data["updated"], 1)
+        self.assertEqual(self.section_ids(), wanted)
+
+    def test_sections_reorder_rejects_incomplete_or_mixed_groups(self):
+        ids = self.section_ids()
+        other = Section.objects.filter(page__project=self.project, page__slug="about").first()
+
+        for body in ({"ids": ids[:2]}, {"ids": [*ids, other.pk]}, {"ids": [ids[0], ids[0]]}):
+            response = self.client.post("/api/sections/reorder/", body, format="json")
+            self.assertEqual(response.status_code, 400, body)
+        self.assertEqual(self.section_ids(), ids)
+
+    def test_sections_reorder_is_owner_only(self):
+        ids = self.section_ids()
+        self.client.force_authenticate(make_user("intruder"))
+
+        response = self.client.post("/api/sections/reorder/", {"ids": ids[::-1]}, format="json")
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(self.section_ids(), ids)
+
+    def test_navigation_reorder(self):
+        for index in range(1, 3):
+            NavigationItem.objects.create(
+                project=self.project, location="header", label=f"Item {index}", url="/", order=index
+            )
+        ids = list(NavigationItem.objects.filter(project=self.project).order_by("order").values_list("id", flat=True))
+
+        response = self.client.post("/api/navigation/reorder/", {"ids": ids[::-1]}, format="json")
+
+        self.assertEqual(response.status_code, 200)
+        ordered = NavigationItem.objects.filter(project=self.project).order_by("order").values_list("id", flat=True)
+        self.assertEqual(list(ordered), ids[::-1])
+
+    def test_hero_slides_reorder(self):
+        HeroSlide.objects.create(page=self.page, title="Second", order=1)
+        ids = list(HeroSlide.objects.filter(page=self.page).order_by("order").values_list("id", flat=True))
+
+        response = self.client.post(
+            f"/api/pages/{self.page.pk}/hero-slides/reorder/", {"ids": ids[::-1]}, format="json"
+        )
+
+        self.assertEqual(response.status_code, 200)
+        ordered = HeroSlide.objects.filter(page=self.page).order_by("order").values_list("id", flat=True)
+        self.assertEqual(list(ordered), ids[::-1])
@@ -0,0 +1,44 @@
+from django.test import TestCase
+from rest_framework.renderers import JSONRenderer
+
+from sites.documents import rebuild_page_documents
+from sites.models import Page, SiteProject
+from sites.public_tree import build_public_site
+from sites.serializers import SiteProjectPublicSerializer
+
+from .utils import make_project
+
+
+def render(data):
+    return JSONRenderer().render(data)
+
+
+class PublicTreeTests(TestCase):
+    """build_public_site renders exactly what SiteProjectPublicSerializer renders."""
+
+    def setUp(self):
+        self.project = make_project(locales=("en", "pt"))
+        Page.objects.filter(project=self.project, slug="about").update(meta_title="", meta_slug="sobre")
+
+    def serialized(self):
+        project = SiteProject.objects.prefetch_related("pages__sections__fields").get(pk=self.project.pk)
+        return render(SiteProjectPublicSerializer(project).data)
+
+    def test_matches_the_serializers(self):
+        self.assertEqual(render(build_public_site(self.project.pk)), self.serialized())
+
+    def test_matches_without_content_documents(self):
+        Page.objects.filter(project=self.project).update(content_document={})
+
+        self.assertEqual(render(build_public_site(self.project.pk)), self.serialized())
+
+    def test_matches_without_template(self):
+        SiteProject.objects.filter(pk=self.project.pk).update(site_template=None)
+        rebuild_page_documents(Page.objects.filter(project=self.project).values_list("id", flat=True))
+
+        self.assertEqual(render(build_public_site(self.project.pk)), self.serialized())
+
+    def test_inactive_project(self):
+        SiteProject.objects.filter(pk=self.project.pk).update(is_active=False)
+
+        self.assertIsNone(build_public_site(self.project.pk))
@@ -0,0 +1,151 @@
+from django.core.cache import cache
+from django.db import connection
+from rest_framework.test import APITestCase
+
+from sites.caching import PUBLIC_SITE_CACHE_PREFIX
+from sites.models import Field, NavigationItem, Page, Section
+
+from .utils import make_project
+
+
+def cached_variants(project_id):
+    """Variants of the project's payloads stored in the database cache."""
+    prefix = f"{PUBLIC_SITE_CACHE_PREFIX}:{project_id}:"
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT cache_key FROM jcw_cache")
+        keys = [row[0] for row in cursor.fetchall()]
+    return sorted(key.split(prefix, 1)[1] for key in keys if prefix in key and not key.endswith(":lock"))
+
+
+class PublicSiteViewTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.project = make_project(locales=("en", "pt"))
+        self.url = f"/api/sites/{self.project.slug}/public/"
+
+    def test_etag_and_not_modified(self):
+        response = self.client.get(self.url, {"locale": "pt"})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("ETag", response)
+        self.assertIn("Last-Modified", response)
+        not_modified = self.client.get(self.url, {"locale": "pt"}, HTTP_IF_NONE_MATCH=response["ETag"])
+        self.assertEqual(not_modified.status_code, 304)
+        self.assertEqual(not_modified["ETag"], response["ETag"])
+
+    def test_content_change_changes_etag(self):
+        etag = self.client.get(self.url)["ETag"]
+        page = Page.objects.filter(project=self.project).first()
+        page.title = "Changed"
+        page.save()
+
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], etag)
+        self.assertIn("Changed", [p["title"] for p in response.data["pages"]])
+
+    def test_every_content_write_invalidates_the_payload(self):
+        section = Section.objects.filter(page__project=self.project, page__locale="en").first()
+        field = Field.objects.filter(section=section).first()
+
+        def change_field():
+            field.value = "Fresh copy"
+            field.save()
+
+        changes = [
+            change_field,
+            lambda: Field.objects.create(section=section, key="extra", label="Extra", value="x"),
+            lambda: NavigationItem.objects.create(project=self.project, location="header", label="Menu", url="/menu"),
+            lambda: NavigationItem.objects.filter(label="Menu").get().delete(),
+            lambda: section.delete(),
+        ]
+        etag = self.client.get(self.url)["ETag"]
+        for change in changes:
+            change()
+            response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+            self.assertEqual(response.status_code, 200)
+            self.assertNotEqual(response["ETag"], etag)
+            etag = response["ETag"]
+            if change is change_field:
+                self.assertIn("Fresh copy", response.content.decode())
+
+        self.assertNotIn("Fresh copy", response.content.decode())
+
+    def test_equivalent_requests_share_a_variant(self):
+        first = self.client.get(self.url, {"locale": "pt"})
+        for params in ({"locale": "pt-BR"}, {"locale": " PT "}):
+            response = self.client.get(self.url, params)
+            self.assertEqual(response["ETag"], first["ETag"])
+        self.assertEqual({p["locale"] for p in first.data["pages"]}, {"pt"})
+        # Unknown locales are served like the primary locale
+        self.client.get(self.url, {"locale": "xx"})
+        self.client.get(self.url, {"locale": "zz"})
+
+        self.assertEqual(cached_variants(self.project.pk), ["locale=en", "locale=pt"])
+
+    def test_single_page_by_path_and_slug(self):
+        by_path = self.client.get(self.url, {"path": "about/", "locale": "pt"})
+        by_slug = self.client.get(self.url, {"slug": "about", "locale": "pt-PT"})
+
+        self.assertEqual(by_path.status_code, 200)
+        self.assertEqual([(p["slug"], p["locale"]) for p in by_path.data["pages"]], [("about", "pt")])
+        self.assertEqual(by_slug["ETag"], by_path["ETag"])
+        self.assertEqual(len(cached_variants(self.project.pk)), 1)
+
+    def test_unknown_page_is_not_cached(self):
+        for path in ("/nope", "/nope-2", "/nope-3"):
+            self.assertEqual(self.client.get(self.url, {"path": path}).status_code, 404)
+        self.assertEqual(self.client.get(self.url, {"slug": "nope"}).status_code, 404)
+
+        self.assertEqual(cached_variants(self.project.pk), [])
+
+    def test_unknown_site_404(self):
+        self.assertEqual(self.client.get("/api/sites/nope/public/").status_code, 404)
+
+
+class NavigationTreeViewTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.project = make_project()
+        self.url = "/api/navigation/tree/"
+
+    def test_etag_and_normalized_locale(self):
+        response = self.client.get(self.url, {"project": self.project.pk, "locale": "EN-gb"})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["requested_locale"], "en")
+        self.assertEqual(len(response.data["header"]), 1)
+        not_modified = self.client.get(
+            self.url, {"project": self.project.pk, "locale": "xx"}, HTTP_IF_NONE_MATCH=response["ETag"]
+        )
+        self.assertEqual(not_modified.status_code, 304)
+        self.assertEqual(cached_variants(self.project.pk), ["nav-tree|locale=en"])
+
+
+class SiteBootstrapViewTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.project = make_project()
+        self.url = f"/api/sites/{self.project.slug}/bootstrap/"
+
+    def test_variant_ignores_host_and_unknown_paths(self):
+        home = self.client.get(self.url, HTTP_HOST="localhost")
+        self.client.get(self.url, {"path": "/"}, HTTP_HOST="127.0.0.1:8000")
+        missing = self.client.get(self.url, {"path": "/nope"})
+        self.client.get(self.url, {"path": "/nope-2"})
+
+        self.assertEqual(home.data["page"]["slug"], "home")
+        self.assertIsNone(missing.data["page"])
+        home_id = Page.objects.get(project=self.project, slug="home").pk
+        self.assertEqual(
+            cached_variants(self.project.pk),
+            sorted(["bootstrap|page=|locale=", f"bootstrap|page={home_id}|locale="]),
+        )
+
+    def test_not_modified(self):
+        etag = self.client.get(self.url, {"path": "/about"})["ETag"]
+
+        response = self.client.get(self.url, {"path": "/about/"}, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, 304)
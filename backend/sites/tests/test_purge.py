@@ -0,0 +1,103 @@
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from rest_framework.test import APIClient, APITestCase
+
+from sites.jobs import claim_next_job, run_job
+from sites.models import BackgroundJob, BugReport, Field, Page, Section, SectionDraft, SiteProject
+from sites.purge import purge_orphaned_media, purge_project
+from sites.serializers import CloneProjectSerializer, SiteProjectSerializer
+
+from .utils import TempMediaMixin, make_project, make_user
+
+
+class SoftDeleteTests(TempMediaMixin, APITestCase):
+    def setUp(self):
+        self.owner = make_user()
+        self.project = make_project(self.owner, locales=("en", "pt"))
+        self.client = APIClient()
+        self.client.force_authenticate(self.owner)
+
+    def test_delete_hides_project_and_queues_purge(self):
+        response = self.client.delete(f"/api/projects/{self.project.pk}/")
+
+        self.assertEqual(response.status_code, 204)
+        self.assertFalse(SiteProject.objects.filter(pk=self.project.pk).exists())
+        project = SiteProject.all_objects.get(pk=self.project.pk)
+        self.assertIsNotNone(project.deleted_at)
+        self.assertFalse(project.is_active)
+        # Content stays until the job runs
+        self.assertEqual(Page.objects.filter(project=project).count(), 4)
+        job = BackgroundJob.objects.get()
+        self.assertEqual((job.kind, job.payload["project_id"]), ("purge_project", str(project.pk)))
+
+    def test_purge_job_removes_content_and_keeps_bug_reports(self):
+        draft = SectionDraft.objects.create(project=self.project, image=ContentFile(b"png", name="a.png"))
+        image_name = draft.image.name
+        report = BugReport.objects.create(project=self.project, summary="Broken", description="...")
+        self.client.delete(f"/api/projects/{self.project.pk}/")
+
+        with self.captureOnCommitCallbacks(execute=True):
+            run_job(claim_next_job("test"))
+
+        self.assertEqual(BackgroundJob.objects.get().status, BackgroundJob.STATUS_SUCCEEDED)
+        self.assertFalse(SiteProject.all_objects.filter(pk=self.project.pk).exists())
+        self.assertEqual(Field.objects.count(), 0)
+        self.assertEqual(Section.objects.count(), 0)
+        self.assertFalse(SectionDraft.objects.exists())
+        self.assertFalse(default_storage.exists(image_name))
+        report.refresh_from_db()
+        self.assertIsNone(report.project_id)
+
+    def test_purge_in_small_chunks(self):
+        self.project.soft_delete()
+        steps = []
+
+        counts = purge_project(self.project.pk, chunk_size=5, progress=steps.append)
+
+        self.assertEqual(counts["fields"], 2 * 2 * 2 * 3)
+        self.assertEqual(counts["sections"], 2 * 2 * 2)
+        self.assertEqual(counts["pages"], 4)
+        self.assertIn("Purging fields", steps)
+
+    def test_purge_refuses_live_project(self):
+        with self.assertRaises(ValueError):
+            purge_project(self.project.pk)
+
+    def test_orphaned_media(self):
+        draft = SectionDraft.objects.create(project=self.project, image=ContentFile(b"png", name="kept.png"))
+        orphan = default_storage.save("screenshot_uploads/orphan.png", ContentFile(b"png"))
+
+        self.assertEqual(purge_orphaned_media(grace=0, dry_run=True), [orphan])
+        purge_orphaned_media(grace=0)
+
+        self.assertFalse(default_storage.exists(orphan))
+        self.assertTrue(default_storage.exists(draft.image.name))
+
+
+class DeletedSlugTests(APITestCase):
+    """A soft-deleted project keeps its slug until it is purged."""
+
+    def setUp(self):
+        self.project = make_project(slug="taken")
+        self.project.soft_delete()
+
+    def test_project_serializer_rejects_deleted_slug(self):
+        serializer = SiteProjectSerializer(data={"name": "New", "slug": "taken"})
+
+        self.assertFalse(serializer.is_valid())
+        self.assertIn("slug", serializer.errors)
+
+    def test_clone_serializer_rejects_deleted_slug(self):
+        serializer = CloneProjectSerializer(data={"slug": "taken"})
+
+        self.assertFalse(serializer.is_valid())
+        self.assertIn("slug", serializer.errors)
+
+    def test_create_through_api_returns_400(self):
+        client = APIClient()
+        client.force_authenticate(make_user())
+
+        response = client.post("/api/projects/", {"name": "New", "slug": "taken"}, format="json")
+
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("slug", response.data)
@@ -0,0 +1,103 @@
+from unittest import mock
+
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+
+from sites import routing
+from sites.models import Page
+
+from .utils import make_project
+
+
+class RouteTableTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        routing._route_tables.clear()
+        routing._local_generations.clear()
+        self.project = make_project(locales=("en", "pt"))
+        Page.objects.filter(project=self.project, slug="about", locale="pt").update(meta_slug="sobre")
+
+    def page(self, slug, locale):
+        return Page.objects.get(project=self.project, slug=slug, locale=locale)
+
+    def test_resolve(self):
+        table = routing.get_route_table(self.project.slug)
+
+        self.assertEqual(table.resolve("/about/")["slug"], "about")
+        self.assertEqual(table.resolve("/pt/sobre")["locale"], "pt")
+        self.assertEqual(table.resolve("/pt/about")["location"], "/pt/sobre")
+        self.assertEqual(table.resolve_slug("about", "pt-BR")["path"], "/sobre")
+        self.assertIsNone(table.resolve("/nope"))
+
+    def test_locale_prefixes(self):
+        table = routing.get_route_table(self.project.slug)
+
+        self.assertEqual(table.resolve("/pt")["page"], self.page("home", "pt").pk)
+        self.assertEqual(table.resolve("/PT/sobre/")["locale"], "pt")
+        self.assertEqual(table.resolve("/sobre", "pt")["page"], self.page("about", "pt").pk)
+        self.assertEqual(table.resolve("/about")["locale"], "en")
+        # Not a locale of the project: an ordinary path segment
+        self.assertIsNone(table.resolve("/de/about"))
+
+    def test_redirects(self):
+        table = routing.get_route_table(self.project.slug)
+
+        self.assertEqual(
+            table.resolve("/pt/about"),
+            {"type": "redirect", "location": "/pt/sobre", "status": 301,
+             "page": self.page("about", "pt").pk, "locale": "pt"},
+        )
+        # Unprefixed old path keeps the URL unprefixed
+        self.assertEqual(table.resolve("/about", "pt")["location"], "/sobre")
+
+    def test_missing_translation_falls_back(self):
+        self.page("about", "pt").delete()
+        table = routing.get_route_table(self.project.slug)
+
+        match = table.resolve("/pt/about")
+        self.assertEqual((match["type"], match["locale"], match["requested_locale"]), ("page", "en", "pt"))
+
+    def test_resolve_view(self):
+        url = f"/api/sites/{self.project.slug}/resolve/"
+
+        self.assertEqual(self.client.get(url, {"path": "/pt/about"}).data["location"], "/pt/sobre")
+        self.assertEqual(self.client.get(url, {"path": "/nope"}).status_code, 404)
+        self.assertEqual(self.client.get("/api/sites/unknown/resolve/").status_code, 404)
+
+    def test_warm_resolve_does_not_query(self):
+        routing.get_route_table(self.project.slug)
+
+        with self.assertNumQueries(0):
+            table = routing.get_route_table(self.project.slug)
+            table.resolve("/pt/sobre")
+
+    def test_other_processes_see_changes_within_the_check_interval(self):
+        table = routing.get_route_table(self.project.slug)
+        # Another process invalidated the table: only the shared token changes
+        cache.delete(routing._route_token_key(self.project.pk))
+
+        self.assertIs(routing.get_route_table(self.project.slug), table)
+        with override_settings(SITES_ROUTE_TABLE_CHECK_INTERVAL=0):
+            self.assertIsNot(routing.get_route_table(self.project.slug), table)
+
+    def test_table_is_reused_until_invalidated(self):
+        table = routing.get_route_table(self.project.slug)
+        self.assertIs(routing.get_route_table(self.project.slug), table)
+
+        Page.objects.filter(project=self.project, slug="about").first().save()
+
+        self.assertIsNot(routing.get_route_table(self.project.slug), table)
+
+    def test_invalidation_while_compiling_is_not_lost(self):
+        compile_route_table = routing.compile_route_table
+
+        def compile_during_invalidation(*args, **kwargs):
+            table = compile_route_table(*args, **kwargs)
+            # A page was published after the pages were read
+            routing.invalidate_route_table(self.project.pk)
+            return table
+
+        with mock.patch.object(routing, "compile_route_table", side_effect=compile_during_invalidation):
+            table = routing.get_route_table(self.project.slug)
+
+        self.assertIsNot(routing.get_route_table(self.project.slug), table)
@@ -0,0 +1,71 @@
+from django.core.cache import cache
+from rest_framework.test import APIClient, APITestCase
+
+from sites.models import Field, Page, Section
+
+from .utils import make_project, make_user
+
+
+class SectionContentUpdateTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.owner = make_user()
+        self.project = make_project(self.owner)
+        self.section = Section.objects.filter(page__project=self.project, page__slug="home").first()
+        self.url = f"/api/sections/{self.section.pk}/content/"
+        self.client = APIClient()
+        self.client.force_authenticate(self.owner)
+
+    def patch(self, fields, **extra):
+        return self.client.patch(self.url, {"fields": fields, **extra}, format="json")
+
+    def values(self):
+        document = Page.objects.get(pk=self.section.page_id).content_document
+        return next(s for s in document["sections"] if s["id"] == self.section.pk)["values"]
+
+    def test_update_changes_document_and_public_etag(self):
+        public_url = f"/api/sites/{self.project.slug}/public/"
+        etag = self.client.get(public_url)["ETag"]
+
+        response = self.patch([{"key": "k0", "value": "Old"}, {"key": "k0", "value": "New"}, {"key": "k1", "value": "v1-en"}])
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["unknown_keys"], [])
+        self.assertEqual(Field.objects.get(section=self.section, key="k0").value, "New")
+        self.assertEqual(self.values()["k0"], "New")
+        public = self.client.get(public_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(public.status_code, 200)
+        self.assertNotEqual(public["ETag"], etag)
+
+    def test_unchanged_values_keep_the_version(self):
+        self.project.refresh_from_db()
+        stamp = self.project.content_updated_at
+
+        self.patch([{"key": "k0", "value": "v0-en"}])
+
+        self.project.refresh_from_db()
+        self.assertEqual(self.project.content_updated_at, stamp)
+
+    def test_unknown_keys_are_reported(self):
+        response = self.patch([{"key": "missing", "value": "x"}])
+
+        self.assertEqual(response.data["unknown_keys"], ["missing"])
+        self.assertEqual(response.data["created_keys"], [])
+        self.assertFalse(Field.objects.filter(section=self.section, key="missing").exists())
+
+    def test_create_missing(self):
+        response = self.patch([{"key": "call_to_action", "value": "Book"}], create_missing=True)
+
+        self.assertEqual(response.data["created_keys"], ["call_to_action"])
+        self.assertEqual(response.data["unknown_keys"], [])
+        field = Field.objects.get(section=self.section, key="call_to_action")
+        self.assertEqual((field.label, field.order), ("Call To Action", 3))
+        self.assertEqual(self.values()["call_to_action"], "Book")
+
+    def test_other_users_cannot_update(self):
+        self.client.force_authenticate(make_user("intruder"))
+
+        response = self.patch([{"key": "k0", "value": "x"}])
+
+        self.assertIn(response.status_code, (403, 404))
+        self.assertEqual(Field.objects.get(section=self.section, key="k0").value, "v0-en")
@@ -0,0 +1,158 @@
+import io
+import json
+from datetime import timedelta
+from unittest import mock
+
+from django.core.files.base import ContentFile
+from django.db import IntegrityError
+from django.test import TestCase
+from django.utils import timezone
+from PIL import Image
+
+from sites import ai
+from sites.jobs import claim_next_job, run_job
+from sites.models import BackgroundJob, ScreenshotAnalysis, SectionDraft
+from sites.section_drafts import (
+    apply_cached_analysis,
+    is_draft_stuck,
+    queue_section_draft,
+    recover_stuck_draft,
+    remember_analysis,
+)
+
+from .utils import TempMediaMixin, make_project, png_bytes
+
+
+ANALYSIS = {"sections": [{"type": "hero", "title": "Welcome"}], "business_type": "restaurant"}
+
+
+class DraftTestMixin(TempMediaMixin):
+    def setUp(self):
+        super().setUp()
+        self.project = make_project()
+        self.provider = ai.FakeProvider(response=json.dumps(ANALYSIS))
+        ai.set_provider(self.provider)
+        self.addCleanup(ai.set_provider, None)
+
+    def make_draft(self, content=None, project=None, locale="en"):
+        return SectionDraft.objects.create(
+            project=project or self.project,
+            image=ContentFile(content or png_bytes(), name="shot.png"),
+            locale=locale,
+        )
+
+    def process(self, draft):
+        """Queue the draft and run its job like the worker would."""
+        queue_section_draft(draft)
+        run_job(claim_next_job("worker"))
+        draft.refresh_from_db()
+        return draft
+
+
+class DraftQueueTests(DraftTestMixin, TestCase):
+    def stall(self, draft):
+        """Claim the draft's job and leave it running past the timeout."""
+        job = claim_next_job("worker")
+        started = timezone.now() - timedelta(hours=1)
+        SectionDraft.objects.filter(pk=draft.pk).update(processing_started_at=started, attempts=draft.attempts + 1)
+        draft.refresh_from_db()
+        return job
+
+    def test_concurrent_queue_creates_one_job(self):
+        draft = self.make_draft()
+        stale_copy = SectionDraft.objects.get(pk=draft.pk)
+
+        self.assertIsNotNone(queue_section_draft(draft))
+        self.assertIsNone(queue_section_draft(stale_copy))
+        self.assertEqual(BackgroundJob.objects.count(), 1)
+
+    def test_processing_draft_is_not_stuck_while_queued(self):
+        draft = self.make_draft()
+        queue_section_draft(draft)
+
+        self.assertFalse(is_draft_stuck(draft))
+        self.assertFalse(recover_stuck_draft(draft))
+
+    def test_stuck_draft_is_requeued_and_old_job_superseded(self):
+        draft = self.make_draft()
+        queue_section_draft(draft)
+        old_job = self.stall(draft)
+
+        self.assertTrue(recover_stuck_draft(draft))
+        self.assertNotEqual(draft.job_id, old_job.pk)
+        self.assertEqual(draft.job.max_attempts, 1)
+
+        self.assertEqual(run_job(old_job).result, {"draft_id": str(draft.pk), "superseded": True})
+        run_job(claim_next_job("worker"))
+        draft.refresh_from_db()
+        self.assertEqual((draft.status, draft.attempts), ("ready", 2))
+
+    def test_concurrent_recovery_queues_one_job(self):
+        draft = self.make_draft()
+        queue_section_draft(draft)
+        self.stall(draft)
+        other_reader = SectionDraft.objects.get(pk=draft.pk)
+
+        self.assertTrue(recover_stuck_draft(draft))
+        self.assertFalse(recover_stuck_draft(other_reader))
+        self.assertEqual(BackgroundJob.objects.count(), 2)
+        self.assertEqual(SectionDraft.objects.get(pk=draft.pk).job_id, draft.job_id)
+
+    def test_stuck_draft_out_of_attempts_fails(self):
+        draft = self.make_draft()
+        queue_section_draft(draft)
+        self.stall(draft)
+        recover_stuck_draft(draft)
+        self.stall(draft)
+
+        self.assertTrue(recover_stuck_draft(draft))
+        draft.refresh_from_db()
+        self.assertEqual((draft.status, draft.error_message), ("error", "Processing timed out."))
+        self.assertFalse(recover_stuck_draft(draft))
+
+
+class AnalysisCacheTests(DraftTestMixin, TestCase):
+    def test_analysis_is_cached_by_file(self):
+        first = self.process(self.make_draft())
+        other_project = make_project(slug="bakery")
+        second = self.make_draft(project=other_project)
+
+        self.assertEqual((first.status, first.ai_output_json), ("ready", ANALYSIS))
+        self.assertTrue(apply_cached_analysis(second))
+        second.refresh_from_db()
+        self.assertEqual((second.status, second.ai_output_json), ("ready", ANALYSIS))
+        self.assertEqual(len(self.provider.calls), 1)
+        self.assertEqual(ScreenshotAnalysis.objects.get().hits, 1)
+
+    def test_prompt_only_depends_on_cached_inputs(self):
+        self.process(self.make_draft(locale="pt"))
+
+        prompt = self.provider.calls[0]["messages"][1]["content"][0]["text"]
+        self.assertIn("Locale: pt", prompt)
+        self.assertNotIn(self.project.name, prompt)
+
+    def test_same_picture_saved_again_skips_the_model(self):
+        self.process(self.make_draft())
+        buffer = io.BytesIO()
+        Image.open(io.BytesIO(png_bytes())).save(buffer, "PNG", compress_level=1)
+        resaved = self.make_draft(buffer.getvalue())
+
+        self.assertFalse(apply_cached_analysis(resaved))
+        resaved = self.process(resaved)
+
+        self.assertEqual((resaved.status, resaved.ai_output_json), ("ready", ANALYSIS))
+        self.assertEqual(len(self.provider.calls), 1)
+
+    def test_other_locale_is_not_shared(self):
+        self.process(self.make_draft())
+
+        self.assertFalse(apply_cached_analysis(self.make_draft(locale="pt")))
+
+    def test_concurrent_insert_keeps_the_newer_answer(self):
+        draft = self.process(self.make_draft())
+        newer = {"sections": []}
+
+        with mock.patch("django.db.models.query.QuerySet.update_or_create", side_effect=IntegrityError):
+            remember_analysis(draft, newer)
+
+        self.assertEqual(ScreenshotAnalysis.objects.get().ai_output_json, newer)
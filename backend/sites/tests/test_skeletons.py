@@ -0,0 +1,125 @@
+from django.test import TestCase
+
+from sites.models import Field, NavigationItem, Page, Section, SiteProject, SiteTemplate, TemplateSection
+from sites.skeletons import SkeletonSpecError, derive_skeleton_spec, normalize_skeleton_spec
+from sites.slugs import free_slug
+from sites.utils import ensure_template_skeleton
+
+
+SPEC = {
+    "pages": [
+        {
+            "slug": "home", "path": "/", "title": "Home",
+            "sections": [
+                {"identifier": "hero", "internal_name": "Hero", "fields": [
+                    {"key": "title", "value": "Welcome"},
+                    {"key": "subtitle", "value": "Fresh food"},
+                ]},
+                {"identifier": "menu", "internal_name": "Menu", "fields": [{"key": "title", "value": "Menu"}]},
+            ],
+        },
+        {"slug": "contact", "path": "/contact", "title": "Contact", "sections": []},
+    ],
+    "navigation": [{"location": "header", "label": "Home", "url": "/"}],
+}
+
+
+class ApplySkeletonTests(TestCase):
+    def setUp(self):
+        self.site_template = SiteTemplate.objects.create(key="bistro", name="Bistro", skeleton_spec=SPEC)
+        self.master = ensure_template_skeleton(self.site_template)
+
+    def ids(self):
+        return {
+            "pages": set(Page.objects.filter(project=self.master).values_list("id", flat=True)),
+            "sections": set(Section.objects.filter(page__project=self.master).values_list("id", flat=True)),
+            "fields": set(Field.objects.filter(section__page__project=self.master).values_list("id", flat=True)),
+            "navigation": set(NavigationItem.objects.filter(project=self.master).values_list("id", flat=True)),
+        }
+
+    def test_spec_is_instantiated(self):
+        self.assertTrue(self.master.is_master_template)
+        self.assertEqual(self.master.slug, "bistro-master")
+        self.assertEqual(
+            list(Field.objects.filter(section__identifier="hero").order_by("order").values_list("key", "label")),
+            [("title", "Title"), ("subtitle", "Subtitle")],
+        )
+        home = Page.objects.get(project=self.master, slug="home")
+        self.assertEqual([s["identifier"] for s in home.content_document["sections"]], ["hero", "menu"])
+
+    def test_regenerating_without_changes_keeps_every_row(self):
+        ids = self.ids()
+        stamp = SiteProject.all_objects.get(pk=self.master.pk).content_updated_at
+
+        self.assertEqual(ensure_template_skeleton(self.site_template).pk, self.master.pk)
+
+        self.assertEqual(self.ids(), ids)
+        self.assertEqual(SiteProject.all_objects.get(pk=self.master.pk).content_updated_at, stamp)
+
+    def test_regenerating_a_change_touches_only_that_row(self):
+        ids = self.ids()
+        hero_title = Field.objects.get(section__identifier="hero", key="title")
+        spec = {**SPEC, "pages": [dict(SPEC["pages"][0]), SPEC["pages"][1]]}
+        spec["pages"][0]["sections"] = [
+            {**SPEC["pages"][0]["sections"][0], "fields": [{"key": "title", "value": "Hello"}]},
+            SPEC["pages"][0]["sections"][1],
+        ]
+        self.site_template.skeleton_spec = spec
+        self.site_template.save()
+
+        ensure_template_skeleton(self.site_template)
+
+        after = self.ids()
+        self.assertEqual(after["pages"], ids["pages"])
+        self.assertEqual(after["sections"], ids["sections"])
+        self.assertEqual(len(ids["fields"] - after["fields"]), 1)  # subtitle removed
+        hero_title.refresh_from_db()
+        self.assertEqual(hero_title.value, "Hello")
+
+
+class DerivedSkeletonIdentifierTests(TestCase):
+    def setUp(self):
+        self.site_template = SiteTemplate.objects.create(key="long", name="Long")
+
+    def add_section(self, identifier, code, group, order):
+        return TemplateSection.objects.create(
+            site_template=self.site_template,
+            identifier=identifier,
+            internal_name=identifier,
+            code=code,
+            group=group,
+            default_order=order,
+            section_type="hero",
+        )
+
+    def test_identifiers_fit_the_section_field(self):
+        max_length = Section._meta.get_field("identifier").max_length
+        self.add_section("hero-banner", "jcw-" + "x" * 140 + "-hero-01", "hero", 0)
+        self.add_section("hero-banner", "jcw-restaurant-hero-02", "slider", 1)
+        self.add_section("y" * 100, "z" * 150, "intro", 2)
+
+        spec = derive_skeleton_spec(self.site_template)
+
+        identifiers = [section["identifier"] for section in spec["pages"][0]["sections"]]
+        self.assertEqual(identifiers[:2], ["hero-banner", "hero-banner-1"])
+        self.assertTrue(all(len(identifier) <= max_length for identifier in identifiers))
+        self.assertEqual(len(set(identifiers)), 3)
+        normalize_skeleton_spec(spec)
+
+    def test_explicit_spec_rejects_long_identifiers(self):
+        spec = {"pages": [{"slug": "home", "path": "/", "sections": [{"identifier": "x" * 81}]}]}
+
+        with self.assertRaises(SkeletonSpecError):
+            normalize_skeleton_spec(spec)
+
+
+class FreeSlugTests(TestCase):
+    def test_max_length(self):
+        self.assertEqual(free_slug("a" * 10, [], max_length=8), "aaa")
+        self.assertEqual(free_slug("short", ["short"], max_length=8), "short-1")
+
+    def test_suffix_that_does_not_fit_shortens_the_base(self):
+        taken = ["b" * 79] + [f"{'b' * 79}-{n}" for n in range(1, 10)]
+
+        self.assertEqual(free_slug("b" * 79, taken, max_length=80), "b" * 75)
+        self.assertEqual(free_slug("b" * 79, taken + ["b" * 75], max_length=80), "b" * 75 + "-1")
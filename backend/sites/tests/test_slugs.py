@@ -0,0 +1,55 @@
+from unittest import mock
+
+from django.db import IntegrityError
+from django.test import TestCase
+
+from sites.models import SiteProject
+from sites.slugs import create_with_unique_slug, next_free_slug
+
+from .utils import make_user
+
+
+class SlugAllocationTests(TestCase):
+    def setUp(self):
+        self.owner = make_user()
+        self.projects = SiteProject.all_objects.all()
+
+    def create(self, slug):
+        return SiteProject.objects.create(owner=self.owner, name=slug, slug=slug)
+
+    def test_next_free_slug_in_one_query(self):
+        for slug in ("cafe", "cafe-1", "cafe-7", "cafe-bar", "cafeteria"):
+            self.create(slug)
+
+        with self.assertNumQueries(1):
+            self.assertEqual(next_free_slug(self.projects, "slug", "cafe"), "cafe-8")
+        self.assertEqual(next_free_slug(self.projects, "slug", "bakery"), "bakery")
+        self.assertEqual(next_free_slug(self.projects, "slug", "", fallback="site"), "site")
+
+    def test_zero_padded_suffix(self):
+        self.create("page")
+        self.create("page-01")
+
+        self.assertEqual(next_free_slug(self.projects, "slug", "page", width=2), "page-02")
+
+    def test_create_retries_when_a_concurrent_writer_takes_the_slug(self):
+        self.create("cafe")
+        # Allocated before another request inserted "cafe-1"
+        stale_allocation = ["cafe-1"]
+        self.create("cafe-1")
+        allocate = next_free_slug
+
+        def next_slug(*args, **kwargs):
+            return stale_allocation.pop() if stale_allocation else allocate(*args, **kwargs)
+
+        with mock.patch("sites.slugs.next_free_slug", side_effect=next_slug):
+            project = create_with_unique_slug(self.projects, "slug", "cafe", self.create)
+
+        self.assertEqual(project.slug, "cafe-2")
+
+    def test_other_integrity_errors_are_raised(self):
+        def create(slug):
+            raise IntegrityError("NOT NULL constraint failed")
+
+        with self.assertRaises(IntegrityError):
+            create_with_unique_slug(self.projects, "slug", "cafe", create)
@@ -0,0 +1,165 @@
+import json
+import threading
+import time
+from unittest import mock
+
+from django.core.cache import caches
+from django.test import override_settings
+from rest_framework.test import APIClient, APITestCase
+
+from sites import ai
+from sites.cache_backends import LRUDatabaseCache
+from sites.models import Field, Section
+from sites.suggestions import build_suggestion_params, suggest_section_content, suggestion_cache_key
+
+from .utils import make_project
+
+
+LOCMEM_CACHES = {
+    "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache", "LOCATION": "test-default"},
+    "ai": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache", "LOCATION": "test-ai"},
+}
+
+
+class SuggestionTests(APITestCase):
+    def setUp(self):
+        caches["ai"].clear()
+        self.project = make_project()
+        self.section = Section.objects.filter(page__project=self.project).first()
+        self.answers = 0
+        self.provider = ai.FakeProvider(responder=self.respond)
+        ai.set_provider(self.provider)
+        self.addCleanup(ai.set_provider, None)
+        self.client = APIClient()
+        self.client.force_authenticate(self.project.owner)
+        self.url = f"/api/builder/sections/{self.section.pk}/ai-suggest/"
+
+    def respond(self, model, messages):
+        self.answers += 1
+        return json.dumps({"k0": f"answer {self.answers}", "unknown": "dropped"})
+
+    def test_equivalent_requests_hit_the_cache(self):
+        first = self.client.post(self.url, {"tone": "Friendly"}, format="json")
+        second = self.client.post(self.url, {"tone": "  friendly "}, format="json")
+
+        self.assertEqual(first.data, {"suggested": {"k0": "answer 1"}, "cached": False})
+        self.assertEqual(second.data, {"suggested": {"k0": "answer 1"}, "cached": True})
+        self.assertEqual(len(self.provider.calls), 1)
+
+    def test_prompt_changes_miss_the_cache(self):
+        self.client.post(self.url, {"tone": "friendly"}, format="json")
+        self.client.post(self.url, {"tone": "friendly", "locale": "pt"}, format="json")
+        Field.objects.create(section=self.section, key="k9", label="New")
+        self.client.post(self.url, {"tone": "friendly"}, format="json")
+
+        self.assertEqual(len(self.provider.calls), 3)
+
+    def test_refresh_replaces_the_cached_answer(self):
+        self.client.post(self.url, {"tone": "friendly"}, format="json")
+
+        refreshed = self.client.post(f"{self.url}?refresh=true", {"tone": "friendly"}, format="json")
+        again = self.client.post(self.url, {"tone": "friendly"}, format="json")
+
+        self.assertEqual(refreshed.data, {"suggested": {"k0": "answer 2"}, "cached": False})
+        self.assertEqual(again.data, {"suggested": {"k0": "answer 2"}, "cached": True})
+
+    @override_settings(SITES_AI_SUGGEST_LOCK_WAIT=2)
+    def test_call_is_bounded_by_the_lock_wait(self):
+        # Changing SITES_AI_* settings resets the provider
+        ai.set_provider(self.provider)
+
+        suggest_section_content(self.section)
+
+        self.assertLessEqual(self.provider.calls[0]["timeout"], 2)
+
+
+@override_settings(CACHES=LOCMEM_CACHES, SITES_AI_SUGGEST_LOCK_WAIT=5)
+class SuggestionCoalescingTests(APITestCase):
+    """An identical request in flight (holding the lock) is joined, not repeated."""
+
+    def setUp(self):
+        self.section = Section.objects.filter(page__project=make_project()).first()
+        self.provider = ai.FakeProvider(response=json.dumps({"k0": "mine"}))
+        ai.set_provider(self.provider)
+        self.addCleanup(ai.set_provider, None)
+        self.key = suggestion_cache_key(
+            build_suggestion_params(self.section, locale="en", tone="", extra_instructions="")
+        )
+        self.cache = caches["ai"]
+        self.cache.clear()
+        self.lock_cache = caches["default"]
+        self.lock_cache.clear()
+        self.lock_cache.add(f"{self.key}:lock", "other-request", 30)
+
+    def finish_other_request(self, cache, key_suffix, value):
+        def finish():
+            cache.set(f"{self.key}{key_suffix}", value)
+            self.lock_cache.delete(f"{self.key}:lock")
+        timer = threading.Timer(0.2, finish)
+        timer.start()
+        self.addCleanup(timer.cancel)
+
+    def test_waits_for_the_answer_in_flight(self):
+        self.finish_other_request(self.cache, "", {"data": {"k0": "theirs"}, "built_at": time.time() + 1})
+
+        data, cached = suggest_section_content(self.section)
+
+        self.assertEqual((data, cached), ({"k0": "theirs"}, True))
+        self.assertEqual(self.provider.calls, [])
+
+    def test_shares_the_error_in_flight(self):
+        self.finish_other_request(self.lock_cache, ":error", {"message": "Provider down", "at": time.time() + 1})
+
+        with self.assertRaisesMessage(ai.AIProviderError, "Provider down"):
+            suggest_section_content(self.section)
+        self.assertEqual(self.provider.calls, [])
+
+    def test_asks_itself_when_the_other_request_vanishes(self):
+        self.lock_cache.delete(f"{self.key}:lock")
+
+        data, cached = suggest_section_content(self.section)
+
+        self.assertEqual((data, cached), ({"k0": "mine"}, False))
+
+    def test_waiters_back_off(self):
+        delays = []
+
+        def sleep(delay):
+            delays.append(delay)
+            if len(delays) == 7:
+                self.cache.set(self.key, {"data": {"k0": "theirs"}, "built_at": time.time() + 1})
+
+        with mock.patch("sites.suggestions.time.sleep", side_effect=sleep):
+            suggest_section_content(self.section)
+
+        self.assertEqual(delays, [0.05, 0.1, 0.2, 0.4, 0.8, 1.0, 1.0])
+
+    @override_settings(SITES_AI_SUGGEST_LOCK_WAIT=0.1)
+    def test_busy_after_the_lock_wait(self):
+        with self.assertRaises(ai.AIBusyError):
+            suggest_section_content(self.section)
+
+
+class LRUDatabaseCacheTests(APITestCase):
+    def test_culls_least_recently_used_entries(self):
+        cache = LRUDatabaseCache("jcw_ai_cache", {"OPTIONS": {"MAX_ENTRIES": 3, "CULL_FREQUENCY": 3}})
+        cache.clear()
+        # Expiry times are stored to the second: one second per use
+        for offset, key in enumerate("abc"):
+            cache.set(key, key, 60 + offset)
+        cache.touch("a", 70)
+        cache.set("d", "d", 71)
+
+        cache.set("e", "e", 72)
+
+        self.assertEqual(cache.get_many(["a", "b", "c", "d", "e"]), {"a": "a", "c": "c", "d": "d", "e": "e"})
+
+    def test_hits_are_touched(self):
+        section = Section.objects.filter(page__project=make_project()).first()
+        ai.set_provider(ai.FakeProvider(response=json.dumps({"k0": "x"})))
+        self.addCleanup(ai.set_provider, None)
+        suggest_section_content(section)
+
+        with mock.patch.object(type(caches["ai"]), "touch") as touch:
+            suggest_section_content(section)
+        touch.assert_called_once()
@@ -0,0 +1,75 @@
+"""Shared fixtures for the sites tests."""
+
+import io
+import shutil
+import tempfile
+
+from django.contrib.auth.models import User
+from django.test import override_settings
+from PIL import Image
+
+from sites.documents import rebuild_page_documents
+from sites.models import Field, HeroSlide, NavigationItem, Page, Section, SiteProject, SiteTemplate
+
+
+def make_user(username="owner", **extra):
+    return User.objects.create_user(username, f"{username}@example.com", "pw", **extra)
+
+
+def make_project(owner=None, slug="cafe", locales=("en",), pages=("home", "about"), sections=2, fields=3):
+    """A project with pages, sections, fields, a hero slide per page and a nav item."""
+    owner = owner or make_user(f"owner-{slug}")
+    site_template, _ = SiteTemplate.objects.get_or_create(key="restaurant-modern", defaults={"name": "Restaurant"})
+    project = SiteProject.objects.create(
+        owner=owner, name=slug.title(), slug=slug, site_template=site_template, primary_locale=locales[0]
+    )
+    for locale in locales:
+        for page_order, page_slug in enumerate(pages):
+            page = Page.objects.create(
+                project=project,
+                slug=page_slug,
+                path="/" if page_slug == "home" else f"/{page_slug}",
+                title=f"{page_slug} {locale}",
+                locale=locale,
+                order=page_order,
+                is_published=True,
+            )
+            for section_order in range(sections):
+                section = Section.objects.create(
+                    page=page,
+                    identifier=f"section-{section_order}",
+                    internal_name=f"Section {section_order}",
+                    order=section_order,
+                )
+                Field.objects.bulk_create([
+                    Field(section=section, key=f"k{i}", label=f"Label {i}", value=f"v{i}-{locale}", order=i)
+                    for i in range(fields)
+                ])
+            HeroSlide.objects.create(page=page, title="Slide", order=0)
+    NavigationItem.objects.create(project=project, location="header", label="Home", url="/", order=0)
+    # Field.objects.bulk_create skipped the signals, like the bulk writers do
+    rebuild_page_documents(Page.objects.filter(project=project).values_list("id", flat=True))
+    return project
+
+
+def png_bytes(width=400, height=300, color=(30, 60, 90), image_format="PNG"):
+    buffer = io.BytesIO()
+    Image.new("RGB", (width, height), color).save(buffer, image_format)
+    return buffer.getvalue()
+
+
+class TempMediaMixin:
+    """Runs the test case with MEDIA_ROOT in a throwaway directory."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls._media_root = tempfile.mkdtemp()
+        cls._media_override = override_settings(MEDIA_ROOT=cls._media_root)
+        cls._media_override.enable()
+        super().setUpClass()
+
+    @classmethod
+    def tearDownClass(cls):
+        super().tearDownClass()
+        cls._media_override.disable()
+        shutil.rmtree(cls._media_root, ignore_errors=True)
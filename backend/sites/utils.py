@@ -2,14 +2,64 @@
 Template Builder utilities for cloning and skeleton generation.
 """
 import uuid
-from typing import Optional, List
+from typing import Dict, Optional, List, Tuple
 from django.contrib.auth.models import User
+from django.db import transaction
+from django.db.models import F
 from django.utils.text import slugify
 
 from .models import (
     SiteProject, SiteTemplate, Page, Section, Field, NavigationItem,
-    LocaleChoices
+    HeroSlide, LocaleChoices
 )
+from .caching import bump_content_version
+from .documents import build_page_documents, deferred_page_documents
+from .routing import invalidate_route_table
+from .skeletons import apply_skeleton, get_skeleton_spec
+from .slugs import create_with_unique_slug
+
+
+# [CLONE] Bulk cloning: one bulk_create per level with old -> new id maps
+CLONE_BATCH_SIZE = 500
+_CLONE_SKIP_FIELDS = {"created_at", "updated_at"}
+
+
+def _clone_instance(obj, **overrides):
+    """Unsaved copy of a model instance with its concrete field values."""
+    values = {
+        field.attname: getattr(obj, field.attname)
+        for field in obj._meta.concrete_fields
+        if not field.primary_key and field.name not in _CLONE_SKIP_FIELDS
+    }
+    values.update(overrides)
+    return type(obj)(**values)
+
+
+def _bulk_create_navigation(items, nav_map, build) -> int:
+    """
+    bulk_create ``build(item)`` for each source NavigationItem, one tree depth
+    at a time so parents exist before their children. ``nav_map`` (old id ->
+    new id) is filled as levels are created and may be pre-seeded with
+    parents that already exist. Returns the number of items created.
+    """
+    pending = list(items)
+    pending_ids = {item.id for item in pending}
+    created_count = 0
+    while pending:
+        level = [
+            item for item in pending
+            if item.parent_id is None or item.parent_id not in pending_ids or item.parent_id in nav_map
+        ]
+        if not level:
+            # Parent cycle in the source data: attach the rest at top level
+            level = pending
+        created = NavigationItem.objects.bulk_create(
+            [build(item) for item in level], batch_size=CLONE_BATCH_SIZE
+        )
+        nav_map.update({old.id: new.id for old, new in zip(level, created)})
+        created_count += len(created)
+        pending = [item for item in pending if item.id not in nav_map]
+    return created_count
 
 
 def clone_project_structure(
@@ -21,7 +71,8 @@ def clone_project_structure(
     locales: Optional[List[str]] = None
 ) -> SiteProject:
     """
-    Clones a SiteProject's complete structure including Pages, Sections, Fields, and NavigationItems.
+    Clones a SiteProject's complete structure including Pages, Sections, Fields,
+    HeroSlides and NavigationItems (see bulk_clone_project).
     
     Args:
         src_project: Source project to clone from
@@ -33,116 +84,350 @@ def clone_project_structure(
     Returns:
         New SiteProject with cloned structure
     """
+    new_project, _counts = bulk_clone_project(
+        src_project, owner=owner, name=name, slug=slug, locales=locales
+    )
+    return new_project
+
+
+def bulk_clone_project(
+    src_project: SiteProject,
+    *,
+    owner: Optional[User] = None,
+    name: Optional[str] = None,
+    slug: Optional[str] = None,
+    locales: Optional[List[str]] = None
+) -> Tuple[SiteProject, Dict[str, int]]:
+    """
+    Clone a SiteProject with its Pages, Sections, Fields, HeroSlides and
+    NavigationItems (including nested items) in one transaction.
+
+    Source rows are read with one query per model and written with one
+    bulk_create per level; old -> new id maps link each level to its
+    parent. Returns the new project and the number of cloned rows per
+    model, taken from those maps.
+    """
     # Set defaults
     if owner is None:
         owner = src_project.owner
     if name is None:
         name = f"{src_project.name} (Copy)"
-    if slug is None:
-        base_slug = slugify(name)
-        counter = 1
-        slug = base_slug
-        while SiteProject.objects.filter(slug=slug).exists():
-            slug = f"{base_slug}-{counter}"
-            counter += 1
-    
-    if locales is None:
-        # Get all locales from source project pages
-        source_locales = list(src_project.pages.values_list('locale', flat=True).distinct())
-        locales = source_locales if source_locales else ['en']
-    
-    # Create new project
-    new_project = SiteProject.objects.create(
-        owner=owner,
-        template=src_project.template,
-        site_template=src_project.site_template,
-        name=name,
-        slug=slug,
-        business_type=src_project.business_type,
-        primary_goal=src_project.primary_goal,
-        primary_locale=src_project.primary_locale,
-        additional_locales=src_project.additional_locales,
-        default_theme=src_project.default_theme,
-        allow_theme_toggle=src_project.allow_theme_toggle,
-        primary_color=src_project.primary_color,
-        accent_color=src_project.accent_color,
-        hero_particles_enabled=src_project.hero_particles_enabled,
-        hero_particles_density=src_project.hero_particles_density,
-        hero_particles_speed=src_project.hero_particles_speed,
-        hero_particles_size=src_project.hero_particles_size,
-        header_background_mode=src_project.header_background_mode,
-        notes=src_project.notes,
-        is_active=True,
-        is_master_template=False  # Cloned projects are not master templates
+
+    src_pages = src_project.pages.order_by('order', 'id')
+    if locales is not None:
+        src_pages = src_pages.filter(locale__in=locales)
+    src_pages = list(src_pages)
+
+    src_page_ids = [page.id for page in src_pages]
+    src_sections = list(Section.objects.filter(page_id__in=src_page_ids).order_by('order', 'id'))
+    src_fields = list(
+        Field.objects.filter(section__page_id__in=src_page_ids).order_by('order', 'id')
     )
-    
-    # Clone pages for each locale
-    page_mapping = {}  # Track old_page_id -> new_page for navigation cloning
-    
-    for locale in locales:
-        source_pages = src_project.pages.filter(locale=locale).order_by('order')
-        
-        for src_page in source_pages:
-            new_page = Page.objects.create(
-                project=new_project,
-                slug=src_page.slug,
-                path=src_page.path,
-                title=src_page.title,
-                order=src_page.order,
-                is_published=src_page.is_published,
-                locale=locale
+    src_slides = list(HeroSlide.objects.filter(page_id__in=src_page_ids).order_by('order', 'id'))
+    src_nav_items = list(src_project.navigation_items.order_by('id'))
+
+    def create_project(project_slug):
+        return SiteProject.objects.create(
+            owner=owner,
+            template=src_project.template,
+            site_template=src_project.site_template,
+            name=name,
+            slug=project_slug,
+            business_type=src_project.business_type,
+            primary_goal=src_project.primary_goal,
+            primary_locale=src_project.primary_locale,
+            additional_locales=src_project.additional_locales,
+            default_theme=src_project.default_theme,
+            allow_theme_toggle=src_project.allow_theme_toggle,
+            primary_color=src_project.primary_color,
+            accent_color=src_project.accent_color,
+            hero_particles_enabled=src_project.hero_particles_enabled,
+            hero_particles_density=src_project.hero_particles_density,
+            hero_particles_speed=src_project.hero_particles_speed,
+            hero_particles_size=src_project.hero_particles_size,
+            header_background_mode=src_project.header_background_mode,
+            notes=src_project.notes,
+            is_active=True,
+            is_master_template=False  # Cloned projects are not master templates
+        )
+
+    with transaction.atomic():
+        if slug is None:
+            new_project = create_with_unique_slug(
+                SiteProject.all_objects.all(), 'slug', slugify(name), create_project,
+                max_length=150, fallback='site',
             )
-            page_mapping[src_page.id] = new_page
-            
-            # Clone sections
-            section_mapping = {}
-            for src_section in src_page.sections.all().order_by('order'):
-                new_section = Section.objects.create(
-                    page=new_page,
-                    identifier=src_section.identifier,
-                    internal_name=src_section.internal_name,
-                    order=src_section.order
-                )
-                section_mapping[src_section.id] = new_section
-                
-                # Clone fields
-                for src_field in src_section.fields.all().order_by('order'):
-                    Field.objects.create(
-                        section=new_section,
-                        key=src_field.key,
-                        label=src_field.label,
-                        value=src_field.value,
-                        order=src_field.order
-                    )
-    
-    # Clone navigation items
-    for src_nav in src_project.navigation_items.all():
-        # Handle page references
-        page_ref = None
-        if src_nav.page and src_nav.page.id in page_mapping:
-            page_ref = page_mapping[src_nav.page.id]
-        
-        NavigationItem.objects.create(
-            project=new_project,
-            locale=src_nav.locale,
-            parent=None,  # TODO: Handle nested navigation if needed
-            location=src_nav.location,
-            column=src_nav.column,
-            label=src_nav.label,
-            page=page_ref,
-            url=src_nav.url,
-            is_external=src_nav.is_external,
-            order=src_nav.order
+        else:
+            new_project = create_project(slug)
+
+        new_pages = Page.objects.bulk_create(
+            [
+                _clone_instance(page, project_id=new_project.id, content_document={}, version=1)
+                for page in src_pages
+            ],
+            batch_size=CLONE_BATCH_SIZE,
         )
-    
-    return new_project
+        page_map = {old.id: new.id for old, new in zip(src_pages, new_pages)}
+
+        new_sections = Section.objects.bulk_create(
+            [_clone_instance(section, page_id=page_map[section.page_id]) for section in src_sections],
+            batch_size=CLONE_BATCH_SIZE,
+        )
+        section_map = {old.id: new.id for old, new in zip(src_sections, new_sections)}
+
+        new_fields = Field.objects.bulk_create(
+            [_clone_instance(field, section_id=section_map[field.section_id]) for field in src_fields],
+            batch_size=CLONE_BATCH_SIZE,
+        )
+        new_slides = HeroSlide.objects.bulk_create(
+            [_clone_instance(slide, page_id=page_map[slide.page_id]) for slide in src_slides],
+            batch_size=CLONE_BATCH_SIZE,
+        )
+
+        nav_map = {}
+        _bulk_create_navigation(
+            src_nav_items,
+            nav_map,
+            lambda item: _clone_instance(
+                item,
+                project_id=new_project.id,
+                page_id=page_map.get(item.page_id),
+                parent_id=nav_map.get(item.parent_id),
+            ),
+        )
+
+        # Bulk writes bypass the model signals (sites/signals.py)
+        documents = build_page_documents(page_map.values())
+        for page in new_pages:
+            page.content_document = documents[page.id]
+        Page.objects.bulk_update(new_pages, ['content_document'], batch_size=CLONE_BATCH_SIZE)
+        bump_content_version(id=new_project.id)
+        invalidate_route_table(new_project.id)
+
+    counts = {
+        'pages': len(page_map),
+        'sections': len(section_map),
+        'fields': len(new_fields),
+        'hero_slides': len(new_slides),
+        'navigation_items': len(nav_map),
+    }
+    return new_project, counts
+
+
+# [I18N] Bulk copy of one locale of a project into another
+LOCALE_DUPLICATE_MODES = ('skip', 'merge')
+
+
+def duplicate_project_locale(
+    project: SiteProject,
+    source_locale: str,
+    target_locale: str,
+    *,
+    mode: str = 'skip',
+    page_ids: Optional[List[int]] = None,
+    navigation: bool = True,
+    navigation_item_ids: Optional[List[int]] = None,
+) -> Dict[str, int]:
+    """
+    Copy the pages (with sections, fields and hero slides) and navigation
+    items of one locale of a project into another locale.
+
+    Pages are matched by slug. With ``mode='skip'`` pages that already exist
+    in the target locale are left untouched; with ``mode='merge'`` they keep
+    their content but receive the sections (by identifier) and fields (by
+    key) they are missing, plus the source hero slides if they have none.
+    Navigation items are matched by location, column and label and are
+    never duplicated; links to pages point at the target-locale page when
+    one exists.
+
+    ``page_ids`` and ``navigation_item_ids`` restrict the copy to those
+    source rows; ``navigation=False`` skips navigation. Runs in one
+    transaction with a fixed number of queries, whatever the site size.
+    Returns created/skipped counts.
+    """
+    if mode not in LOCALE_DUPLICATE_MODES:
+        raise ValueError(f"Unknown mode '{mode}'")
+    if source_locale == target_locale:
+        raise ValueError('Source and target locale must differ.')
+
+    counts = dict.fromkeys(
+        [
+            'pages_created', 'pages_merged', 'pages_skipped', 'sections_created',
+            'fields_created', 'hero_slides_created', 'navigation_items_created',
+            'navigation_items_skipped',
+        ],
+        0,
+    )
+
+    src_pages = Page.objects.filter(project=project, locale=source_locale).order_by('order', 'id')
+    if page_ids is not None:
+        src_pages = src_pages.filter(id__in=page_ids)
+    src_pages = list(src_pages)
+
+    with transaction.atomic():
+        target_pages = {
+            page.slug: page
+            for page in Page.objects.filter(project=project, locale=target_locale)
+        }
+
+        page_map = {}  # source page id -> target page id (new or merged)
+        new_src_pages, new_pages, merged_pages = [], [], {}
+        for page in src_pages:
+            existing = target_pages.get(page.slug)
+            if existing is None:
+                new_src_pages.append(page)
+                new_pages.append(_clone_instance(
+                    page, locale=target_locale, content_document={}, version=1
+                ))
+            elif mode == 'merge':
+                page_map[page.id] = existing.id
+                merged_pages[existing.id] = existing
+            else:
+                counts['pages_skipped'] += 1
+        Page.objects.bulk_create(new_pages, batch_size=CLONE_BATCH_SIZE)
+        page_map.update({old.id: new.id for old, new in zip(new_src_pages, new_pages)})
+        counts['pages_created'] = len(new_pages)
+        counts['pages_merged'] = len(merged_pages)
+
+        # What merged pages already have
+        existing_sections = dict(
+            ((page_id, identifier), section_id)
+            for section_id, page_id, identifier in Section.objects.filter(
+                page_id__in=merged_pages
+            ).values_list('id', 'page_id', 'identifier')
+        )
+        existing_fields = set(
+            Field.objects.filter(section__page_id__in=merged_pages).values_list('section_id', 'key')
+        )
+        pages_with_slides = set(
+            HeroSlide.objects.filter(page_id__in=merged_pages).values_list('page_id', flat=True)
+        )
+
+        touched_page_ids = {page.id for page in new_pages}
+        # target section id -> target page id
+        section_pages = {section_id: page_id for (page_id, _), section_id in existing_sections.items()}
+
+        section_map = {}  # source section id -> target section id
+        new_src_sections, new_sections = [], []
+        for section in Section.objects.filter(page_id__in=page_map).order_by('order', 'id'):
+            target_page_id = page_map[section.page_id]
+            existing_id = existing_sections.get((target_page_id, section.identifier))
+            if existing_id is not None:
+                section_map[section.id] = existing_id
+            else:
+                new_src_sections.append(section)
+                new_sections.append(_clone_instance(section, page_id=target_page_id))
+                touched_page_ids.add(target_page_id)
+        Section.objects.bulk_create(new_sections, batch_size=CLONE_BATCH_SIZE)
+        section_map.update({old.id: new.id for old, new in zip(new_src_sections, new_sections)})
+        section_pages.update({section.id: section.page_id for section in new_sections})
+        counts['sections_created'] = len(new_sections)
 
+        new_fields = []
+        for field in Field.objects.filter(section_id__in=section_map).order_by('order', 'id'):
+            target_section_id = section_map[field.section_id]
+            if (target_section_id, field.key) in existing_fields:
+                continue
+            new_fields.append(_clone_instance(field, section_id=target_section_id))
+            touched_page_ids.add(section_pages[target_section_id])
+        Field.objects.bulk_create(new_fields, batch_size=CLONE_BATCH_SIZE)
+        counts['fields_created'] = len(new_fields)
 
+        new_slides = [
+            _clone_instance(slide, page_id=page_map[slide.page_id])
+            for slide in HeroSlide.objects.filter(page_id__in=page_map).order_by('order', 'id')
+            if page_map[slide.page_id] not in pages_with_slides
+        ]
+        HeroSlide.objects.bulk_create(new_slides, batch_size=CLONE_BATCH_SIZE)
+        counts['hero_slides_created'] = len(new_slides)
+
+        if navigation:
+            counts.update(_duplicate_navigation_locale(
+                project, source_locale, target_locale, navigation_item_ids
+            ))
+
+        # Bulk writes bypass the model signals (sites/signals.py)
+        documents = build_page_documents(touched_page_ids)
+        updated_pages = []
+        for page in [*new_pages, *merged_pages.values()]:
+            if page.id in documents:
+                page.content_document = documents[page.id]
+                if page.id in merged_pages:
+                    page.version = F('version') + 1
+                updated_pages.append(page)
+        Page.objects.bulk_update(updated_pages, ['content_document', 'version'], batch_size=CLONE_BATCH_SIZE)
+
+        locales = [project.primary_locale, *(project.additional_locales or [])]
+        if target_locale not in locales:
+            project.additional_locales = [*(project.additional_locales or []), target_locale]
+            project.save(update_fields=['additional_locales', 'updated_at'])
+        bump_content_version(id=project.id)
+        invalidate_route_table(project.id)
+
+    return counts
+
+
+def _duplicate_navigation_locale(project, source_locale, target_locale, item_ids=None) -> Dict[str, int]:
+    src_items = list(NavigationItem.objects.filter(project=project, locale=source_locale).order_by('id'))
+    target_keys = {
+        (item.location, item.column, item.label): item.id
+        for item in NavigationItem.objects.filter(project=project, locale=target_locale)
+    }
+    source_page_slugs = dict(
+        Page.objects.filter(project=project, locale=source_locale).values_list('id', 'slug')
+    )
+    target_page_ids = dict(
+        Page.objects.filter(project=project, locale=target_locale).values_list('slug', 'id')
+    )
+
+    # Existing counterparts double as parents for new children
+    nav_map = {}
+    for item in src_items:
+        existing_id = target_keys.get((item.location, item.column, item.label))
+        if existing_id is not None:
+            nav_map[item.id] = existing_id
+
+    selected = [item for item in src_items if item_ids is None or item.id in item_ids]
+    pending = [item for item in selected if item.id not in nav_map]
+
+    def build(item):
+        target_page_id = target_page_ids.get(source_page_slugs.get(item.page_id))
+        return _clone_instance(
+            item,
+            locale=target_locale,
+            # Keep the original link when the page has no translation yet
+            page_id=target_page_id or item.page_id,
+            parent_id=nav_map.get(item.parent_id),
+        )
+
+    return {
+        'navigation_items_created': _bulk_create_navigation(pending, nav_map, build),
+        'navigation_items_skipped': len(selected) - len(pending),
+    }
+
+
+def get_template_system_user() -> User:
+    """Inactive system user that owns master template projects."""
+    system_user, _created = User.objects.get_or_create(
+        username='system_template_builder',
+        defaults={
+            'email': 'system@justcodeworks.com',
+            'first_name': 'System',
+            'last_name': 'Template Builder',
+            'is_active': False,  # System user, not for login
+        }
+    )
+    return system_user
+
+
+@deferred_page_documents()
 def ensure_template_skeleton(site_template: SiteTemplate) -> SiteProject:
     """
     Creates or updates a hidden master SiteProject for the given SiteTemplate.
     
     This master project serves as the skeleton/blueprint for new projects created from this template.
+    Its layout comes from the template's skeleton spec (see sites/skeletons.py); an existing master
+    is diffed against the spec, so unchanged pages, sections and fields keep their ids.
     
     Args:
         site_template: The SiteTemplate to create skeleton for
@@ -153,17 +438,11 @@ def ensure_template_skeleton(site_template: SiteTemplate) -> SiteProject:
     master_name = f"{site_template.key}-master"
     master_slug = f"{site_template.key}-master"
     
+    # Validate the spec before touching anything
+    spec = get_skeleton_spec(site_template)
+    
     # Get or create a system user for master templates
-    from django.contrib.auth.models import User
-    system_user, created = User.objects.get_or_create(
-        username='system_template_builder',
-        defaults={
-            'email': 'system@justcodeworks.com',
-            'first_name': 'System',
-            'last_name': 'Template Builder',
-            'is_active': False,  # System user, not for login
-        }
-    )
+    system_user = get_template_system_user()
     
     # Get or create master project
     master_project, created = SiteProject.objects.get_or_create(
@@ -180,175 +459,5 @@ def ensure_template_skeleton(site_template: SiteTemplate) -> SiteProject:
         }
     )
     
-    # Clear existing structure if updating
-    if not created:
-        master_project.pages.all().delete()
-        master_project.navigation_items.all().delete()
-    
-    # Create default page structure
-    pages_data = [
-        {'slug': 'home', 'path': '/', 'title': 'Home', 'order': 0},
-        {'slug': 'about', 'path': '/about', 'title': 'About Us', 'order': 1},
-        {'slug': 'services', 'path': '/services', 'title': 'Services', 'order': 2},
-        {'slug': 'contact', 'path': '/contact', 'title': 'Contact', 'order': 3},
-    ]
-    
-    for page_data in pages_data:
-        page = Page.objects.create(
-            project=master_project,
-            locale='en',
-            **page_data
-        )
-        
-        # Add sections based on page type
-        if page.slug == 'home':
-            _create_home_sections(page)
-        elif page.slug == 'about':
-            _create_about_sections(page)
-        elif page.slug == 'services':
-            _create_services_sections(page)
-        elif page.slug == 'contact':
-            _create_contact_sections(page)
-    
-    # Create default navigation
-    _create_default_navigation(master_project)
-    
+    apply_skeleton(master_project, spec)
     return master_project
-
-
-def _create_home_sections(page: Page):
-    """Create default sections for home page."""
-    sections_data = [
-        {
-            'identifier': 'front-hero1',
-            'internal_name': 'Hero Section',
-            'order': 0,
-            'fields': [
-                {'key': 'title', 'label': 'Main Title', 'value': 'Welcome to Our Website', 'order': 0},
-                {'key': 'subtitle', 'label': 'Subtitle', 'value': 'We provide amazing services', 'order': 1},
-                {'key': 'cta_text', 'label': 'Call to Action Text', 'value': 'Get Started', 'order': 2},
-                {'key': 'cta_url', 'label': 'Call to Action URL', 'value': '/contact', 'order': 3},
-            ]
-        },
-        {
-            'identifier': 'front-services1',
-            'internal_name': 'Services Overview',
-            'order': 1,
-            'fields': [
-                {'key': 'title', 'label': 'Section Title', 'value': 'Our Services', 'order': 0},
-                {'key': 'description', 'label': 'Description', 'value': 'We offer a range of professional services', 'order': 1},
-                {'key': 'items', 'label': 'Service Items (JSON)', 'value': '[]', 'order': 2},
-            ]
-        },
-        {
-            'identifier': 'front-cta1',
-            'internal_name': 'Call to Action',
-            'order': 2,
-            'fields': [
-                {'key': 'title', 'label': 'CTA Title', 'value': 'Ready to Get Started?', 'order': 0},
-                {'key': 'text', 'label': 'CTA Text', 'value': 'Contact us today', 'order': 1},
-                {'key': 'button_text', 'label': 'Button Text', 'value': 'Contact Us', 'order': 2},
-                {'key': 'button_url', 'label': 'Button URL', 'value': '/contact', 'order': 3},
-            ]
-        }
-    ]
-    
-    for section_data in sections_data:
-        fields_data = section_data.pop('fields')
-        section = Section.objects.create(page=page, **section_data)
-        
-        for field_data in fields_data:
-            Field.objects.create(section=section, **field_data)
-
-
-def _create_about_sections(page: Page):
-    """Create default sections for about page."""
-    section = Section.objects.create(
-        page=page,
-        identifier='about-main1',
-        internal_name='About Content',
-        order=0
-    )
-    
-    Field.objects.create(
-        section=section,
-        key='title',
-        label='Page Title',
-        value='About Us',
-        order=0
-    )
-    Field.objects.create(
-        section=section,
-        key='content',
-        label='Main Content',
-        value='Tell your story here...',
-        order=1
-    )
-
-
-def _create_services_sections(page: Page):
-    """Create default sections for services page."""
-    section = Section.objects.create(
-        page=page,
-        identifier='services-main1',
-        internal_name='Services Content',
-        order=0
-    )
-    
-    Field.objects.create(
-        section=section,
-        key='title',
-        label='Page Title',
-        value='Our Services',
-        order=0
-    )
-    Field.objects.create(
-        section=section,
-        key='services_list',
-        label='Services List (JSON)',
-        value='[]',
-        order=1
-    )
-
-
-def _create_contact_sections(page: Page):
-    """Create default sections for contact page."""
-    section = Section.objects.create(
-        page=page,
-        identifier='contact-main1',
-        internal_name='Contact Content',
-        order=0
-    )
-    
-    fields_data = [
-        {'key': 'title', 'label': 'Page Title', 'value': 'Contact Us', 'order': 0},
-        {'key': 'address', 'label': 'Address', 'value': 'Your address here', 'order': 1},
-        {'key': 'phone', 'label': 'Phone', 'value': 'Your phone here', 'order': 2},
-        {'key': 'email', 'label': 'Email', 'value': 'your@email.com', 'order': 3},
-    ]
-    
-    for field_data in fields_data:
-        Field.objects.create(section=section, **field_data)
-
-
-def _create_default_navigation(project: SiteProject):
-    """Create default navigation items."""
-    nav_items = [
-        {'location': 'header', 'label': 'Home', 'url': '/', 'order': 0},
-        {'location': 'header', 'label': 'About', 'url': '/about', 'order': 1},
-        {'location': 'header', 'label': 'Services', 'url': '/services', 'order': 2},
-        {'location': 'header', 'label': 'Contact', 'url': '/contact', 'order': 3},
-        
-        # Footer navigation
-        {'location': 'footer', 'label': 'Home', 'url': '/', 'column': 1, 'order': 0},
-        {'location': 'footer', 'label': 'About', 'url': '/about', 'column': 1, 'order': 1},
-        {'location': 'footer', 'label': 'Services', 'url': '/services', 'column': 2, 'order': 0},
-        {'location': 'footer', 'label': 'Contact', 'url': '/contact', 'column': 2, 'order': 1},
-    ]
-    
-    for nav_data in nav_items:
-        NavigationItem.objects.create(
-            project=project,
-            locale='en',
-            **nav_data
-        )
\ No newline at end of file
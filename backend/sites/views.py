@@ -1,4 +1,5 @@
 import json
+import time
 from django.conf import settings
 from django.db import models
 from rest_framework import viewsets, mixins, status, generics, permissions, authentication
@@ -6,12 +7,33 @@ from rest_framework.views import APIView
 from rest_framework.permissions import AllowAny, IsAuthenticatedOrReadOnly, IsAuthenticated
 from rest_framework.decorators import action, api_view, permission_classes
 from rest_framework.response import Response
-from rest_framework.exceptions import PermissionDenied
+from rest_framework.renderers import BaseRenderer, JSONRenderer
+from rest_framework.exceptions import PermissionDenied, NotFound
 from rest_framework_simplejwt.authentication import JWTAuthentication
 from django.contrib.auth.models import User
+from django.core.exceptions import ValidationError as DjangoValidationError
 from django.db.models import Prefetch
+from django.urls import reverse
+from django.http import StreamingHttpResponse
+from .conditional import ConditionalGetMixin, conditional_response, make_etag
+from .public_tree import build_public_site
+from .locales import annotate_locale_rank
+from .services import materialize_section_draft
+from .caching import bump_content_version
+from .documents import rebuild_page_documents
+from .ordering import OrderingError, reorder_group
+from .ai import AIBusyError, AIConfigurationError, is_ai_configured
+from .suggestions import suggest_section_content
+from .section_drafts import (
+    DRAFT_FINISHED_STATUSES,
+    apply_cached_analysis,
+    draft_status_payload,
+    get_draft_events_timeout,
+    queue_section_draft,
+    recover_stuck_draft,
+)
 
-from .models import Template, SiteProject, Page, Section, Field, BugReport, NavigationItem, HeroSlide, SiteTemplate, TemplateSection, QuoteRequest, SectionDraft, HomepageSlider, HomepageSlide, TestimonialCarousel, TestimonialSlide
+from .models import Template, SiteProject, Page, Section, Field, BugReport, NavigationItem, HeroSlide, SiteTemplate, TemplateSection, QuoteRequest, SectionDraft, HomepageSlider, HomepageSlide, TestimonialCarousel, TestimonialSlide, BackgroundJob
 from tenant_dashboards.models import DashboardTemplate
 from .serializers import (
     TemplateSerializer,
@@ -21,6 +43,7 @@ from .serializers import (
     FieldSerializer,
     PageListSerializer,
     PageSnapshotSerializer,
+    PageDocumentSnapshotSerializer,
     BugReportSerializer,
     BugReportCreateSerializer,
     NavigationItemSerializer,
@@ -37,6 +60,11 @@ from .serializers import (
     TemplateSummarySerializer,
     PageSeoUpdateSerializer,
     SectionContentUpdateSerializer,
+    PageBatchSaveSerializer,
+    PageVersionConflict,
+    ReorderSerializer,
+    BackgroundJobSerializer,
+    LocaleDuplicateSerializer,
     SiteProjectPublicSerializer,
     QuoteRequestSerializer,
     AdminQuoteRequestSerializer,
@@ -55,10 +83,13 @@ def get_page_with_locale_fallback(queryset, project_id=None, slug=None, path=Non
     """
     Helper function to get a page with locale fallback logic.
     
-    When locale is provided:
-    1. First try to find the page for the requested locale
-    2. If not found, fall back to 'en' locale
-    3. If still not found, return None
+    When locale is provided, the page is resolved along the fallback chain
+    (see get_locale_fallback_chain):
+    1. The requested locale (e.g. 'pt-BR')
+    2. Its base language (e.g. 'pt')
+    3. The project's primary_locale
+    4. settings.SITES_FALLBACK_LOCALE ('en')
+    The whole chain is resolved in a single ordered query.
     
     Args:
         queryset: Base Page queryset to filter on
@@ -83,19 +114,41 @@ def get_page_with_locale_fallback(queryset, project_id=None, slug=None, path=Non
         # No locale specified, return first match
         return qs.first()
     
-    # Try requested locale first
-    page = qs.filter(locale=locale).first()
-    if page:
-        return page
-        
-    # Fall back to 'en' if requested locale not found and it's not already 'en'
-    if locale != 'en':
-        page = qs.filter(locale='en').first()
-        if page:
-            return page
-    
-    # No fallback found
-    return None
+    # [I18N] Best-ranked locale first, then regular page order
+    return annotate_locale_rank(qs, locale).order_by('locale_rank', 'order', 'id').first()
+
+
+def resolve_page_ids_with_locale_fallback(queryset, locale=None, slug=None, path=None):
+    """
+    Site-level counterpart of get_page_with_locale_fallback.
+
+    Resolves every page of the queryset (or only the one matching slug/path)
+    to the best available locale of the fallback chain in a single query,
+    one page per slug.
+
+    Returns:
+        List of Page ids in page order (empty if nothing matched)
+    """
+    qs = queryset
+    if slug:
+        qs = qs.filter(slug=slug)
+    if path:
+        qs = qs.filter(path=path)
+
+    if not locale:
+        return list(qs.order_by('order', 'id').values_list('id', flat=True))
+
+    best = {}
+    rows = annotate_locale_rank(qs, locale).order_by('order', 'id').values_list(
+        'id', 'project_id', 'slug', 'locale_rank'
+    )
+    for page_id, project_id, page_slug, rank in rows:
+        key = (project_id, page_slug)
+        current = best.get(key)
+        if current is None or rank < current[1]:
+            best[key] = (page_id, rank)
+
+    return [page_id for page_id, _ in best.values()]
 
 
 class TemplateViewSet(
@@ -152,6 +205,66 @@ class SiteProjectViewSet(viewsets.ModelViewSet):
             raise PermissionDenied("You do not own this project.")
         serializer.save()
 
+    def perform_destroy(self, instance):
+        # [PURGE] Hidden at once; pages, sections and media are purged by a job
+        from .purge import delete_project
+
+        if instance.owner and instance.owner != self.request.user:
+            raise PermissionDenied("You do not own this project.")
+        delete_project(instance, user=self.request.user)
+
+    # [I18N] Bulk copy of a whole locale (pages, sections, fields, hero slides, navigation)
+    @action(detail=True, methods=["post"], url_path="duplicate-locale")
+    def duplicate_locale(self, request, pk=None):
+        """
+        POST /api/projects/<id>/duplicate-locale/
+        Body: {"source_locale": "en", "target_locale": "nl", "mode": "skip" | "merge",
+               "pages": [1, 2] (optional), "include_navigation": true}
+        """
+        from .utils import duplicate_project_locale
+
+        project = self.get_object()
+        serializer = LocaleDuplicateSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        data = serializer.validated_data
+
+        counts = duplicate_project_locale(
+            project,
+            data["source_locale"],
+            data["target_locale"],
+            mode=data["mode"],
+            page_ids=data.get("pages"),
+            navigation=data["include_navigation"],
+        )
+        return Response({
+            "source_locale": data["source_locale"],
+            "target_locale": data["target_locale"],
+            "mode": data["mode"],
+            **counts,
+        })
+
+
+# [ORDER] Shared handler for the reorder actions below
+def reorder_response(request, queryset, scope_fields, on_change):
+    """
+    Apply the posted id sequence to its sibling group in ``queryset`` and
+    call ``on_change(first_row)`` to invalidate caches when rows moved
+    (bulk updates skip the model signals).
+    """
+    serializer = ReorderSerializer(data=request.data)
+    serializer.is_valid(raise_exception=True)
+    ids = serializer.validated_data["ids"]
+    try:
+        changes = reorder_group(queryset, ids, scope_fields)
+    except OrderingError as exc:
+        return Response({"error": str(exc)}, status=status.HTTP_400_BAD_REQUEST)
+    if changes:
+        on_change(queryset.model.objects.get(id=ids[0]))
+    return Response({
+        "updated": len(changes),
+        "changed": [{"id": row_id, "order": order} for row_id, order in changes.items()],
+    })
+
 
 class PageViewSet(
     mixins.ListModelMixin,
@@ -265,10 +378,37 @@ class PageViewSet(
         Returns the page plus its sections and fields in a single payload.
 
         Intended for the frontend page editor to hydrate all content in one call.
+        [DOCS] Sections and fields are read from the page's content document.
+
+        [CACHE] Sends ETag / Last-Modified derived from the project's content
+        version and answers 304 when the client's copy is still current.
         """
+        from .caching import content_version
+
         page = self.get_object()
-        serializer = PageSnapshotSerializer(page)
-        return Response(serializer.data)
+        stamp = page.project.content_updated_at
+        etag = make_etag(
+            "page-snapshot", page.pk,
+            content_version({"content_updated_at": stamp}),
+        )
+        return conditional_response(
+            request, etag, stamp,
+            lambda: Response(PageDocumentSnapshotSerializer(page).data),
+        )
+
+    @action(detail=True, methods=["post"], url_path="hero-slides/reorder")
+    def reorder_hero_slides(self, request, pk=None):
+        """
+        POST /api/pages/<id>/hero-slides/reorder/
+        Body: {"ids": [3, 1, 2]} — every hero slide of the page (active or not)
+        """
+        page = self.get_object()
+        return reorder_response(
+            request,
+            HeroSlide.objects.filter(page=page),
+            ("page",),
+            lambda slide: bump_content_version(pages__id=slide.page_id),
+        )
 
 
 class SectionViewSet(
@@ -314,6 +454,18 @@ class SectionViewSet(
             raise PermissionDenied("You do not own this section.")
         serializer.save()
 
+    @action(detail=False, methods=["post"])
+    def reorder(self, request):
+        """
+        POST /api/sections/reorder/
+        Body: {"ids": [12, 10, 11]} — every section of one page, in the new order
+        """
+        def on_change(section):
+            bump_content_version(pages__id=section.page_id)
+            rebuild_page_documents([section.page_id])
+
+        return reorder_response(request, self.get_queryset(), ("page",), on_change)
+
 
 class FieldViewSet(
     mixins.ListModelMixin,
@@ -406,6 +558,7 @@ class BugReportViewSet(
 
 
 class NavigationItemViewSet(
+    ConditionalGetMixin,
     mixins.ListModelMixin,
     mixins.RetrieveModelMixin,
     viewsets.GenericViewSet,
@@ -417,6 +570,9 @@ class NavigationItemViewSet(
     queryset = NavigationItem.objects.all().select_related("project", "page")
     serializer_class = NavigationItemSerializer
     permission_classes = [AllowAny]
+    # [CACHE] Linked page slugs/paths are rendered too; page edits bump the
+    # project's content version, so include it in the validators.
+    conditional_timestamp_fields = ("updated_at", "project__content_updated_at")
 
     def get_queryset(self):
         qs = super().get_queryset()
@@ -442,6 +598,75 @@ class NavigationItemViewSet(
 
         return qs.order_by("location", "locale", "column", "order", "id")
 
+    @action(detail=False, methods=["post"], permission_classes=[IsAuthenticated])
+    def reorder(self, request):
+        """
+        POST /api/navigation/reorder/
+        Body: {"ids": [5, 3, 4]} — every item sharing one project, location,
+        locale, column and parent, in the new order
+        """
+        return reorder_response(
+            request,
+            NavigationItem.objects.filter(project__owner=request.user),
+            ("project", "location", "locale", "column", "parent"),
+            lambda item: bump_content_version(id=item.project_id),
+        )
+
+    @action(detail=False, methods=["get"])
+    def tree(self, request):
+        """
+        Header and footer menus for one project as nested trees.
+
+        Query params:
+          - project (required): project id
+          - locale: falls back along the locale chain per location
+
+        [CACHE] Built in one query, cached per project/locale and
+        invalidated with the project's content version (navigation and page
+        changes). The version is returned in the body and as ETag.
+        """
+        from .caching import content_version, get_public_project_ref, get_public_site_entry
+        from .locales import normalize_locale
+        from .navigation import build_navigation_tree
+
+        project_id = request.query_params.get("project")
+        if not project_id:
+            return Response(
+                {"error": "The 'project' query parameter is required."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        try:
+            project_ref = get_public_project_ref(project_id=project_id)
+        except (ValueError, DjangoValidationError):
+            project_ref = None
+        if project_ref is None:
+            raise NotFound("Project not found.")
+
+        locale = normalize_locale(request.query_params.get("locale"), project_ref["primary_locale"])
+        version = content_version(project_ref)
+
+        def build_response():
+            tree, served_version = get_public_site_entry(
+                project_ref,
+                lambda: build_navigation_tree(project_ref["id"], locale),
+                variant=f"nav-tree|locale={locale or ''}",
+            )
+            response = Response({
+                "project": str(project_ref["id"]),
+                "requested_locale": locale,
+                "version": served_version,
+                **tree,
+            })
+            if served_version != version:
+                # Stale copy served while another worker rebuilds
+                response["ETag"] = make_etag("nav-tree", project_ref["id"], served_version, locale)
+            return response
+
+        etag = make_etag("nav-tree", project_ref["id"], version, locale)
+        return conditional_response(
+            request, etag, project_ref["content_updated_at"], build_response
+        )
+
 
 class PageListForUserView(generics.ListAPIView):
     """
@@ -1118,7 +1343,7 @@ class TemplateSectionFromSectionView(APIView):
         
         try:
             section = Section.objects.select_related(
-                "page__site__site_template"
+                "page__project__site_template"
             ).get(id=section_id)
         except Section.DoesNotExist:
             return Response(
@@ -1226,6 +1451,19 @@ class OnePageWebsiteOnboardingView(generics.CreateAPIView):
 
 # Template Builder Admin API Views
 
+# [JOBS] 202 response for operations handed to the background job worker
+def job_accepted_response(request, job, message):
+    return Response({
+        'success': True,
+        'message': message,
+        'job_id': str(job.id),
+        'status_url': request.build_absolute_uri(
+            reverse('background-job-detail', kwargs={'pk': job.id})
+        ),
+        'job': BackgroundJobSerializer(job).data,
+    }, status=status.HTTP_202_ACCEPTED)
+
+
 @api_view(['POST'])
 @permission_classes([permissions.IsAdminUser])
 def generate_template_skeleton(request, site_template_id):
@@ -1233,10 +1471,13 @@ def generate_template_skeleton(request, site_template_id):
     Admin-only endpoint to generate default skeleton for a SiteTemplate.
     
     POST /api/admin/templates/<site_template_id>/generate-skeleton/
+    
+    Queues a 'generate_skeleton' background job and returns 202 with the job
+    id; poll GET /api/jobs/<job_id>/ for progress and the result counts.
     """
     from .models import SiteTemplate
-    from .utils import ensure_template_skeleton
-    from .serializers import GenerateSkeletonSerializer, CloneProjectResponseSerializer
+    from .jobs import enqueue_job
+    from .serializers import GenerateSkeletonSerializer
     
     try:
         site_template = SiteTemplate.objects.get(id=site_template_id)
@@ -1250,36 +1491,14 @@ def generate_template_skeleton(request, site_template_id):
     if not serializer.is_valid():
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
     
-    try:
-        master_project = ensure_template_skeleton(site_template)
-        
-        # Count the generated content
-        pages_count = master_project.pages.count()
-        sections_count = sum(page.sections.count() for page in master_project.pages.all())
-        fields_count = sum(
-            section.fields.count() 
-            for page in master_project.pages.all() 
-            for section in page.sections.all()
-        )
-        
-        response_data = {
-            'success': True,
-            'message': f'Generated skeleton for template "{site_template.name}"',
-            'new_project_id': master_project.id,
-            'new_project_name': master_project.name,
-            'pages_cloned': pages_count,
-            'sections_cloned': sections_count,
-            'fields_cloned': fields_count,
-        }
-        
-        response_serializer = CloneProjectResponseSerializer(response_data)
-        return Response(response_serializer.data, status=status.HTTP_200_OK)
-        
-    except Exception as e:
-        return Response({
-            'success': False,
-            'message': f'Error generating skeleton: {str(e)}'
-        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+    job = enqueue_job(
+        'generate_skeleton',
+        {'site_template_id': site_template.id},
+        user=request.user,
+    )
+    return job_accepted_response(
+        request, job, f'Queued skeleton generation for template "{site_template.name}"'
+    )
 
 
 @api_view(['POST'])
@@ -1295,10 +1514,13 @@ def clone_project(request, project_id):
         "slug": "new-project-slug",         // optional
         "locales": ["en", "pt"]             // optional
     }
+    
+    Queues a 'clone_project' background job and returns 202 with the job id;
+    poll GET /api/jobs/<job_id>/ for progress and the result counts.
     """
     from .models import SiteProject
-    from .utils import clone_project_structure
-    from .serializers import CloneProjectSerializer, CloneProjectResponseSerializer
+    from .jobs import enqueue_job
+    from .serializers import CloneProjectSerializer
     from django.contrib.auth.models import User
     
     try:
@@ -1313,59 +1535,49 @@ def clone_project(request, project_id):
     if not serializer.is_valid():
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
     
-    try:
-        # Get validated data
-        owner_email = serializer.validated_data.get('owner_email')
-        name = serializer.validated_data.get('name')
-        slug = serializer.validated_data.get('slug')
-        locales = serializer.validated_data.get('locales')
-        
-        # Get owner if email provided
-        owner = None
-        if owner_email:
-            owner = User.objects.get(email=owner_email)
-        
-        # Clone the project
-        new_project = clone_project_structure(
-            source_project,
-            owner=owner,
-            name=name,
-            slug=slug,
-            locales=locales
-        )
-        
-        # Count the cloned content
-        pages_count = new_project.pages.count()
-        sections_count = sum(page.sections.count() for page in new_project.pages.all())
-        fields_count = sum(
-            section.fields.count() 
-            for page in new_project.pages.all() 
-            for section in page.sections.all()
-        )
-        
-        response_data = {
-            'success': True,
-            'message': f'Successfully cloned project "{source_project.name}" to "{new_project.name}"',
-            'new_project_id': new_project.id,
-            'new_project_name': new_project.name,
-            'pages_cloned': pages_count,
-            'sections_cloned': sections_count,
-            'fields_cloned': fields_count,
-        }
-        
-        response_serializer = CloneProjectResponseSerializer(response_data)
-        return Response(response_serializer.data, status=status.HTTP_201_CREATED)
-        
-    except User.DoesNotExist:
-        return Response({
-            'success': False,
-            'message': 'Owner email not found.'
-        }, status=status.HTTP_400_BAD_REQUEST)
-    except Exception as e:
-        return Response({
-            'success': False,
-            'message': f'Error cloning project: {str(e)}'
-        }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+    # Get validated data
+    owner_email = serializer.validated_data.get('owner_email')
+    owner_id = None
+    if owner_email:
+        owner_id = User.objects.filter(email=owner_email).values_list('id', flat=True).first()
+        if owner_id is None:
+            return Response({
+                'success': False,
+                'message': 'Owner email not found.'
+            }, status=status.HTTP_400_BAD_REQUEST)
+    
+    job = enqueue_job(
+        'clone_project',
+        {
+            'source_project_id': str(source_project.id),
+            'owner_id': owner_id,
+            'name': serializer.validated_data.get('name'),
+            'slug': serializer.validated_data.get('slug'),
+            'locales': serializer.validated_data.get('locales'),
+        },
+        user=request.user,
+    )
+    return job_accepted_response(
+        request, job, f'Queued clone of project "{source_project.name}"'
+    )
+
+
+# [JOBS] Background job status
+class BackgroundJobDetailView(generics.RetrieveAPIView):
+    """
+    Status, progress counters and result of a background job.
+    
+    GET /api/jobs/<job_id>/
+    Staff can read every job; other users only the jobs they queued.
+    """
+    serializer_class = BackgroundJobSerializer
+    permission_classes = [IsAuthenticated]
+
+    def get_queryset(self):
+        qs = BackgroundJob.objects.all()
+        if not self.request.user.is_staff:
+            qs = qs.filter(created_by=self.request.user)
+        return qs
 
 
 @api_view(['POST'])
@@ -1677,11 +1889,24 @@ class SiteProjectPublicView(generics.RetrieveAPIView):
     Public read-only API for tenant sites.
     Returns project info, pages, sections, and fields by slug.
     No authentication required.
+
+    Optional query params:
+      - locale: only return pages in this locale. The locale is first
+        normalized (sites/locales.normalize_locale: 'pt-BR' -> 'pt', unknown
+        codes -> the project's primary locale); pages without a translation
+        fall back page by page along the chain locale -> base language ->
+        project primary_locale -> settings.SITES_FALLBACK_LOCALE
+      - path / slug: only return the single matching published page,
+        resolved with the project's route table (sites/routing.py)
+
+    [CACHE] The serialized payload is cached per project and rebuilt lazily
+    after any content change (see sites/caching.py). Responses carry ETag /
+    Last-Modified and conditional requests get 304 Not Modified.
     """
     serializer_class = SiteProjectPublicSerializer
     permission_classes = [AllowAny]
     lookup_field = 'slug'
-    
+
     def get_queryset(self):
         """
         Only return active projects with their pages, sections, and fields.
@@ -1692,6 +1917,177 @@ class SiteProjectPublicView(generics.RetrieveAPIView):
             'pages__sections__fields'
         ).select_related('site_template')
 
+    def retrieve(self, request, *args, **kwargs):
+        from .caching import content_version, get_public_project_ref, get_public_site_entry
+        from .locales import normalize_locale
+
+        project_ref = get_public_project_ref(slug=kwargs[self.lookup_field])
+        if project_ref is None:
+            raise NotFound("Site not found.")
+
+        locale = normalize_locale(request.query_params.get("locale"), project_ref["primary_locale"])
+        path = request.query_params.get("path") or None
+        page_slug = request.query_params.get("slug") or None
+
+        # [CACHE] Variants are keyed on normalized inputs only (a supported
+        # locale, a page id from the route table), so arbitrary query
+        # strings cannot fill the cache; unknown pages 404 before it.
+        page_id = None
+        variant = f"locale={locale}" if locale else ""
+        if path or page_slug:
+            page_id = self._resolve_page_id(kwargs[self.lookup_field], locale, path, page_slug)
+            if page_id is None:
+                raise NotFound("Page not found.")
+            variant = f"page={page_id}"
+
+        version = content_version(project_ref)
+
+        def build_response():
+            data, served_version = get_public_site_entry(
+                project_ref,
+                lambda: self._build_payload(project_ref["id"], locale, page_id),
+                variant=variant,
+            )
+            if data is None:
+                raise NotFound("Site not found.")
+            response = Response(data)
+            if served_version != version:
+                # Stale copy served while another worker rebuilds
+                response["ETag"] = make_etag("public-site", project_ref["id"], served_version, variant)
+            return response
+
+        # [CACHE] Validators come from the content version alone, so an
+        # unchanged site is answered with 304 before touching the cache.
+        etag = make_etag("public-site", project_ref["id"], version, variant)
+        return conditional_response(
+            request, etag, project_ref["content_updated_at"], build_response
+        )
+
+    def _resolve_page_id(self, project_slug, locale, path, page_slug):
+        """
+        Resolve ?path= / ?slug= to a published page id with the project's
+        route table (canonical paths, aliases, locale prefixes and the
+        locale fallback chain). Returns None when nothing matches.
+        """
+        from .routing import get_route_table
+
+        table = get_route_table(project_slug)
+        if table is None:
+            return None
+        if path:
+            match = table.resolve(path, locale)
+            if match is None or (page_slug and match.get("slug", page_slug) != page_slug):
+                return None
+        else:
+            match = table.resolve_slug(page_slug, locale)
+        return match["page"] if match is not None else None
+
+    def _build_payload(self, project_id, locale, page_id):
+        """
+        Serialize the project restricted to the requested locale or to a
+        single page.
+        """
+        page_ids = None
+        if page_id is not None:
+            page_ids = [page_id]
+        elif locale:
+            page_ids = resolve_page_ids_with_locale_fallback(
+                Page.objects.filter(project_id=project_id), locale=locale
+            )
+
+        # [PERF] Flat values() tree instead of nested serializers; the output
+        # matches SiteProjectPublicSerializer exactly.
+        return build_public_site(project_id, page_ids)
+
+
+# [BOOTSTRAP] Single-request site bootstrap
+class SiteBootstrapView(APIView):
+    """
+    Everything needed to render one tenant page in a single response:
+    project info and theme, nested header/footer navigation, the resolved
+    page (sections, fields, SEO, hero slides) and the project's active
+    homepage sliders and testimonial carousels.
+
+    Query params:
+      - path: page path to resolve with the route table (default '/')
+      - locale: requested locale, resolved along the fallback chain
+
+    [CACHE] Cached per project/page/locale under the project's content
+    version, with ETag / Last-Modified for conditional requests.
+    """
+    permission_classes = [AllowAny]
+
+    def get(self, request, slug):
+        from .bootstrap import build_site_bootstrap
+        from .caching import content_version, get_public_project_ref, get_public_site_entry
+        from .locales import normalize_locale
+        from .routing import get_route_table
+
+        project_ref = get_public_project_ref(slug=slug)
+        if project_ref is None:
+            raise NotFound("Site not found.")
+
+        locale = normalize_locale(request.query_params.get("locale"), project_ref["primary_locale"])
+        # [CACHE] Keyed on the page the route table resolves, so unknown
+        # paths share one page-less variant
+        table = get_route_table(slug)
+        match = table.resolve(request.query_params.get("path") or "/", locale) if table else None
+        page_id = match["page"] if match is not None else None
+        variant = f"bootstrap|page={page_id or ''}|locale={locale or ''}"
+
+        version = content_version(project_ref)
+
+        def build_response():
+            data, served_version = get_public_site_entry(
+                project_ref,
+                lambda: build_site_bootstrap(project_ref["id"], None, locale, page_id=page_id),
+                variant=variant,
+            )
+            if data is None:
+                raise NotFound("Site not found.")
+            response = Response(data)
+            if served_version != version:
+                # Stale copy served while another worker rebuilds
+                response["ETag"] = make_etag("site-bootstrap", project_ref["id"], served_version, variant)
+            return response
+
+        etag = make_etag("site-bootstrap", project_ref["id"], version, variant)
+        return conditional_response(
+            request, etag, project_ref["content_updated_at"], build_response
+        )
+
+
+# [ROUTES] Public URL -> page resolution
+class SiteRouteResolveView(APIView):
+    """
+    Resolve a public URL of a tenant site against its compiled route table
+    (sites/routing.py) without a database query in the steady state.
+
+    Query params:
+      - path: URL path, optionally locale-prefixed (e.g. '/pt/sobre')
+      - locale: locale for unprefixed paths (defaults to the primary locale)
+
+    Returns {"type": "page", ...} or {"type": "redirect", "location", ...};
+    404 when nothing matches.
+    """
+    permission_classes = [AllowAny]
+
+    def get(self, request, slug):
+        from .routing import get_route_table
+
+        table = get_route_table(slug)
+        if table is None:
+            raise NotFound("Site not found.")
+
+        locale = (request.query_params.get("locale") or "").strip() or None
+        match = table.resolve(request.query_params.get("path") or "/", locale)
+        if match is None:
+            return Response(
+                {"type": "not_found", "detail": "No page matches this path."},
+                status=status.HTTP_404_NOT_FOUND,
+            )
+        return Response(match)
+
 
 # [SEO] Permission class for SEO operations
 class IsProjectOwnerOrStaff(permissions.BasePermission):
@@ -1763,6 +2159,34 @@ class SectionContentUpdateView(generics.UpdateAPIView):
         return section
 
 
+# [EDITOR] Page batch save
+class PageBatchSaveView(generics.GenericAPIView):
+    """
+    Apply a whole editor save to a page in one transaction (field values,
+    section order, added/removed sections, SEO). Returns 409 with the
+    current page version when the page changed since the client loaded it.
+    """
+    queryset = Page.objects.select_related("project")
+    serializer_class = PageBatchSaveSerializer
+    permission_classes = [IsAuthenticated, IsProjectOwnerOrStaff]
+
+    def post(self, request, *args, **kwargs):
+        page = self.get_object()
+        serializer = self.get_serializer(page, data=request.data)
+        try:
+            serializer.is_valid(raise_exception=True)
+            serializer.save()
+        except PageVersionConflict as exc:
+            return Response(
+                {
+                    "error": "This page was changed by someone else. Reload it and apply your edits again.",
+                    "current_version": exc.current_version,
+                },
+                status=status.HTTP_409_CONFLICT,
+            )
+        return Response(serializer.data)
+
+
 # [ADMIN]
 class AdminSiteProjectListView(generics.ListAPIView):
     """
@@ -2021,6 +2445,7 @@ class SectionAISuggestView(APIView):
     AI suggestion endpoint for section content.
     POST /api/builder/sections/<section_id>/ai-suggest/
     Provides smart content suggestions based on business context.
+    Pass refresh=true to bypass the suggestion cache.
     """
     permission_classes = [IsAuthenticated]
     authentication_classes = [
@@ -2029,9 +2454,6 @@ class SectionAISuggestView(APIView):
     ]
 
     def post(self, request, section_id):
-        from django.conf import settings
-        import json
-        
         try:
             # Get section and verify ownership
             section = Section.objects.select_related(
@@ -2049,73 +2471,37 @@ class SectionAISuggestView(APIView):
             locale = request.data.get('locale', 'en')
             tone = request.data.get('tone', 'friendly and professional')
             extra_instructions = request.data.get('extra_instructions', '')
+            # [AI-SUGGEST] refresh=true skips the cached suggestion
+            refresh = request.data.get('refresh', request.query_params.get('refresh', False))
+            refresh = str(refresh).lower() in ('1', 'true', 'yes')
             
-            # Gather business context
-            project = section.page.project
-            business_name = project.name
-            industry = getattr(project, 'business_type', None) or 'local business'
-            
-            # Get existing field keys for this section
-            fields = section.fields.all().values_list('key', 'label')
-            field_list = []
-            for key, label in fields:
-                field_list.append(f'"{key}": {label or key}')
-            field_context = ', '.join(field_list)
-            
-            # Check OpenAI API key
-            if not settings.OPENAI_API_KEY:
-                return Response(
-                    {"error": "AI suggestion service is not configured"},
-                    status=status.HTTP_503_SERVICE_UNAVAILABLE
-                )
-            
-            # Call OpenAI
+            # [AI-SUGGEST] Cached per normalized prompt; identical requests
+            # in flight share one model call
             try:
-                from openai import OpenAI
-                client = OpenAI(api_key=settings.OPENAI_API_KEY)
-                
-                system_prompt = """You are an assistant that writes website copy for small businesses.
-You must return a JSON object with keys that match the section field keys.
-Do not include any extra keys or explanations – only the JSON.
-Keep content concise and professional."""
-
-                user_prompt = f"""Business name: {business_name}
-Industry: {industry}
-Language: {locale}
-Section type: {section.identifier}
-
-Fields needed: {field_context}
-Tone: {tone}
-{f"Special instructions: {extra_instructions}" if extra_instructions else ""}
-
-Write short, clear copy for this section. 
-Keep it realistic for a small business website.
-Return JSON with only the field keys that exist in this section."""
-
-                response = client.chat.completions.create(
-                    model="gpt-4o-mini",
-                    messages=[
-                        {"role": "system", "content": system_prompt},
-                        {"role": "user", "content": user_prompt},
-                    ],
-                    response_format={"type": "json_object"},
+                suggestions, cached = suggest_section_content(
+                    section,
+                    locale=locale,
+                    tone=tone,
+                    extra_instructions=extra_instructions,
+                    refresh=refresh,
                 )
                 
-                # Parse AI response
-                ai_content = response.choices[0].message.content
-                suggested_data = json.loads(ai_content)
-                
-                # Filter to only include valid field keys
-                valid_keys = set(key for key, _ in fields)
-                filtered_suggestions = {
-                    k: v for k, v in suggested_data.items() 
-                    if k in valid_keys
-                }
-                
                 return Response({
-                    "suggested": filtered_suggestions
+                    "suggested": suggestions,
+                    "cached": cached,
                 })
                 
+            except AIConfigurationError:
+                return Response(
+                    {"error": "AI suggestion service is not configured"},
+                    status=status.HTTP_503_SERVICE_UNAVAILABLE
+                )
+            except AIBusyError as busy_error:
+                return Response(
+                    {"error": str(busy_error)},
+                    status=status.HTTP_503_SERVICE_UNAVAILABLE,
+                    headers={"Retry-After": "5"}
+                )
             except Exception as ai_error:
                 return Response(
                     {"error": f"AI service error: {str(ai_error)}"},
@@ -2174,137 +2560,157 @@ class SectionDraftProcessView(APIView):
     
     Process an uploaded screenshot with AI to extract sections and generate content.
     Step 2: AI analysis to convert screenshot → structured section data.
+    
+    [AI-DRAFTS] The analysis runs in the job worker; this returns 202 with
+    the draft id. Poll GET /api/sections/drafts/{draft_id}/ (``status_url``)
+    until the status is ready/error.
     """
     permission_classes = [IsAuthenticated]
 
     def post(self, request, draft_id):
         try:
             # Get the section draft
-            section_draft = SectionDraft.objects.get(id=draft_id)
-            
-            # Check permissions
-            if not request.user.is_staff and section_draft.project.owner != request.user:
-                return Response(
-                    {"error": "Permission denied."},
-                    status=status.HTTP_403_FORBIDDEN
-                )
-            
-            # Check if already processing
-            if section_draft.status == 'processing':
-                return Response(
-                    {"message": "Draft is already being processed."},
-                    status=status.HTTP_202_ACCEPTED
-                )
-            
-            # Check OpenAI API key
-            if not settings.OPENAI_API_KEY:
-                return Response(
-                    {"error": "AI processing service is not configured."},
-                    status=status.HTTP_503_SERVICE_UNAVAILABLE
-                )
-            
-            # Update status to processing
-            section_draft.status = 'processing'
-            section_draft.save()
-            
-            try:
-                # Process with OpenAI Vision API
-                import base64
-                from openai import OpenAI
-                
-                client = OpenAI(api_key=settings.OPENAI_API_KEY)
-                
-                # Read and encode the image
-                with section_draft.image.open('rb') as image_file:
-                    image_data = base64.b64encode(image_file.read()).decode('utf-8')
-                
-                # Create the AI prompt
-                system_prompt = """You are an expert web designer that analyzes website screenshots and extracts section information.
-
-                Analyze the provided screenshot and identify distinct website sections (header, hero, about, services, contact, etc.).
-                
-                Return a JSON object with this structure:
-                {
-                    "sections": [
-                        {
-                            "type": "hero",
-                            "title": "Main heading text",
-                            "content": "Body text content",
-                            "image_url": "URL if there's an image",
-                            "cta_text": "Call to action text if present",
-                            "cta_url": "Call to action URL if present"
-                        },
-                        {
-                            "type": "about",
-                            "title": "About section heading", 
-                            "content": "About section text content"
-                        }
-                    ],
-                    "overall_theme": "modern/classic/minimal/etc",
-                    "color_scheme": "blue/green/red/etc",
-                    "business_type": "restaurant/services/ecommerce/etc"
-                }
-
-                Extract all visible text accurately. Identify section types like: hero, about, services, menu, contact, footer, testimonials, gallery, etc."""
-
-                user_prompt = f"""Analyze this website screenshot and extract all visible sections with their content.
-                
-                Project context: {section_draft.project.name}
-                Locale: {section_draft.locale or 'en'}
-                
-                Please provide accurate extraction of all text, headings, and identify the section types clearly."""
-
-                response = client.chat.completions.create(
-                    model="gpt-4o",  # Use the vision model
-                    messages=[
-                        {
-                            "role": "system",
-                            "content": system_prompt
-                        },
-                        {
-                            "role": "user", 
-                            "content": [
-                                {"type": "text", "text": user_prompt},
-                                {
-                                    "type": "image_url",
-                                    "image_url": {
-                                        "url": f"data:image/jpeg;base64,{image_data}"
-                                    }
-                                }
-                            ]
-                        }
-                    ],
-                    response_format={"type": "json_object"},
-                )
-                
-                # Parse AI response
-                ai_content = response.choices[0].message.content
-                ai_data = json.loads(ai_content)
-                
-                # Store the AI output
-                section_draft.ai_output_json = ai_data
-                section_draft.status = 'ready'
-                section_draft.save()
-                
-                # Return the processed data
-                response_serializer = SectionDraftSerializer(section_draft, context={'request': request})
-                return Response(response_serializer.data, status=status.HTTP_200_OK)
-                
-            except Exception as e:
-                # Mark as error and return details
-                section_draft.status = 'error'
-                section_draft.save()
-                
-                return Response(
-                    {"error": f"AI processing failed: {str(e)}"},
-                    status=status.HTTP_500_INTERNAL_SERVER_ERROR
-                )
-                
+            section_draft = SectionDraft.objects.select_related('project', 'job').get(id=draft_id)
         except SectionDraft.DoesNotExist:
             return Response(
                 {"error": "Section draft not found."},
                 status=status.HTTP_404_NOT_FOUND
             )
+        
+        # Check permissions
+        if not request.user.is_staff and section_draft.project.owner != request.user:
+            return Response(
+                {"error": "Permission denied."},
+                status=status.HTTP_403_FORBIDDEN
+            )
+        
+        # [AI-CACHE] Same screenshot analyzed before: answer right away
+        if section_draft.status != 'processing' and apply_cached_analysis(section_draft):
+            return section_draft_accepted_response(
+                request, section_draft, "Screenshot was analyzed before; reused the result.",
+                status_code=status.HTTP_200_OK,
+            )
+        
+        # [AI-PROVIDER] Check the shared AI provider
+        if not is_ai_configured():
+            return Response(
+                {"error": "AI processing service is not configured."},
+                status=status.HTTP_503_SERVICE_UNAVAILABLE
+            )
+        
+        # Already processing: report the running attempt (or retry a stuck one)
+        if section_draft.status == 'processing':
+            recover_stuck_draft(section_draft)
+            message = "Draft is already being processed."
+        else:
+            queue_section_draft(section_draft, user=request.user)
+            message = "Screenshot queued for AI processing."
+        
+        section_draft.refresh_from_db()
+        return section_draft_accepted_response(request, section_draft, message)
+
+
+def section_draft_accepted_response(request, section_draft, message, status_code=status.HTTP_202_ACCEPTED):
+    urls = {
+        'status_url': reverse('section-draft-detail', kwargs={'draft_id': section_draft.id}),
+        'events_url': reverse('section-draft-events', kwargs={'draft_id': section_draft.id}),
+    }
+    return Response({
+        'success': True,
+        'message': message,
+        'draft_id': str(section_draft.id),
+        'job_id': str(section_draft.job_id) if section_draft.job_id else None,
+        **{key: request.build_absolute_uri(url) for key, url in urls.items()},
+        **draft_status_payload(section_draft),
+    }, status=status_code)
+
+
+class SectionDraftAccessMixin:
+    """Drafts are visible to staff and to the owner of their project."""
+
+    def get_section_draft(self, request, draft_id):
+        try:
+            section_draft = SectionDraft.objects.select_related('project', 'job').get(id=draft_id)
+        except SectionDraft.DoesNotExist:
+            raise NotFound("Section draft not found.")
+        if not request.user.is_staff and section_draft.project.owner != request.user:
+            raise PermissionDenied("Permission denied.")
+        return section_draft
+
+
+class SectionDraftDetailView(SectionDraftAccessMixin, APIView):
+    """
+    GET /api/sections/drafts/{draft_id}/
+    
+    [AI-DRAFTS] Draft with its processing status, attempts, error and job
+    progress. Stuck attempts are retried (or failed) when they are read.
+    """
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request, draft_id):
+        section_draft = self.get_section_draft(request, draft_id)
+        recover_stuck_draft(section_draft)
+        data = SectionDraftSerializer(section_draft, context={'request': request}).data
+        data['progress'] = draft_status_payload(section_draft)['progress']
+        return Response(data)
+
+
+class EventStreamRenderer(BaseRenderer):
+    """Lets EventSource clients (Accept: text/event-stream) pass negotiation."""
+    media_type = 'text/event-stream'
+    format = 'event-stream'
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        # Only error responses are rendered; the stream bypasses renderers
+        return json.dumps(data).encode('utf-8')
+
+
+class SectionDraftEventsView(SectionDraftAccessMixin, APIView):
+    """
+    GET /api/sections/drafts/{draft_id}/events/
+    
+    [AI-DRAFTS] Server-sent events: a ``status`` event whenever the draft's
+    status or progress changes, then ``end`` once it is ready or failed.
+    
+    Polling the detail endpoint is the supported way to follow a draft.
+    Under WSGI every open stream holds a worker thread, so the stream
+    closes after SITES_DRAFT_EVENTS_TIMEOUT seconds (5 by default) and
+    tells EventSource to wait ``reconnect_delay`` seconds before it comes
+    back. Raise the timeout only when serving this view from an ASGI
+    server.
+    """
+    permission_classes = [IsAuthenticated]
+    renderer_classes = [JSONRenderer, EventStreamRenderer]
+    poll_interval = 1.0
+    reconnect_delay = 10
+
+    def get(self, request, draft_id):
+        section_draft = self.get_section_draft(request, draft_id)
+        # Once per connection, not on every poll of the stream
+        recover_stuck_draft(section_draft)
+        response = StreamingHttpResponse(
+            self.stream(section_draft.pk), content_type='text/event-stream'
+        )
+        response['Cache-Control'] = 'no-cache'
+        response['X-Accel-Buffering'] = 'no'  # Disable proxy buffering
+        return response
+
+    def stream(self, draft_id):
+        deadline = time.monotonic() + get_draft_events_timeout()
+        last_payload = None
+        yield f"retry: {self.reconnect_delay * 1000}\n\n"
+        while True:
+            section_draft = SectionDraft.objects.select_related('job').get(pk=draft_id)
+            payload = draft_status_payload(section_draft)
+            if payload != last_payload:
+                yield f"event: status\ndata: {json.dumps(payload)}\n\n"
+                last_payload = payload
+            if section_draft.status in DRAFT_FINISHED_STATUSES:
+                yield f"event: end\ndata: {json.dumps({'status': section_draft.status})}\n\n"
+                return
+            if time.monotonic() >= deadline:
+                return
+            time.sleep(self.poll_interval)
 
 
 class SectionDraftCreateSectionView(APIView):
@@ -2362,152 +2768,8 @@ class SectionDraftCreateSectionView(APIView):
                     status=status.HTTP_400_BAD_REQUEST
                 )
             
-            created_sections = []
-            
-            # Get the current max order for sections in this page
-            max_order = page.sections.aggregate(models.Max('order'))['order__max'] or 0
-            
-            # Create sections from AI data
-            for i, section_data in enumerate(sections_data):
-                section_type = section_data.get('type', 'content')
-                section_title = section_data.get('title', f'AI Section {i + 1}')
-                
-                # Generate unique identifier
-                base_identifier = f"ai-{section_type}-{i + 1}"
-                identifier = base_identifier
-                counter = 1
-                
-                # Ensure unique identifier within the page
-                while page.sections.filter(identifier=identifier).exists():
-                    identifier = f"{base_identifier}-{counter}"
-                    counter += 1
-                
-                # Create the section
-                section = Section.objects.create(
-                    page=page,
-                    identifier=identifier,
-                    internal_name=section_title,
-                    order=max_order + i + 1
-                )
-                
-                # Create fields from section data
-                field_order = 0
-                
-                # Title field (most sections have this)
-                if section_data.get('title'):
-                    Field.objects.create(
-                        section=section,
-                        key='title',
-                        label='Title',
-                        value=section_data['title'],
-                        order=field_order
-                    )
-                    field_order += 1
-                
-                # Content field
-                if section_data.get('content'):
-                    Field.objects.create(
-                        section=section,
-                        key='content',
-                        label='Content',
-                        value=section_data['content'],
-                        order=field_order
-                    )
-                    field_order += 1
-                
-                # Image URL field
-                if section_data.get('image_url'):
-                    Field.objects.create(
-                        section=section,
-                        key='image_url',
-                        label='Image URL',
-                        value=section_data['image_url'],
-                        order=field_order
-                    )
-                    field_order += 1
-                
-                # CTA text field
-                if section_data.get('cta_text'):
-                    Field.objects.create(
-                        section=section,
-                        key='cta_text',
-                        label='Call to Action Text',
-                        value=section_data['cta_text'],
-                        order=field_order
-                    )
-                    field_order += 1
-                
-                # CTA URL field
-                if section_data.get('cta_url'):
-                    Field.objects.create(
-                        section=section,
-                        key='cta_url',
-                        label='Call to Action URL',
-                        value=section_data['cta_url'],
-                        order=field_order
-                    )
-                    field_order += 1
-                
-                # Section type field for frontend rendering
-                Field.objects.create(
-                    section=section,
-                    key='section_type',
-                    label='Section Type',
-                    value=section_type,
-                    order=field_order
-                )
-                
-                created_sections.append({
-                    'id': section.id,
-                    'identifier': section.identifier,
-                    'internal_name': section.internal_name,
-                    'fields_count': section.fields.count()
-                })
-            
-            # Store business type and theme as page-level fields if available
-            if ai_data.get('business_type') or ai_data.get('overall_theme') or ai_data.get('color_scheme'):
-                # Find or create a metadata section for this page
-                metadata_section, created = Section.objects.get_or_create(
-                    page=page,
-                    identifier='ai-metadata',
-                    defaults={
-                        'internal_name': 'AI Metadata',
-                        'order': 0  # Put metadata at the top
-                    }
-                )
-                
-                if ai_data.get('business_type'):
-                    Field.objects.update_or_create(
-                        section=metadata_section,
-                        key='business_type',
-                        defaults={
-                            'label': 'Business Type',
-                            'value': ai_data['business_type'],
-                            'order': 0
-                        }
-                    )
-                
-                if ai_data.get('overall_theme'):
-                    Field.objects.update_or_create(
-                        section=metadata_section,
-                        key='overall_theme',
-                        defaults={
-                            'label': 'Overall Theme',
-                            'value': ai_data['overall_theme'],
-                            'order': 1
-                        }
-                    )
-                
-                if ai_data.get('color_scheme'):
-                    Field.objects.update_or_create(
-                        section=metadata_section,
-                        key='color_scheme',
-                        defaults={
-                            'label': 'Color Scheme',
-                            'value': ai_data['color_scheme'],
-                            'order': 2
-                        }
-                    )
+            # One transaction with bulk inserts; nothing is left behind on failure
+            created_sections = materialize_section_draft(page, ai_data)
             
             return Response({
                 'success': True,
@@ -2530,7 +2792,7 @@ class SectionDraftCreateSectionView(APIView):
 
 
 # [SLIDERS] Homepage Slider API Views
-class HomepageSliderViewSet(viewsets.ModelViewSet):
+class HomepageSliderViewSet(ConditionalGetMixin, viewsets.ModelViewSet):
     """
     ViewSet for managing homepage sliders.
     GET: List/retrieve sliders (public)
@@ -2538,6 +2800,9 @@ class HomepageSliderViewSet(viewsets.ModelViewSet):
     """
     serializer_class = HomepageSliderSerializer
     lookup_field = 'slug'
+    # [CACHE] Conditional GET covers the slider and its slides
+    conditional_timestamp_fields = ('updated_at', 'slides__updated_at')
+    conditional_count_fields = ('pk', 'slides')
     
     def get_serializer_class(self):
         if self.action == 'list':
@@ -2591,12 +2856,14 @@ class HomepageSliderViewSet(viewsets.ModelViewSet):
         instance.delete()
 
 
-class HomepageSlideViewSet(viewsets.ModelViewSet):
+class HomepageSlideViewSet(ConditionalGetMixin, viewsets.ModelViewSet):
     """
     ViewSet for managing individual homepage slides.
     Admin-only access for create/update/delete.
     """
     serializer_class = HomepageSlideSerializer
+    # [CACHE] Visibility also depends on the parent slider being active
+    conditional_timestamp_fields = ('updated_at', 'slider__updated_at')
     
     def get_queryset(self):
         queryset = HomepageSlide.objects.select_related('slider').order_by('order', 'id')
@@ -2641,14 +2908,32 @@ class HomepageSlideViewSet(viewsets.ModelViewSet):
             raise PermissionDenied("Only staff can delete slides.")
         instance.delete()
 
+    @action(detail=False, methods=["post"])
+    def reorder(self, request):
+        """
+        POST /api/homepage-slides/reorder/
+        Body: {"ids": [...]} — every slide of one slider, in the new order
+        """
+        if not request.user.is_staff:
+            raise PermissionDenied("Only staff can reorder slides.")
+        return reorder_response(
+            request,
+            HomepageSlide.objects.all(),
+            ("slider",),
+            lambda slide: bump_content_version(homepage_sliders__id=slide.slider_id),
+        )
+
 
 # [TESTIMONIALS] Testimonial Carousel API Views
-class TestimonialCarouselViewSet(viewsets.ModelViewSet):
+class TestimonialCarouselViewSet(ConditionalGetMixin, viewsets.ModelViewSet):
     """
     ViewSet for managing testimonial carousels.
     """
     serializer_class = TestimonialCarouselSerializer
     lookup_field = 'slug'
+    # [CACHE] Conditional GET covers the carousel and its testimonials
+    conditional_timestamp_fields = ('updated_at', 'testimonials__updated_at')
+    conditional_count_fields = ('pk', 'testimonials')
     
     def get_queryset(self):
         queryset = TestimonialCarousel.objects.prefetch_related('testimonials').order_by('-created_at')
@@ -2676,11 +2961,13 @@ class TestimonialCarouselViewSet(viewsets.ModelViewSet):
         return [permission() for permission in permission_classes]
 
 
-class TestimonialSlideViewSet(viewsets.ModelViewSet):
+class TestimonialSlideViewSet(ConditionalGetMixin, viewsets.ModelViewSet):
     """
     ViewSet for managing individual testimonials.
     """
     serializer_class = TestimonialSlideSerializer
+    # [CACHE] Visibility also depends on the parent carousel being active
+    conditional_timestamp_fields = ('updated_at', 'carousel__updated_at')
     
     def get_queryset(self):
         queryset = TestimonialSlide.objects.select_related('carousel').order_by('order', 'id')
@@ -2706,3 +2993,18 @@ class TestimonialSlideViewSet(viewsets.ModelViewSet):
             permission_classes = [IsAuthenticated]
         
         return [permission() for permission in permission_classes]
+
+    @action(detail=False, methods=["post"])
+    def reorder(self, request):
+        """
+        POST /api/testimonial-slides/reorder/
+        Body: {"ids": [...]} — every testimonial of one carousel, in the new order
+        """
+        if not request.user.is_staff:
+            raise PermissionDenied("Only staff can reorder testimonials.")
+        return reorder_response(
+            request,
+            TestimonialSlide.objects.all(),
+            ("carousel",),
+            lambda slide: bump_content_version(testimonial_carousels__id=slide.carousel_id),
+        )
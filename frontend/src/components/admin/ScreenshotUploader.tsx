@@ -23,6 +23,7 @@ interface SectionDraft {
   image_url: string;
   project: string;
   status: 'pending' | 'processing' | 'ready' | 'error';
+  error_message?: string;
   section_name: string;
   locale: string;
   created_at: string;
@@ -41,6 +42,10 @@ interface SectionDraft {
   };
 }
 
+// Screenshot analysis runs in the background job worker
+const DRAFT_POLL_INTERVAL_MS = 2000;
+const DRAFT_POLL_TIMEOUT_MS = 5 * 60 * 1000;
+
 interface ScreenshotUploaderProps {
   locale: string;
 }
@@ -170,9 +175,9 @@ export default function ScreenshotUploader({ locale }: ScreenshotUploaderProps)
     const file = event.target.files?.[0];
     if (file) {
       // Validate file type
-      const allowedTypes = ['image/png', 'image/jpeg', 'image/jpg', 'image/svg+xml'];
+      const allowedTypes = ['image/png', 'image/jpeg', 'image/jpg', 'image/webp', 'image/gif'];
       if (!allowedTypes.includes(file.type)) {
-        setError('Please select a PNG, JPG, or SVG file.');
+        setError('Please select a PNG, JPG, WebP, or GIF file.');
         return;
       }
 
@@ -260,6 +265,26 @@ export default function ScreenshotUploader({ locale }: ScreenshotUploaderProps)
     }
   };
 
+  // Poll the draft until the background job has finished with it
+  const pollDraftStatus = async (statusUrl: string): Promise<SectionDraft> => {
+    const deadline = Date.now() + DRAFT_POLL_TIMEOUT_MS;
+    while (true) {
+      const response = await fetch(statusUrl, { credentials: 'include' });
+      if (!response.ok) {
+        throw new Error(`Could not load draft status (${response.status})`);
+      }
+      const draft: SectionDraft = await response.json();
+      setUploadResult(draft);
+      if (draft.status === 'ready' || draft.status === 'error') {
+        return draft;
+      }
+      if (Date.now() >= deadline) {
+        throw new Error('AI processing is taking longer than expected. Check back later.');
+      }
+      await new Promise((resolve) => setTimeout(resolve, DRAFT_POLL_INTERVAL_MS));
+    }
+  };
+
   // Process with AI
   const handleAIProcess = async () => {
     if (!uploadResult) {
@@ -292,9 +317,13 @@ export default function ScreenshotUploader({ locale }: ScreenshotUploaderProps)
       console.log('[AI] Processing response headers:', Object.fromEntries(response.headers.entries()));
 
       if (response.ok) {
+        // 202: queued for the job worker; 200: answered from the cache.
+        // Either way the full draft comes from the status URL.
         const result = await response.json();
-        setUploadResult(result);
-        console.log('[AI] Processing completed successfully:', result);
+        console.log('[AI] Processing accepted:', result);
+        setUploadResult((current) => (current ? { ...current, status: result.status } : current));
+        const draft = await pollDraftStatus(result.status_url);
+        console.log('[AI] Processing finished:', draft.status);
       } else {
         let errorMessage = `Server error: ${response.status} ${response.statusText}`;
         try {
@@ -478,7 +507,7 @@ export default function ScreenshotUploader({ locale }: ScreenshotUploaderProps)
               <input
                 id="file-input"
                 type="file"
-                accept=".png,.jpg,.jpeg,.svg"
+                accept=".png,.jpg,.jpeg,.webp,.gif"
                 onChange={handleFileSelect}
                 className="hidden"
               />
@@ -501,7 +530,7 @@ export default function ScreenshotUploader({ locale }: ScreenshotUploaderProps)
                     <p className="text-lg font-medium text-gray-900">Drop your screenshot here</p>
                     <p className="text-sm text-gray-600">or click to browse files</p>
                     <p className="text-xs text-gray-500 mt-2">
-                      PNG, JPG, or SVG files up to 10MB
+                      PNG, JPG, WebP, or GIF files up to 10MB
                     </p>
                   </div>
                 </div>
@@ -622,7 +651,7 @@ export default function ScreenshotUploader({ locale }: ScreenshotUploaderProps)
             {uploadResult.status === 'error' && (
               <div className="mt-4 p-3 bg-red-50 border border-red-200 rounded">
                 <p className="text-sm text-red-700">
-                  <strong>Processing Error:</strong> AI analysis failed. Please try again or contact support.
+                  <strong>Processing Error:</strong> {uploadResult.error_message || 'AI analysis failed. Please try again or contact support.'}
                 </p>
                 <button
                   onClick={handleAIProcess}